@@ -0,0 +1,91 @@
+"""Benchmark right-hand-side throughput under different element orderings."""
+
+from __future__ import division
+
+__copyright__ = "Copyright (C) 2007 Andreas Kloeckner"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import numpy
+from time import time
+
+
+ORDERINGS = ["random", None, "cuthill", "rcm", "morton", "hilbert"]
+
+
+def bench_ordering(mesh, element_order, order, rhs_count):
+    """Return *(reorder time, node count, RHS evaluations per second)*."""
+    from hedge.backends import guess_run_context
+    from hedge.models.wave import StrongWaveOperator
+    from hedge.mesh import TAG_ALL, TAG_NONE
+    from hedge.tools import join_fields
+
+    rcon = guess_run_context()
+
+    start = time()
+    if element_order == "random":
+        mesh = mesh.reordered(numpy.random.permutation(len(mesh.elements)))
+    elif element_order is not None:
+        mesh = mesh.reordered_by(element_order)
+    reorder_time = time() - start
+
+    discr = rcon.make_discretization(mesh, order=order)
+
+    op = StrongWaveOperator(-1, discr.dimensions,
+            dirichlet_tag=TAG_NONE, neumann_tag=TAG_NONE,
+            radiation_tag=TAG_ALL, flux_type="upwind")
+    rhs = op.bind(discr)
+
+    fields = join_fields(
+            discr.interpolate_volume_function(
+                lambda x, el: numpy.exp(-numpy.dot(x, x))),
+            [discr.volume_zeros() for i in range(discr.dimensions)])
+
+    # warm up code generation
+    rhs(0, fields)
+
+    start = time()
+    for i in range(rhs_count):
+        rhs(0, fields)
+    elapsed = time() - start
+
+    return reorder_time, len(discr), rhs_count/elapsed
+
+
+def main(max_volumes=[1e-3, 2e-4], order=3, rhs_count=20):
+    from hedge.mesh.generator import make_box_mesh
+
+    print "%10s %10s %10s %12s %10s %14s" % (
+            "elements", "nodes", "ordering", "reorder [s]", "rhs/s",
+            "nodes*rhs/s")
+    for max_volume in max_volumes:
+        mesh = make_box_mesh(max_volume=max_volume)
+
+        for element_order in ORDERINGS:
+            reorder_time, node_count, rhs_rate = bench_ordering(
+                    mesh, element_order, order, rhs_count)
+            print "%10d %10d %10s %12.4f %10.2f %14.4g" % (
+                    len(mesh.elements), node_count, element_order,
+                    reorder_time, rhs_rate, node_count*rhs_rate)
+
+
+if __name__ == "__main__":
+    main()
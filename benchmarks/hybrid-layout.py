@@ -0,0 +1,133 @@
+"""Compare pure multi-process and hybrid process+thread layouts.
+
+At a fixed number of cores, time the right-hand side of the wave
+operator with one single-threaded rank per core and with fewer ranks
+running several threads each. By default, all layouts are run in turn
+on the shared-memory backend. With ``--mpi``, only the layout given by
+the MPI launcher and ``--threads`` is timed, e.g.::
+
+    mpirun -np 8 python hybrid-layout.py --mpi --threads=1
+    mpirun -np 2 python hybrid-layout.py --mpi --threads=4
+"""
+
+from __future__ import division
+
+__copyright__ = "Copyright (C) 2007 Andreas Kloeckner"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import numpy as np
+from time import time
+
+
+def time_rhs(rcon, max_volume, order, evaluations):
+    """Return the wall time per wave operator right-hand side evaluation
+    on this rank.
+    """
+    if rcon.is_head_rank:
+        from hedge.mesh.generator import make_box_mesh
+        mesh = make_box_mesh(max_volume=max_volume,
+                periodicity=(True, True, True))
+        mesh_data = rcon.distribute_mesh(mesh)
+    else:
+        mesh_data = rcon.receive_mesh()
+
+    discr = rcon.make_discretization(mesh_data, order=order)
+
+    from hedge.models.wave import StrongWaveOperator
+    op = StrongWaveOperator(1, discr.dimensions)
+
+    from hedge.tools import join_fields
+    fields = join_fields(*[np.random.randn(len(discr))
+        for i in range(discr.dimensions+1)])
+
+    rhs = op.bind(discr)
+
+    # compile and warm up
+    rhs(0, fields)
+    if rcon.communicator is not None:
+        rcon.communicator.Barrier()
+    elif len(rcon.ranks) > 1:
+        rcon.barrier()
+
+    start = time()
+    for i in range(evaluations):
+        rhs(0, fields)
+    return (time() - start)/evaluations
+
+
+def main():
+    from optparse import OptionParser
+    parser = OptionParser()
+    parser.add_option("--cores", type="int",
+            help="number of cores to use (default: all)")
+    parser.add_option("--max-volume", type="float", default=3e-4)
+    parser.add_option("--order", type="int", default=4)
+    parser.add_option("--evaluations", type="int", default=20)
+    parser.add_option("--mpi", action="store_true")
+    parser.add_option("--threads", type="int", default=1,
+            help="threads per rank with --mpi")
+    options, args = parser.parse_args()
+
+    if options.mpi:
+        from hedge.backends import guess_run_context
+        rcon = guess_run_context(["mpi"], thread_count=options.threads)
+
+        rhs_time = time_rhs(rcon, options.max_volume, options.order,
+                options.evaluations)
+
+        if rcon.communicator is not None:
+            import pytools.mpiwrap as mpi
+            rhs_time = rcon.communicator.allreduce(rhs_time, op=mpi.MAX)
+
+        if rcon.is_head_rank:
+            print "%d ranks x %d threads: %.3f ms/rhs" % (
+                    len(rcon.ranks), options.threads, 1e3*rhs_time)
+        return
+
+    core_count = options.cores
+    if core_count is None:
+        from multiprocessing import cpu_count
+        core_count = cpu_count()
+
+    from hedge.backends import CPURunContext
+    from hedge.backends.shm import run_with_processes
+
+    print "%d cores, order %d, max. element volume %g" % (
+            core_count, options.order, options.max_volume)
+    print "%8s %8s %16s" % ("ranks", "threads", "time/rhs [ms]")
+
+    for thread_count in range(1, core_count+1):
+        if core_count % thread_count:
+            continue
+
+        rank_count = core_count // thread_count
+        times = run_with_processes(time_rhs, rank_count,
+                args=(options.max_volume, options.order,
+                    options.evaluations),
+                serial_context=CPURunContext(thread_count=thread_count))
+
+        print "%8d %8d %16.3f" % (rank_count, thread_count, 1e3*max(times))
+
+
+if __name__ == "__main__":
+    main()
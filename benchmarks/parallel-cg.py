@@ -0,0 +1,137 @@
+"""Compare plain and pipelined conjugate gradients on a Poisson problem.
+
+Plain CG carries out two blocking global reductions per iteration,
+pipelined CG a single one that overlaps with the operator. Run this under
+MPI to see the difference in latency, e.g.::
+
+    mpirun -np 8 python parallel-cg.py --cells=12 --order=3
+"""
+
+from __future__ import division
+
+__copyright__ = "Copyright (C) 2007 Andreas Kloeckner"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import numpy as np
+from time import time
+
+
+def main():
+    from optparse import OptionParser
+    parser = OptionParser()
+    parser.add_option("--cells", type="int", default=8,
+            help="lattice cells along each axis of the unit cube")
+    parser.add_option("--order", type="int", default=3)
+    parser.add_option("--tol", type="float", default=1e-8)
+    parser.add_option("--max-iterations", type="int", default=5000)
+    options, args = parser.parse_args()
+
+    from hedge.backends import guess_run_context
+    rcon = guess_run_context(["mpi"])
+    comm = rcon.communicator
+
+    if rcon.is_head_rank:
+        from hedge.mesh.generator import make_regular_box_mesh
+        mesh = make_regular_box_mesh(n=(options.cells+1,)*3,
+                boundary_tagger=lambda fvi, el, fn, points: ["dirichlet"])
+        print "%d elements, order %d, %d ranks" % (
+                len(mesh.elements), options.order, len(rcon.ranks))
+        mesh_data = rcon.distribute_mesh(mesh)
+    else:
+        mesh_data = rcon.receive_mesh()
+
+    discr = rcon.make_discretization(mesh_data, order=options.order)
+
+    from hedge.models.poisson import PoissonOperator
+    from hedge.mesh import TAG_ALL, TAG_NONE
+    op = PoissonOperator(discr.dimensions,
+            dirichlet_tag=TAG_ALL, neumann_tag=TAG_NONE)
+    bound_op = op.bind(discr)
+
+    def rhs_c(x, el):
+        return np.sin(np.pi*x[0])*np.sin(np.pi*x[1])*np.sin(np.pi*x[2])
+
+    rhs = bound_op.prepare_rhs(discr.interpolate_volume_function(rhs_c))
+
+    reduction_counts = [0]
+
+    def global_dot(a, b):
+        reduction_counts[0] += 1
+        if comm is None:
+            return np.dot(a, b)
+        else:
+            return comm.allreduce(np.dot(a, b))
+
+    from hedge.iterative import CGStateContainer, PipelinedCGStateContainer
+
+    print_rank = rcon.is_head_rank
+    if print_rank:
+        print "%10s %10s %12s %14s %14s" % (
+                "method", "its", "time [s]", "t/it [ms]", "reductions/it")
+
+    solutions = {}
+    for pipelined in [False, True]:
+        # what hedge.iterative.parallel_cg does, keeping hold of the state
+        # to count reductions
+        reduction_counts[0] = 0
+        if pipelined:
+            cg = PipelinedCGStateContainer(-bound_op, dot=np.dot,
+                    communicator=comm)
+        else:
+            cg = CGStateContainer(-bound_op, dot=global_dot)
+
+        iterations = [0]
+
+        def count_iterations(what, it, *args):
+            iterations[0] = it + 1
+
+        if comm is not None:
+            comm.Barrier()
+        start = time()
+        cg.reset(rhs, discr.volume_zeros())
+        solutions[pipelined] = -cg.run(options.max_iterations, options.tol,
+                count_iterations)
+        elapsed = time() - start
+
+        if pipelined:
+            reduction_count = cg.reduction_count
+        else:
+            reduction_count = reduction_counts[0]
+
+        if comm is not None:
+            import pytools.mpiwrap as mpi
+            elapsed = comm.allreduce(elapsed, op=mpi.MAX)
+
+        if print_rank:
+            print "%10s %10d %12.3f %14.3f %14.2f" % (
+                    ["plain", "pipelined"][pipelined],
+                    iterations[0], elapsed, 1e3*elapsed/iterations[0],
+                    reduction_count/iterations[0])
+
+    difference = discr.norm(solutions[True] - solutions[False])
+    if print_rank:
+        print "difference between solutions: %g" % difference
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark construction of fully periodic box meshes."""
+
+from __future__ import division
+
+__copyright__ = "Copyright (C) 2007 Andreas Kloeckner"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import numpy
+from time import time
+
+
+def bench_vertex_matching(n):
+    """Match the vertices of two shuffled *n* x *n* face lattices."""
+    from hedge.mesh import find_matching_vertices_along_axis
+
+    lattice_1d = numpy.linspace(0, 1, n)
+    minus_points = numpy.array([(0, y, z)
+        for y in lattice_1d for z in lattice_1d])
+    perm = numpy.random.permutation(len(minus_points))
+    plus_points = minus_points[perm]
+    plus_points[:, 0] = 1
+
+    numbers = numpy.arange(len(minus_points))
+
+    start = time()
+    a_to_b, not_found = find_matching_vertices_along_axis(
+            0, minus_points, plus_points, numbers, numbers)
+    elapsed = time() - start
+
+    assert not not_found
+    return len(minus_points), elapsed
+
+
+def bench_box_mesh(max_volume):
+    from hedge.mesh import TAG_ALL
+    from hedge.mesh.generator import make_box_mesh
+
+    start = time()
+    mesh = make_box_mesh(max_volume=max_volume, periodicity=(True, True, True))
+    elapsed = time() - start
+
+    assert not mesh.tag_to_boundary[TAG_ALL]
+    periodic_face_count = 2*len(mesh.periodic_opposite_faces)
+    return len(mesh.elements), periodic_face_count, elapsed
+
+
+def main():
+    print "vertex matching:"
+    print "%12s %12s" % ("vertices", "time [s]")
+    for n in [10, 30, 100, 300]:
+        print "%12d %12.4f" % bench_vertex_matching(n)
+
+    print
+    print "periodic make_box_mesh:"
+    print "%12s %12s %12s" % ("elements", "per. faces", "time [s]")
+    for max_volume in [1e-3, 1e-4, 1e-5]:
+        try:
+            print "%12d %12d %12.4f" % bench_box_mesh(max_volume)
+        except ImportError:
+            print "meshpy not available, skipping"
+            break
+
+
+if __name__ == "__main__":
+    main()
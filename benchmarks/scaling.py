@@ -0,0 +1,363 @@
+"""Measure weak and strong scaling of the MPI backend.
+
+For each rank count in a sweep, this script launches itself under MPI,
+times a number of right-hand side evaluations of the wave, Maxwell or
+Euler operator on a periodic box mesh, and collects per-rank operator
+timers, communication counters and the time spent waiting for futures.
+The results are printed as scaling tables, e.g.::
+
+    python scaling.py --ranks=1,2,4,8 --model=maxwell
+    python scaling.py --ranks=1,2,4 --mode=weak --mpirun="mpiexec -n"
+
+For strong scaling, the mesh is the same for all rank counts. For weak
+scaling, it grows with the rank count, so that each rank keeps about the
+same number of elements.
+"""
+
+from __future__ import division
+
+__copyright__ = "Copyright (C) 2007 Andreas Kloeckner"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import numpy as np
+from time import time
+
+
+MODELS = ["wave", "maxwell", "euler"]
+
+# quantities added by the discretization's add_instrumentation
+COMPUTE_TIMERS = ["t_gather", "t_lift", "t_el_local", "t_diff",
+        "t_vector_math"]
+COUNTERS = ["n_comm_flux", "n_diff", "n_lift", "n_gather"]
+
+RESULT_MARKER = "SCALING-RESULT "
+
+
+# {{{ one run under MPI
+
+class QuantityCollector(object):
+    """Takes the place of a :class:`pytools.log.LogManager` in
+    :meth:`hedge.discretization.Discretization.add_instrumentation`, so
+    that the quantities can be read directly at the end of a run.
+    """
+
+    def __init__(self):
+        self.quantities = []
+
+    def add_quantity(self, quantity, interval=1):
+        self.quantities.append(quantity)
+
+    def get_values(self):
+        """Return a dictionary of the values of all quantities since the
+        previous call, and start counting anew.
+        """
+        from pytools.log import MultiLogQuantity, PostLogQuantity
+
+        result = {}
+        for quantity in self.quantities:
+            if isinstance(quantity, MultiLogQuantity):
+                result.update(zip(quantity.names, quantity()))
+            else:
+                result[quantity.name] = quantity()
+
+            # timers restart when read, counters when prepared
+            if isinstance(quantity, PostLogQuantity):
+                quantity.prepare_for_tick()
+
+        return result
+
+
+def get_rank_grid(rank_count):
+    """Return three factors of *rank_count* that are as close to each
+    other as possible.
+    """
+    factors = []
+    remaining = rank_count
+    divisor = 2
+    while remaining > 1:
+        while remaining % divisor == 0:
+            factors.append(divisor)
+            remaining //= divisor
+        divisor += 1
+
+    grid = [1, 1, 1]
+    for factor in sorted(factors, reverse=True):
+        grid[grid.index(min(grid))] *= factor
+    return tuple(sorted(grid, reverse=True))
+
+
+def make_mesh(mode, rank_count, cells):
+    from hedge.mesh.generator import make_regular_box_mesh
+
+    if mode == "weak":
+        grid = np.array(get_rank_grid(rank_count))
+    else:
+        grid = np.ones(3, dtype=np.int32)
+
+    return make_regular_box_mesh(b=tuple(grid), n=tuple(grid*cells + 1),
+            periodicity=(True, True, True))
+
+
+def make_rhs_and_fields(model, discr):
+    from hedge.tools import join_fields
+
+    def random_fields(count):
+        return join_fields(*[np.random.randn(len(discr))
+            for i in range(count)])
+
+    if model == "wave":
+        from hedge.models.wave import StrongWaveOperator
+        op = StrongWaveOperator(1, discr.dimensions)
+        return op.bind(discr), random_fields(discr.dimensions+1)
+
+    elif model == "maxwell":
+        from hedge.models.em import MaxwellOperator
+        op = MaxwellOperator(epsilon=1, mu=1, flux_type=1)
+        return op.bind(discr), random_fields(6)
+
+    elif model == "euler":
+        from hedge.models.gas_dynamics import (
+                GasDynamicsOperator, GammaLawEOS)
+        op = GasDynamicsOperator(dimensions=discr.dimensions,
+                equation_of_state=GammaLawEOS(1.4))
+        euler_rhs = op.bind(discr)
+
+        # a density wave at rest, so that the state stays physical
+        x = discr.nodes[:, 0]
+        rho = 1 + 0.1*np.sin(2*np.pi*x)
+        fields = join_fields(rho, 2.5 + discr.volume_zeros(),
+                *[discr.volume_zeros() for i in range(discr.dimensions)])
+
+        def rhs(t, q):
+            ode_rhs, speed = euler_rhs(t, q)
+            return ode_rhs
+
+        return rhs, fields
+
+    else:
+        raise ValueError("unknown model: %s" % model)
+
+
+def run(model, mode, cells, order, evaluations):
+    """Time *evaluations* right-hand sides of *model* on this rank and
+    print the collected per-rank data on the head rank.
+    """
+    from hedge.backends import guess_run_context
+    rcon = guess_run_context(["mpi"])
+    comm = rcon.communicator
+
+    if rcon.is_head_rank:
+        mesh = make_mesh(mode, len(rcon.ranks), cells)
+        element_count = len(mesh.elements)
+        mesh_data = rcon.distribute_mesh(mesh)
+    else:
+        element_count = None
+        mesh_data = rcon.receive_mesh()
+
+    discr = rcon.make_discretization(mesh_data, order=order)
+
+    # before binding, so that the compiled operator is instrumented
+    collector = QuantityCollector()
+    discr.add_instrumentation(collector)
+
+    rhs, fields = make_rhs_and_fields(model, discr)
+
+    # compile and settle on a static schedule
+    for i in range(3):
+        rhs(0, fields)
+    collector.get_values()
+    comm.Barrier()
+
+    start = time()
+    for i in range(evaluations):
+        rhs(0, fields)
+    elapsed = time() - start
+
+    values = collector.get_values()
+    values["t_rhs"] = elapsed
+    values["elements"] = len(discr.get_global_element_numbers())
+
+    all_values = comm.gather(values, root=rcon.head_rank)
+
+    if rcon.is_head_rank:
+        import json
+        print RESULT_MARKER + json.dumps({
+            "model": model,
+            "mode": mode,
+            "ranks": len(rcon.ranks),
+            "elements": element_count,
+            "evaluations": evaluations,
+            "per_rank": all_values,
+            })
+
+# }}}
+
+
+# {{{ sweep driver
+
+def launch(mpirun, rank_count, options):
+    import sys
+    import json
+    from subprocess import Popen, PIPE
+
+    cmdline = (mpirun.split() + [str(rank_count), sys.executable, __file__,
+        "--run", "--model=%s" % options.model, "--mode=%s" % options.mode,
+        "--cells=%d" % options.cells, "--order=%d" % options.order,
+        "--evaluations=%d" % options.evaluations])
+
+    proc = Popen(cmdline, stdout=PIPE)
+    stdout, _ = proc.communicate()
+    if proc.returncode:
+        raise RuntimeError("'%s' failed with status %d"
+                % (" ".join(cmdline), proc.returncode))
+
+    for line in stdout.split("\n"):
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+
+    raise RuntimeError("'%s' did not report a result" % " ".join(cmdline))
+
+
+def get_breakdown(result):
+    """Return a dictionary of per-evaluation times in seconds, as a
+    maximum across ranks, and of ranges of counters across ranks.
+    """
+    evaluations = result["evaluations"]
+    per_rank = result["per_rank"]
+
+    def rank_values(name):
+        return np.array([values.get(name, 0) for values in per_rank],
+                dtype=np.float64)
+
+    wall = rank_values("t_rhs")/evaluations
+    compute = sum(rank_values(name) for name in COMPUTE_TIMERS)/evaluations
+    wait = rank_values("t_future_wait")/evaluations
+
+    breakdown = {
+            "wall": wall.max(),
+            "compute": compute.max(),
+            "wait": wait.max(),
+            # time not spent in operators or waiting: mostly message
+            # setup, packing and scheduling
+            "other": np.maximum(wall - compute - wait, 0).max(),
+            "overlap_eff": rank_values("overlap_eff").min(),
+            "elements_per_rank": rank_values("elements"),
+            }
+    for name in COMPUTE_TIMERS:
+        breakdown[name] = (rank_values(name)/evaluations).max()
+    for name in COUNTERS:
+        counts = rank_values(name)/evaluations
+        breakdown[name] = (counts.min(), counts.max())
+
+    return breakdown
+
+
+def print_tables(results, mode):
+    base = get_breakdown(results[0])
+    base_ranks = results[0]["ranks"]
+
+    print "%6s %9s %9s %11s %6s | %9s %9s %9s %7s" % (
+            "ranks", "elements", "el/rank", "t/rhs [ms]", "eff.",
+            "compute", "wait", "other", "overlap")
+    for result in results:
+        breakdown = get_breakdown(result)
+        ranks = result["ranks"]
+
+        if mode == "strong":
+            efficiency = base["wall"]*base_ranks/(breakdown["wall"]*ranks)
+        else:
+            efficiency = base["wall"]/breakdown["wall"]
+
+        print "%6d %9d %9.0f %11.3f %6.2f | %8.1f%% %8.1f%% %8.1f%% %7.2f" % (
+                ranks, result["elements"],
+                breakdown["elements_per_rank"].mean(),
+                1e3*breakdown["wall"], efficiency,
+                100*breakdown["compute"]/breakdown["wall"],
+                100*breakdown["wait"]/breakdown["wall"],
+                100*breakdown["other"]/breakdown["wall"],
+                breakdown["overlap_eff"])
+
+    print
+    print "per-evaluation maxima across ranks [ms], counters as min-max:"
+    print "%6s " % "ranks" + " ".join(
+            "%13s" % name for name in COMPUTE_TIMERS + COUNTERS)
+    for result in results:
+        breakdown = get_breakdown(result)
+        print "%6d " % result["ranks"] + " ".join(
+                ["%13.3f" % (1e3*breakdown[name])
+                    for name in COMPUTE_TIMERS]
+                + ["%13s" % ("%g-%g" % breakdown[name])
+                    for name in COUNTERS])
+
+
+def main():
+    from optparse import OptionParser
+    parser = OptionParser()
+    parser.add_option("--ranks", default="1,2,4",
+            help="comma-separated rank counts to sweep")
+    parser.add_option("--model", default="wave",
+            help="one of %s" % ", ".join(MODELS))
+    parser.add_option("--mode", default="strong",
+            help="strong, weak or both")
+    parser.add_option("--cells", type="int", default=8,
+            help="lattice cells along each axis of the box (per unit of "
+            "the rank grid for weak scaling)")
+    parser.add_option("--order", type="int", default=3)
+    parser.add_option("--evaluations", type="int", default=20)
+    parser.add_option("--mpirun", default="mpirun -np",
+            help="launcher command, followed by the rank count")
+    parser.add_option("--run", action="store_true",
+            help="time a single run (used internally under MPI)")
+    options, args = parser.parse_args()
+
+    if options.model not in MODELS:
+        parser.error("unknown model: %s" % options.model)
+
+    if options.run:
+        run(options.model, options.mode, options.cells, options.order,
+                options.evaluations)
+        return
+
+    if options.mode == "both":
+        modes = ["strong", "weak"]
+    elif options.mode in ["strong", "weak"]:
+        modes = [options.mode]
+    else:
+        parser.error("unknown mode: %s" % options.mode)
+
+    rank_counts = [int(r) for r in options.ranks.split(",")]
+
+    for mode in modes:
+        options.mode = mode
+        results = [launch(options.mpirun, rank_count, options)
+                for rank_count in rank_counts]
+
+        print "%s scaling, %s, order %d" % (mode, options.model,
+                options.order)
+        print
+        print_tables(results, mode)
+        print
+
+
+if __name__ == "__main__":
+    main()
@@ -49,7 +49,8 @@ class RunContext(object):
     def is_head_rank(self):
         return self.rank == self.head_rank
 
-    def distribute_mesh(self, mesh, partition=None):
+    def distribute_mesh(self, mesh, partition=None, cache_dir=None,
+            element_weights=None):
         """Take the Mesh instance `mesh' and distribute it according to `partition'.
 
         If partition is an integer, invoke PyMetis to partition the mesh into this
@@ -62,6 +63,14 @@ class RunContext(object):
         rank. (A list or tuple of rank numbers will do, for example, or so will
         a full-blown dict.)
 
+        If element_weights is given, it is a sequence of the relative cost of
+        each element (see hedge.partition.estimate_element_costs), which PyMetis
+        balances across the parts instead of the element counts.
+
+        If cache_dir is given, parallel run contexts may store the partition
+        there and reuse it in later runs with the same mesh, number of ranks
+        and element weights.
+
         Returns a mesh chunk.
 
         We deliberately do not define the term `mesh chunk'. The return value
@@ -84,15 +93,49 @@ class RunContext(object):
 
         raise NotImplementedError
 
+    def read_mesh(self, filename):
+        """Read this rank's mesh chunk from the mesh file *filename*,
+        written by :func:`hedge.mesh.native.save_mesh`.
+
+        In parallel runs, the file must have been written with a
+        partition assigning a part to each rank, and each rank reads only
+        its own part.
+
+        This routine should be invoked on all ranks.
+        """
+        raise NotImplementedError
+
     def make_discretization(self, mesh_data, *args, **kwargs):
         """Construct a Discretization instance.
 
-        `mesh_data' is whatever gets returned from distribute_mesh and
-        receive_mesh(). Any extra arguments are directly forwarded to
+        `mesh_data' is whatever gets returned from distribute_mesh,
+        receive_mesh() or read_mesh(). Any extra arguments are directly forwarded to
         the respective Discretization constructor.
         """
         raise NotImplementedError
 
+    def alltoall(self, objects):
+        """Send the picklable object ``objects[i]`` to the rank *i*, for
+        each rank, and return the list of the objects received from each
+        rank, in order of rank.
+
+        This routine must be invoked on all ranks.
+        """
+        raise NotImplementedError
+
+    thread_count = 1
+
+    def get_thread_pool(self):
+        """Return a pool of :attr:`thread_count` threads on which this
+        rank may run element-local kernels concurrently, or *None* if only
+        one thread is to be used.
+
+        The pool is created on first use, so that in hybrid runs (one rank
+        per socket or node, several threads per rank) it is only started
+        once the ranks exist.
+        """
+        return None
+
 
 
 
@@ -105,6 +148,11 @@ class RunContext(object):
 class SerialRunContext(RunContext):
     communicator = None
 
+    def __init__(self, thread_count=1):
+        self.thread_count = thread_count
+        self._thread_pool = None
+        self._thread_pool_pid = None
+
     @property
     def rank(self):
         return 0
@@ -117,13 +165,34 @@ class SerialRunContext(RunContext):
     def head_rank(self):
         return 0
 
-    def distribute_mesh(self, mesh, partition=None):
+    def distribute_mesh(self, mesh, partition=None, cache_dir=None,
+            element_weights=None):
         return mesh
 
+    def read_mesh(self, filename):
+        from hedge.mesh.native import load_mesh
+        return load_mesh(filename)
+
     def make_discretization(self, mesh_data, *args, **kwargs):
         kwargs["run_context"] = self
         return self.discr_class(mesh_data, *args, **kwargs)
 
+    def alltoall(self, objects):
+        return list(objects)
+
+    def get_thread_pool(self):
+        if self.thread_count <= 1:
+            return None
+
+        # A pool inherited across fork() has no live worker threads.
+        from os import getpid
+        if self._thread_pool is None or self._thread_pool_pid != getpid():
+            from multiprocessing.pool import ThreadPool
+            self._thread_pool = ThreadPool(self.thread_count)
+            self._thread_pool_pid = getpid()
+
+        return self._thread_pool
+
 
 
 
@@ -191,31 +260,48 @@ def generate_features(allowed_features):
 
 
 
-def guess_run_context(allow=None):
-    if allow is None:
-        import sys
-
-        i = 1
-        while i < len(sys.argv):
-            arg = sys.argv[i]
-            if arg.startswith("--features="):
-                allow = arg[arg.index("=")+1:].split(",")
-                i += 1
-            elif arg == "-f" and i+1 < len(sys.argv):
-                allow = sys.argv[i+1].split(",")
-                i += 2
-            else:
-                i += 1
+def guess_run_context(allow=None, thread_count=None):
+    """Return a run context using the features in *allow*.
+
+    *thread_count* sets the number of threads each rank uses for its
+    element-local kernels. If *allow* or *thread_count* is *None*, it is
+    taken from the command line options ``--features=`` (or ``-f``) and
+    ``--threads=``, respectively.
+    """
+    import sys
 
+    cmdline_allow = None
+    cmdline_thread_count = 1
+
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg.startswith("--features="):
+            cmdline_allow = arg[arg.index("=")+1:].split(",")
+            i += 1
+        elif arg == "-f" and i+1 < len(sys.argv):
+            cmdline_allow = sys.argv[i+1].split(",")
+            i += 2
+        elif arg.startswith("--threads="):
+            cmdline_thread_count = int(arg[arg.index("=")+1:])
+            i += 1
+        else:
+            i += 1
+
+    if allow is None:
+        allow = cmdline_allow
         if allow is None:
             allow = []
 
+    if thread_count is None:
+        thread_count = cmdline_thread_count
+
     feat = list(generate_features(allow))
 
     if FEAT_CUDA in feat:
         serial_context = CUDARunContext()
     else:
-        serial_context = CPURunContext()
+        serial_context = CPURunContext(thread_count=thread_count)
 
     if FEAT_MPI in feat:
         from hedge.backends.mpi import MPIRunContext
@@ -311,7 +311,7 @@ class Discretization(hedge.discretization.Discretization):
             init_cuda=True, debug=set(),
             default_scalar_type=numpy.float32,
             tune_for=None, run_context=None,
-            mpi_cuda_dev_filter=lambda dev: True):
+            mpi_cuda_dev_filter=lambda dev: True, element_order=None):
         """
 
         :param tune_for: An optemplate for whose application this discretization's
@@ -337,7 +337,8 @@ class Discretization(hedge.discretization.Discretization):
         hedge.discretization.Discretization.__init__(self, mesh, ldis, debug=debug,
                 default_scalar_type=default_scalar_type,
                 quad_min_degrees=quad_min_degrees,
-                run_context=run_context)
+                run_context=run_context,
+                element_order=element_order)
         # }}}
 
         # {{{ cuda init
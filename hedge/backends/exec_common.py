@@ -62,6 +62,11 @@ class ExecutionMapperBase(hedge.optemplate.Evaluator,
             raise NotImplementedError("normal components on quad. grids")
         return self.discr.boundary_normals(expr.boundary_tag)[expr.axis]
 
+    def exec_reduction_batch_assign(self, insn):
+        return [(name, getattr(self, op.mapper_method)(op, field))
+                for name, op, field in zip(
+                    insn.names, insn.operators, insn.fields)], []
+
     def map_boundarize(self, op, field_expr):
         return self.discr.boundarize_volume_field(
                 self.rec(field_expr), tag=op.tag,
@@ -34,6 +34,50 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# {{{ intra-rank threading
+
+def run_on_element_chunks(discr, element_count, func, min_chunk_size=64):
+    """Call *func(start, stop)* on contiguous chunks of
+    ``range(element_count)``.
+
+    If the run context of *discr* has a thread pool, the chunks are
+    processed on it concurrently. *func* must then write disjoint parts
+    of its output for different chunks, and it only gains from the pool
+    if it releases the global interpreter lock while it runs.
+    """
+    rcon = discr.run_context
+    if rcon is None:
+        pool = None
+    else:
+        pool = rcon.get_thread_pool()
+
+    if pool is None:
+        chunk_count = 1
+    else:
+        chunk_count = min(rcon.thread_count, element_count // min_chunk_size)
+
+    if chunk_count <= 1:
+        func(0, element_count)
+        return
+
+    bounds = [element_count*i // chunk_count for i in range(chunk_count+1)]
+    pool.map(lambda chunk: func(*chunk), zip(bounds[:-1], bounds[1:]))
+
+
+def get_element_subranges(ers, start, stop):
+    """Return the elements *start* through *stop* (exclusive) of the
+    :class:`hedge._internal.UniformElementRanges` *ers*.
+    """
+    if start == 0 and stop == len(ers):
+        return ers
+
+    from hedge._internal import UniformElementRanges
+    return UniformElementRanges(
+            ers.start + start*ers.el_size, ers.el_size, stop-start)
+
+# }}}
+
+
 # {{{ exec mapper
 
 class ExecutionMapper(ExecutionMapperBase):
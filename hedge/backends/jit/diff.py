@@ -134,6 +134,8 @@ class JitDifferentiator:
         # }}}
 
         # {{{ computation
+            Block([
+            S("scoped_gil_release no_gil"),
             For("element_number_t eg_el_nr = 0",
                 "eg_el_nr < to_ers.size()",
                 "++eg_el_nr",
@@ -174,6 +176,7 @@ class JitDifferentiator:
                     ])
                 )
             ])
+            ])
         # }}}
 
         # {{{ compilation
@@ -183,7 +186,19 @@ class JitDifferentiator:
         #print mod.generate()
         #raw_input()
 
-        compiled_func = mod.compile(self.discr.toolchain).diff
+        compiled_kernel = mod.compile(self.discr.toolchain).diff
+
+        def compiled_func(from_ers, to_ers, *args):
+            from hedge.backends.jit import (
+                    run_on_element_chunks, get_element_subranges)
+
+            def diff_chunk(start, stop):
+                compiled_kernel(
+                        get_element_subranges(from_ers, start, stop),
+                        get_element_subranges(to_ers, start, stop),
+                        *args)
+
+            run_on_element_chunks(discr, len(to_ers), diff_chunk)
 
         if self.discr.instrumented:
             from hedge.tools import time_count_flop
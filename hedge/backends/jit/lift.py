@@ -86,7 +86,9 @@ class JitLifter:
                     Const(Reference(Value("face_group<face_pair<straight_face> >", "fg"))),
                     Value("ublas::matrix<uncomplex_type>", "matrix"),
                     Value("numpy_array<value_type>", "field"),
-                    Value("numpy_array<value_type>", "result")
+                    Value("numpy_array<value_type>", "result"),
+                    Value("unsigned", "fg_el_start"),
+                    Value("unsigned", "fg_el_stop"),
                     ]+if_(with_scale,
                         Const(Reference(Value("numpy_array<double>",
                             "elwise_post_scaling"))))
@@ -105,10 +107,12 @@ class JitLifter:
         fbody = Block([
             make_it("field"),
             make_it("result", is_const=False),
-            ]+if_(with_scale, make_it("elwise_post_scaling", tpname="double"))+[
+            ]+if_(with_scale, make_it("elwise_post_scaling", tpname="double"))
+            +if_(with_scale, S("elwise_post_scaling_it += fg_el_start"))+[
             Line(),
-            For("unsigned fg_el_nr = 0",
-                "fg_el_nr < fg.element_count()",
+            S("scoped_gil_release no_gil"),
+            For("unsigned fg_el_nr = fg_el_start",
+                "fg_el_nr < fg_el_stop",
                 "++fg_el_nr",
                 Block([
                     Initializer(
@@ -152,11 +156,19 @@ class JitLifter:
     def __call__(self, fgroup, matrix, scaling, field, out):
         from pytools import to_uncomplex_dtype
         uncomplex_dtype = to_uncomplex_dtype(field.dtype)
-        args = [fgroup, matrix.astype(uncomplex_dtype), field, out]
+        matrix = matrix.astype(uncomplex_dtype)
 
-        if scaling is not None:
-            args.append(scaling)
-
-        self.make_lift(fgroup,
+        lift = self.make_lift(fgroup,
                 scaling is not None,
-                field.dtype)(*args)
+                field.dtype)
+
+        def lift_chunk(start, stop):
+            args = [fgroup, matrix, field, out, start, stop]
+
+            if scaling is not None:
+                args.append(scaling)
+
+            lift(*args)
+
+        from hedge.backends.jit import run_on_element_chunks
+        run_on_element_chunks(self.discr, fgroup.element_count(), lift_chunk)
@@ -26,40 +26,20 @@ THE SOFTWARE.
 """
 
 
-import pytools
 import numpy
-import numpy.linalg as la
-import hedge.discretization
 import hedge.mesh
-from hedge.optemplate import \
-        IdentityMapper, \
-        FluxOpReducerMixin
 from hedge.tools.futures import Future
 from hedge.backends import RunContext
+from hedge.backends.parallel import (  # noqa
+        RankData, FluxCommunicationInserter,
+        ParallelDiscretizationBase, make_rank_data)
+from pytools import memoize_method
 import pytools.mpiwrap as mpi
-from pymbolic.mapper import CSECachingMapperMixin
-
-
-class RankData(pytools.Record):
-    def __init__(
-            self,
-            mesh,
-            global2local_elements,
-            global2local_vertex_indices,
-            neighbor_ranks,
-            global_periodic_opposite_faces,
-            old_el_numbers=None,
-            tag_to_elements=None
-            ):
-        pytools.Record.__init__(self, locals())
-
-    def reordered_by(self, *args, **kwargs):
-        old_el_numbers = self.mesh.get_reorder_oldnumbers(*args, **kwargs)
-        mesh = self.mesh.reordered(old_el_numbers)
-        return self.copy(
-                mesh=mesh,
-                old_el_numbers=old_el_numbers
-                )
+
+
+# rank-boundary values are exchanged with tag 1, neighbor connectivity
+# setup uses the tags from here on up
+_NEIGHBOR_SETUP_TAG = 2
 
 
 class MPIRunContext(RunContext):
@@ -79,53 +59,175 @@ class MPIRunContext(RunContext):
     def head_rank(self):
         return 0
 
-    def distribute_mesh(self, mesh, partition=None):
+    def distribute_mesh(self, mesh, partition=None, cache_dir=None,
+            element_weights=None):
+        """See :meth:`hedge.backends.RunContext.distribute_mesh`.
+
+        The head rank partitions *mesh* into
+        :class:`hedge.partition.PartitionArrays` and scatters them, so that
+        each rank builds its own part mesh. Non-head ranks must call
+        :meth:`receive_mesh` at the same time.
+
+        :param cache_dir: if given, a directory shared by all ranks that
+          holds a partition cache (see
+          :func:`hedge.partition.partition_mesh_to_cache`). If the cache
+          was written for *mesh* and the number of ranks, each rank loads
+          its part from it, and *partition* is ignored. Otherwise, the
+          cache is rewritten from the newly computed partition.
+        """
         assert self.is_head_rank
 
+        from hedge.partition import (get_mesh_digest,
+                partition_cache_matches)
+
+        use_cache = False
+        if cache_dir is not None:
+            mesh_digest = get_mesh_digest(mesh, element_weights)
+            use_cache = partition_cache_matches(
+                    cache_dir, mesh_digest, len(self.ranks))
+
+        # tell the other ranks where to load their parts from, if anywhere
+        self.communicator.bcast(cache_dir if use_cache else None,
+                root=self.head_rank)
+        if use_cache:
+            return self._load_partition_cache(cache_dir, mesh_digest)
+
         if partition is None:
             partition = len(self.ranks)
 
         # compute partition using Metis, if necessary
         if isinstance(partition, int):
-            from pymetis import part_graph
-            dummy, partition = part_graph(partition,
-                    mesh.element_adjacency_graph())
+            from hedge.partition import get_metis_partition
+            partition = get_metis_partition(mesh, partition,
+                    element_weights)
 
-        from hedge.partition import partition_mesh
-        from hedge.mesh import TAG_RANK_BOUNDARY
-        for part_data in partition_mesh(
-                mesh, partition, part_bdry_tag_factory=TAG_RANK_BOUNDARY):
-
-            rank_data = RankData(
-                    mesh=part_data.mesh,
-                    global2local_elements=part_data.global2local_elements,
-                    global2local_vertex_indices=part_data
-                            .global2local_vertex_indices,
-                    neighbor_ranks=part_data.neighbor_parts,
-                    global_periodic_opposite_faces=part_data
-                            .global_periodic_opposite_faces,
-                    tag_to_elements=part_data.tag_to_elements)
-
-            rank = part_data.part_nr
-
-            if rank == self.head_rank:
-                result = rank_data
-            else:
-                print "send rank", rank
-                self.communicator.send(rank_data, rank, 0)
-                print "end send", rank
+        from hedge.partition import get_partition_arrays
+        all_part_arrays = dict(
+                (part_arrays.part_nr, part_arrays)
+                for part_arrays in get_partition_arrays(mesh, partition))
 
-        return result
+        if cache_dir is not None:
+            from hedge.partition import save_partition_cache
+            save_partition_cache(cache_dir, mesh_digest, len(self.ranks),
+                    all_part_arrays.itervalues())
+
+        return self._scatter_partition_arrays(all_part_arrays)
 
     def receive_mesh(self):
-        return self.communicator.recv(source=self.head_rank, tag=0)
-        print "receive end rank", self.rank
+        cache_dir = self.communicator.bcast(None, root=self.head_rank)
+        if cache_dir is not None:
+            return self._load_partition_cache(cache_dir)
+        else:
+            return self._scatter_partition_arrays(None)
+
+    def _load_partition_cache(self, cache_dir, mesh_digest=None):
+        from hedge.partition import load_partition_cache
+        part_arrays = load_partition_cache(cache_dir, self.rank,
+                mesh_digest=mesh_digest, part_count=len(self.ranks))
+        if part_arrays is None:
+            return None
+        else:
+            return self._make_rank_data(part_arrays)
+
+    def _scatter_partition_arrays(self, all_part_arrays):
+        from hedge.partition import PartitionArrays
+
+        comm = self.communicator
+        is_head_rank = all_part_arrays is not None
+        if is_head_rank:
+            rank_part_arrays = [all_part_arrays.get(rank)
+                    for rank in self.ranks]
+        else:
+            rank_part_arrays = None
+
+        # tags, periodicity and array shapes are small enough to pickle
+        if is_head_rank:
+            infos = []
+            for part_arrays in rank_part_arrays:
+                if part_arrays is None:
+                    infos.append(None)
+                    continue
+
+                info = dict((name, getattr(part_arrays, name))
+                        for name in PartitionArrays.info_fields)
+                info["shapes"] = dict(
+                        (name, getattr(part_arrays, name).shape)
+                        for name, dtype in PartitionArrays.array_fields)
+                infos.append(info)
+        else:
+            infos = None
+
+        info = comm.scatter(infos, root=self.head_rank)
+
+        mpi_types = {
+                numpy.int64: mpi.INT64_T,
+                numpy.float64: mpi.DOUBLE,
+                }
+
+        arrays = {}
+        for name, dtype in PartitionArrays.array_fields:
+            mpi_type = mpi_types[dtype]
+
+            if info is None:
+                recv_buf = numpy.empty(0, dtype=dtype)
+            else:
+                recv_buf = numpy.empty(info["shapes"][name], dtype=dtype)
+
+            if is_head_rank:
+                rank_arrays = [
+                        numpy.empty(0, dtype=dtype) if part_arrays is None
+                        else numpy.asarray(getattr(part_arrays, name),
+                            dtype=dtype).ravel()
+                        for part_arrays in rank_part_arrays]
+                counts = [len(ary) for ary in rank_arrays]
+                displs = numpy.cumsum([0] + counts[:-1]).tolist()
+                send_spec = [numpy.hstack(rank_arrays), counts, displs,
+                        mpi_type]
+            else:
+                send_spec = None
+
+            comm.Scatterv(send_spec, [recv_buf, mpi_type],
+                    root=self.head_rank)
+            arrays[name] = recv_buf
+
+        if info is None:
+            return None
+
+        del info["shapes"]
+        arrays.update(info)
+        return self._make_rank_data(PartitionArrays(**arrays))
+
+    def read_mesh(self, filename):
+        """Read this rank's part of the mesh file *filename*, which must
+        have been written by :func:`hedge.mesh.native.save_mesh` with a
+        partition assigning part numbers to ranks. Each rank reads only its
+        own part of the file.
+
+        Global element numbers refer to the element order in the file.
+        May be called on all ranks.
+        """
+        from hedge.partition import get_partition_arrays_from_file
+        return self._make_rank_data(
+                get_partition_arrays_from_file(filename, self.rank))
+
+    def alltoall(self, objects):
+        return self.communicator.alltoall(objects)
+
+    def _make_rank_data(self, part_arrays):
+        return make_rank_data(part_arrays)
 
     def make_discretization(self, mesh_data, *args, **kwargs):
         return ParallelDiscretization(self,
                 self.serial_context.discr_class, mesh_data,
                 *args, **kwargs)
 
+    @property
+    def thread_count(self):
+        return self.serial_context.thread_count
+
+    def get_thread_pool(self):
+        return self.serial_context.get_thread_pool()
+
     def make_timer(self, name, description=None):
         return self.serial_context.make_timer(name, description)
 
@@ -239,416 +341,592 @@ class BoundaryConvertFuture(Future):
                 for idx, name in self.indices_and_names], []
 
 
-def make_custom_exec_mapper_class(superclass):
-    class ExecutionMapper(superclass):
-        def __init__(self, context, executor):
-            superclass.__init__(self, context, executor)
-            self.discr = executor.discr
+# {{{ packed halo exchange
 
-        def exec_flux_exchange_batch_assign(self, insn):
-            pdiscr = self.discr.parallel_discr
+class HaloExchange(object):
+    """Exchanges the values of *component_count* volume fields on the rank
+    boundaries of a :class:`ParallelDiscretization` with all neighbor
+    ranks.
 
-            from pytools.obj_array import make_obj_array
+    For each neighbor, all components travel in one contiguous buffer,
+    sent and received through persistent MPI requests. Buffers, requests
+    and the index maps for gathering and reordering boundary values are
+    set up once, so that an exchange neither allocates memory nor sets up
+    messages. Boundary fields returned by :meth:`unpack` are views into
+    buffers that are overwritten by the next exchange.
+    """
 
-            arg_fields = make_obj_array(
-                    [self.rec(fld) for fld in insn.arg_fields])
+    def __init__(self, pdiscr, component_count):
+        from hedge.mesh import TAG_RANK_BOUNDARY
 
-            if self.discr.instrumented:
-                pdiscr.comm_flux_counter.add(
-                        len(pdiscr.neighbor_ranks)*len(arg_fields))
-            return ([],
-                    [BoundarizeSendFuture(pdiscr, rank, arg_fields)
-                        for rank in pdiscr.neighbor_ranks]
-                    + [ReceiveCompletionFuture(pdiscr, arg_fields.shape, rank,
-                        insn.rank_to_index_and_name[rank])
-                        for rank in pdiscr.neighbor_ranks])
-
-        def map_nodal_sum(self, op, field_expr):
-            return self.discr.parallel_discr.context.communicator.allreduce(
-                    superclass.map_nodal_sum(self, op, field_expr),
-                    op=mpi.SUM)
-
-        def map_nodal_max(self, op, field_expr):
-            return self.discr.parallel_discr.context.communicator.allreduce(
-                    superclass.map_nodal_max(self, op, field_expr),
-                    op=mpi.MAX)
-
-        def map_nodal_min(self, op, field_expr):
-            return self.discr.parallel_discr.context.communicator.allreduce(
-                    superclass.map_nodal_min(self, op, field_expr),
-                    op=mpi.MIN)
-
-    return ExecutionMapper
-
-
-class FluxCommunicationInserter(
-        CSECachingMapperMixin,
-        IdentityMapper,
-        FluxOpReducerMixin):
-    def __init__(self, interacting_ranks):
-        self.interacting_ranks = interacting_ranks
-
-    map_common_subexpression_uncached = \
-            IdentityMapper.map_common_subexpression
-
-    def map_operator_binding(self, expr):
-        from hedge.optemplate import \
-                FluxOperatorBase, \
-                BoundaryPair, OperatorBinding, \
-                FluxExchangeOperator
-
-        if isinstance(expr, OperatorBinding):
-            if isinstance(expr.op, FluxOperatorBase):
-                if isinstance(expr.field, BoundaryPair):
-                    # we're only worried about internal fluxes
-                    return IdentityMapper.map_operator_binding(self, expr)
-
-                # by now we've narrowed it down to a bound interior flux
-
-                def func_on_scalar_or_vector(func, arg_fields):
-                    # No CSE necessary here--the compiler CSE's these
-                    # automatically.
-
-                    from hedge.tools import is_obj_array, make_obj_array
-                    if is_obj_array(arg_fields):
-                        # arg_fields (as an object array) isn't hashable
-                        # --make it so by turning it into a tuple
-                        arg_fields = tuple(arg_fields)
-
-                        return make_obj_array([
-                            func(i, arg_fields)
-                            for i in range(len(arg_fields))])
-                    else:
-                        return func(0, (arg_fields,))
-
-                from hedge.mesh import TAG_RANK_BOUNDARY
-
-                def exchange_and_cse(rank):
-                    return func_on_scalar_or_vector(
-                            lambda i, args: FluxExchangeOperator(i, rank, args),
-                            expr.field)
-
-                from pymbolic.primitives import flattened_sum
-                return flattened_sum([expr]
-                    + [OperatorBinding(expr.op, BoundaryPair(
-                        expr.field,
-                        exchange_and_cse(rank),
-                        TAG_RANK_BOUNDARY(rank)))
-                        for rank in self.interacting_ranks])
+        comm = pdiscr.context.communicator
+        dtype = pdiscr.default_scalar_type
+        mpi_type = pdiscr.mpi_scalar_type
+
+        self.send_indices = {}
+        self.from_neighbor_maps = {}
+        self.send_buffers = {}
+        self.recv_buffers = {}
+        self.result_buffers = {}
+        self.send_requests = {}
+        self.recv_requests = {}
+
+        for rank in pdiscr.neighbor_ranks:
+            bdry = pdiscr.get_boundary(TAG_RANK_BOUNDARY(rank))
+            shape = (component_count, len(bdry.nodes))
+
+            self.send_indices[rank] = numpy.asarray(
+                    bdry.vol_indices, dtype=numpy.intp)
+            self.from_neighbor_maps[rank] = numpy.asarray(
+                    pdiscr.from_neighbor_maps[rank], dtype=numpy.intp)
+
+            self.send_buffers[rank] = send_buf = numpy.empty(shape, dtype)
+            self.recv_buffers[rank] = recv_buf = numpy.empty(shape, dtype)
+            self.result_buffers[rank] = numpy.empty(shape, dtype)
+
+            self.send_requests[rank] = comm.Send_init(
+                    [send_buf, mpi_type], rank, tag=1)
+            self.recv_requests[rank] = comm.Recv_init(
+                    [recv_buf, mpi_type], source=rank, tag=1)
+
+    def pack(self, rank, fields):
+        """Gather the values of the volume fields *fields* on the boundary
+        with *rank* into its send buffer.
+        """
+        send_buf = self.send_buffers[rank]
+        send_indices = self.send_indices[rank]
+
+        for i, field in enumerate(fields):
+            if isinstance(field, numpy.ndarray):
+                # mode="clip" lets numpy write into out without a temporary
+                numpy.take(field, send_indices, out=send_buf[i], mode="clip")
             else:
-                return IdentityMapper.map_operator_binding(self, expr)
+                # a scalar, will be broadcast
+                send_buf[i] = field
 
+    def unpack(self, rank, indices_and_names):
+        """Reorder the values received from *rank* to match the local
+        boundary nodes and return a list of *(name, boundary field)*
+        tuples.
+        """
+        result = self.result_buffers[rank]
+        numpy.take(self.recv_buffers[rank], self.from_neighbor_maps[rank],
+                axis=1, out=result, mode="clip")
+        return [(name, result[idx]) for idx, name in indices_and_names]
 
-class ParallelDiscretization(hedge.discretization.TimestepCalculator):
-    @classmethod
-    def my_debug_flags(cls):
-        return set([
-            "parallel_setup",
-            ])
 
-    @classmethod
-    def all_debug_flags(cls, subcls):
-        return cls.my_debug_flags() | subcls.all_debug_flags()
+class PackedSendFuture(MPICompletionFuture):
+    def __init__(self, exchange, rank, fields):
+        exchange.pack(rank, fields)
 
-    def __init__(self, rcon, subdiscr_class, rank_data, *args, **kwargs):
-        debug = set(kwargs.pop("debug", set()))
-        self.debug = self.my_debug_flags() & debug
-        kwargs["debug"] = debug - self.debug
-        kwargs["run_context"] = rcon
-
-        self.subdiscr = subdiscr_class(rank_data.mesh, *args, **kwargs)
-        self.subdiscr.exec_mapper_class = make_custom_exec_mapper_class(
-                self.subdiscr.exec_mapper_class)
-        self.subdiscr.parallel_discr = self
-
-        self.received_bdrys = {}
-        self.context = rcon
-
-        self.global2local_vertex_indices = rank_data.global2local_vertex_indices
-        self.neighbor_ranks = rank_data.neighbor_ranks
-        self.global_periodic_opposite_faces = \
-                rank_data.global_periodic_opposite_faces
-
-        if rank_data.old_el_numbers is not None:
-            from hedge.tools import reverse_lookup_table
-            new_el_numbers = reverse_lookup_table(rank_data.old_el_numbers)
-            self.global2local_elements = dict(
-                    (gi, new_el_numbers[li])
-                    for gi, li in rank_data.global2local_elements.iteritems())
+        request = exchange.send_requests[rank]
+        request.Start()
+        MPICompletionFuture.__init__(self, request)
+
+    def finish(self, status):
+        return [], []
+
+
+class PackedReceiveFuture(MPICompletionFuture):
+    def __init__(self, exchange, rank, indices_and_names):
+        self.exchange = exchange
+        self.rank = rank
+        self.indices_and_names = indices_and_names
+
+        request = exchange.recv_requests[rank]
+        request.Start()
+        MPICompletionFuture.__init__(self, request)
+
+    def finish(self, status):
+        return self.exchange.unpack(self.rank, self.indices_and_names), []
+
+# }}}
+
+
+# {{{ batched reductions
+
+_REDUCTION_DATATYPES = {}
+_SUM_MAX_OPS = {}
+
+
+def _get_reduction_datatype(count):
+    try:
+        return _REDUCTION_DATATYPES[count]
+    except KeyError:
+        result = mpi.DOUBLE.Create_contiguous(count)
+        result.Commit()
+        _REDUCTION_DATATYPES[count] = result
+        return result
+
+
+def _get_sum_max_op(sum_count):
+    try:
+        return _SUM_MAX_OPS[sum_count]
+    except KeyError:
+        def sum_max(in_buf, inout_buf, datatype):
+            a = numpy.frombuffer(in_buf, dtype=numpy.float64)
+            b = numpy.frombuffer(inout_buf, dtype=numpy.float64)
+            b[:sum_count] += a[:sum_count]
+            numpy.maximum(b[sum_count:], a[sum_count:], b[sum_count:])
+
+        result = mpi.Op.Create(sum_max, commute=True)
+        _SUM_MAX_OPS[sum_count] = result
+        return result
+
+
+class ReductionBatch(object):
+    """Carries out the nodal reductions *operators* of the rank-local
+    partial results *local_values* across all ranks in a single allreduce.
+
+    The partial results are packed into one vector, sums first. Minima
+    are negated, so that they can be combined along with the maxima. If a
+    batch contains both sums and maxima, the vector is sent as a single
+    element of a contiguous datatype, so that the combining operation
+    always sees all of it.
+    """
+
+    def __init__(self, operators, local_values):
+        from hedge.optemplate.operators import NodalSum, NodalMax, NodalMin
+
+        def indices_of(op_class):
+            return [i for i, op in enumerate(operators)
+                    if isinstance(op, op_class)]
+
+        sum_indices = indices_of(NodalSum)
+        max_indices = indices_of(NodalMax)
+        min_indices = indices_of(NodalMin)
+        self.order = sum_indices + max_indices + min_indices
+        assert len(self.order) == len(operators)
+
+        self.sum_count = len(sum_indices)
+        self.negated_start = len(sum_indices) + len(max_indices)
+
+        values = [local_values[i] for i in self.order]
+        if any(numpy.iscomplexobj(v) for v in values):
+            if self.sum_count < len(values):
+                raise ValueError(
+                        "cannot take maxima or minima of complex values")
+            dtype, mpi_type = numpy.complex128, mpi.DOUBLE_COMPLEX
+        else:
+            dtype, mpi_type = numpy.float64, mpi.DOUBLE
+
+        self.send_buf = numpy.array(values, dtype=dtype)
+        self.send_buf[self.negated_start:] *= -1
+        self.recv_buf = numpy.empty_like(self.send_buf)
+
+        count = len(self.send_buf)
+        if self.sum_count == count:
+            self.mpi_op = mpi.SUM
+        elif self.sum_count == 0:
+            self.mpi_op = mpi.MAX
         else:
-            self.global2local_elements = rank_data.global2local_elements
+            self.mpi_op = _get_sum_max_op(self.sum_count)
+            mpi_type = _get_reduction_datatype(count)
+            count = 1
+
+        self.send_spec = [self.send_buf, count, mpi_type]
+        self.recv_spec = [self.recv_buf, count, mpi_type]
+
+    def start(self, comm):
+        """Start the reduction and return its request."""
+        return comm.Iallreduce(self.send_spec, self.recv_spec, op=self.mpi_op)
+
+    def run(self, comm):
+        comm.Allreduce(self.send_spec, self.recv_spec, op=self.mpi_op)
+
+    def get_results(self):
+        """Return the reduced values, in the order of the *operators* passed
+        to the constructor.
+        """
+        reduced = self.recv_buf.copy()
+        reduced[self.negated_start:] *= -1
+
+        result = [None]*len(self.order)
+        for i, value in zip(self.order, reduced):
+            result[i] = value
+        return result
+
 
-        self._setup_neighbor_connections()
+class ReductionFuture(MPICompletionFuture):
+    def __init__(self, comm, names, batch):
+        self.names = names
+        self.batch = batch
+        MPICompletionFuture.__init__(self, batch.start(comm))
+
+    def finish(self, status):
+        return zip(self.names, self.batch.get_results()), []
+
+# }}}
+
+
+class ParallelDiscretization(ParallelDiscretizationBase):
+    """A :class:`hedge.backends.parallel.ParallelDiscretizationBase` that
+    communicates through MPI.
+    """
+
+    def __init__(self, rcon, subdiscr_class, rank_data, *args, **kwargs):
+        ParallelDiscretizationBase.__init__(self,
+                rcon, subdiscr_class, rank_data, *args, **kwargs)
 
         self.mpi_scalar_type = {
                 numpy.float64: mpi.DOUBLE,
                 numpy.float32: mpi.FLOAT,
                 }[self.default_scalar_type]
 
-    def add_instrumentation(self, mgr):
-        self.subdiscr.add_instrumentation(mgr)
+        self._halo_exchanges = {}
 
-        from pytools.log import EventCounter
-        self.comm_flux_counter = EventCounter("n_comm_flux",
-                "Number of inner flux communication runs")
+    def _exchange_with_neighbors(self, packets):
+        comm = self.context.communicator
 
-        mgr.add_quantity(self.comm_flux_counter)
+        received_packets = dict(
+                (rank, [numpy.empty_like(ary) for ary in packet])
+                for rank, packet in packets.iteritems())
 
-    # property forwards -------------------------------------------------------
-    def __len__(self):
-        return len(self.subdiscr)
+        # All receives are targeted and use their own tags, so MPI's
+        # non-overtaking rule keeps them apart from other traffic.
+        requests = []
+        for rank, packet in packets.iteritems():
+            for i, (send_ary, recv_ary) in enumerate(
+                    zip(packet, received_packets[rank])):
+                requests.append(comm.Irecv(recv_ary,
+                    source=rank, tag=_NEIGHBOR_SETUP_TAG+i))
+                requests.append(comm.Isend(send_ary,
+                    rank, tag=_NEIGHBOR_SETUP_TAG+i))
 
-    def __getattr__(self, name):
-        if not name.startswith("_"):
-            return getattr(self.subdiscr, name)
-        else:
-            raise AttributeError(name)
+        mpi.Request.Waitall(requests)
 
-    # {{{ neighbor connectivity
+        return received_packets
 
-    def _setup_neighbor_connections(self):
+    def start_flux_exchange(self, insn, arg_fields):
+        if self.compute_kind == "numpy":
+            exchange = self.get_halo_exchange(insn)
+
+            # post receives before sends, so that messages do not
+            # have to be buffered on arrival
+            return ([PackedReceiveFuture(exchange, rank,
+                        insn.rank_to_index_and_name[rank])
+                        for rank in self.neighbor_ranks]
+                    + [PackedSendFuture(exchange, rank, arg_fields)
+                        for rank in self.neighbor_ranks])
+
+        return ([BoundarizeSendFuture(self, rank, arg_fields)
+                    for rank in self.neighbor_ranks]
+                + [ReceiveCompletionFuture(self, arg_fields.shape, rank,
+                    insn.rank_to_index_and_name[rank])
+                    for rank in self.neighbor_ranks])
+
+    def get_halo_exchange(self, insn):
+        """Return the :class:`HaloExchange` for the
+        :class:`hedge.compiler.FluxExchangeBatchAssign` instruction *insn*,
+        creating it on first use. Instructions do not share buffers, since
+        the results of several exchanges may be in use at the same time.
+        """
+        try:
+            return self._halo_exchanges[id(insn)][1]
+        except KeyError:
+            exchange = HaloExchange(self, len(insn.arg_fields))
+            # keep insn alive, so that its id is not reused
+            self._halo_exchanges[id(insn)] = insn, exchange
+            return exchange
+
+    def reduce_values(self, operators, local_values):
+        batch = ReductionBatch(operators, local_values)
+        batch.run(self.context.communicator)
+        return batch.get_results()
+
+    def start_reductions(self, names, operators, local_values):
+        comm = self.context.communicator
+        if hasattr(comm, "Iallreduce"):
+            # let independent instructions run while the reduction
+            # is in flight
+            return [], [ReductionFuture(comm, names,
+                ReductionBatch(operators, local_values))]
+        else:
+            return ParallelDiscretizationBase.start_reductions(
+                    self, names, operators, local_values)
+
+    # {{{ gathering volume fields
+
+    @memoize_method
+    def get_volume_gather_layout(self):
+        """Return a tuple *(node_counts, element_numbers, element_starts)*
+        of integer arrays on the head rank, and *None* on all other ranks.
+        *node_counts* gives the length of the volume vectors on each rank.
+        The other two give the global number and first node of the
+        elements on all ranks, each rank's in the order of
+        :meth:`hedge.discretization.Discretization.volume_element_layout`,
+        with the nodes numbered across the volume vectors of all ranks,
+        one after the other.
+
+        Must be called on all ranks.
+        """
         comm = self.context.communicator
+        head_rank = self.context.head_rank
 
-        # Why is this barrier needed? Some of our ranks may arrive at this
-        # point early and start sending packets to ranks that are still stuck
-        # in previous wildcard-recv loops. These receivers will then be very
-        # confused by packets they didn't expect, and, once they reach their
-        # recv bit in *this* subroutine, will wait for packets that will never
-        # arrive. This same argument does not apply to other recv()s in this
-        # file because they are targeted and thus benefit from MPI's
-        # non-overtaking rule.
-        #
-        # Parallel programming is fun.
-        comm.Barrier()
-
-        if self.neighbor_ranks:
-            # send interface information to neighboring ranks -----------------
-            from pytools import reverse_dictionary
-            local2global_vertex_indices = \
-                    reverse_dictionary(self.global2local_vertex_indices)
-
-            send_requests = []
-
-            for rank in self.neighbor_ranks:
-                bdry_tag = hedge.mesh.TAG_RANK_BOUNDARY(rank)
-                rank_bdry = self.subdiscr.mesh.tag_to_boundary[bdry_tag]
-                rank_discr_boundary = self.subdiscr.get_boundary(bdry_tag)
-
-                # a list of global vertex numbers for each face
-                my_vertices_global = [
-                        tuple(local2global_vertex_indices[vi]
-                            for vi in el.faces[face_nr])
-                        for el, face_nr in rank_bdry]
-
-                # a list of node coordinates, indicating the order
-                # in which nodal values will be sent, this is for
-                # testing only and could (potentially) be omitted
-
-                my_node_coords = []
-                for el, face_nr in rank_bdry:
-                    eslice, ldis = self.subdiscr.find_el_data(el.id)
-                    findices = ldis.face_indices()[face_nr]
-
-                    my_node_coords.append(
-                            [self.nodes[eslice.start+i] for i in findices])
-
-                # compile a list of FluxFace.h values for unification
-                # across the rank boundary
-
-                my_h_values = [rank_discr_boundary.find_facepair_side(el_face).h
-                        for el_face in rank_bdry]
-
-                packet = (my_vertices_global, my_node_coords, my_h_values)
-
-                send_requests.append(comm.isend(packet, dest=rank, tag=0))
-
-            received_packets = {}
-            while len(received_packets) < len(self.neighbor_ranks):
-                status = mpi.Status()
-                received_packet = comm.recv(
-                        tag=0, source=mpi.ANY_SOURCE, status=status)
-                received_packets[status.source] = received_packet
-
-            mpi.Request.Waitall(send_requests)
-
-            # process received packets ----------------------------------------
-            from pytools import flatten
-
-            # nb_ stands for neighbor_
-
-            self.from_neighbor_maps = {}
-
-            for rank, (nb_all_facevertices_global, nb_node_coords, nb_h_values) in \
-                    received_packets.iteritems():
-                bdry_tag = hedge.mesh.TAG_RANK_BOUNDARY(rank)
-                rank_bdry = self.subdiscr.mesh.tag_to_boundary[bdry_tag]
-                rank_discr_boundary = self.subdiscr.get_boundary(bdry_tag)
-
-                flat_nb_node_coords = list(flatten(nb_node_coords))
-
-                # step 1: find start node indices for each
-                # of the neighbor's elements
-                nb_face_starts = [0]
-                for node_coords in nb_node_coords[:-1]:
-                    nb_face_starts.append(
-                            nb_face_starts[-1]+len(node_coords))
-
-                # step 2: match faces by matching vertices
-                nb_face_order = dict(
-                        (frozenset(vertices), i)
-                        for i, vertices in enumerate(nb_all_facevertices_global))
-
-                # step 3: make a list of indices into the data we
-                # receive from our neighbor that'll tell us how
-                # to reshuffle them to match our node order
-                from_indices = []
-
-                shuffled_indices_cache = {}
-
-                def get_shuffled_indices(face_node_count, shuffle_op):
-                    try:
-                        return shuffled_indices_cache[shuffle_op]
-                    except KeyError:
-                        unshuffled_indices = range(face_node_count)
-                        result = shuffled_indices_cache[shuffle_op] = \
-                                shuffle_op(unshuffled_indices)
-                        return result
-
-                for el, face_nr in rank_bdry:
-                    eslice, ldis = self.subdiscr.find_el_data(el.id)
-
-                    my_vertices = el.faces[face_nr]
-                    my_global_vertices = tuple(local2global_vertex_indices[vi]
-                            for vi in my_vertices)
-
-                    face_node_count = ldis.face_node_count()
-                    try:
-                        nb_face_idx = nb_face_order[frozenset(my_global_vertices)]
-                        # continue below in else part
-                    except KeyError:
-                        # this happens if my_global_vertices is not a permutation
-                        # of the neighbor's face vertices. Periodicity is the only
-                        # reason why that would be so.
-                        my_vertices_there, axis = \
-                                self.global_periodic_opposite_faces[
-                                        my_global_vertices]
-                        nb_face_idx = nb_face_order[frozenset(my_vertices_there)]
-
-                        his_vertices_here, axis2 = \
-                                self.global_periodic_opposite_faces[
-                                        nb_all_facevertices_global[nb_face_idx]]
-
-                        assert axis == axis2
-
-                        nb_face_start = nb_face_starts[nb_face_idx]
-
-                        shuffle_op = \
-                                ldis.get_face_index_shuffle_to_match(
-                                        my_global_vertices,
-                                        his_vertices_here)
-
-                        shuffled_other_node_indices = [nb_face_start+i
-                                for i in get_shuffled_indices(
-                                    face_node_count, shuffle_op)]
-
-                        from_indices.extend(shuffled_other_node_indices)
-
-                        # check if the nodes really match up
-                        if "parallel_setup" in self.debug:
-                            my_node_indices = [
-                                    eslice.start+i
-                                    for i in ldis.face_indices()[face_nr]]
-
-                            for my_i, other_i in zip(
-                                    my_node_indices, shuffled_other_node_indices):
-                                dist = self.nodes[my_i]-flat_nb_node_coords[other_i]
-                                dist[axis] = 0
-                                assert la.norm(dist) < 1e-14
-                    else:
-                        # continue handling of nonperiodic case
-                        nb_global_vertices = nb_all_facevertices_global[nb_face_idx]
-
-                        nb_face_start = nb_face_starts[nb_face_idx]
-
-                        shuffle_op = \
-                                ldis.get_face_index_shuffle_to_match(
-                                        my_global_vertices,
-                                        nb_global_vertices)
-
-                        shuffled_other_node_indices = [nb_face_start+i
-                                for i in get_shuffled_indices(
-                                    face_node_count, shuffle_op)]
-
-                        from_indices.extend(shuffled_other_node_indices)
-
-                        # check if the nodes really match up
-                        if "parallel_setup" in self.debug:
-                            my_node_indices = [eslice.start+i
-                                    for i in ldis.face_indices()[face_nr]]
-
-                            for my_i, other_i in zip(
-                                    my_node_indices, shuffled_other_node_indices):
-                                dist = self.nodes[my_i]-flat_nb_node_coords[other_i]
-                                assert la.norm(dist) < 1e-14
-
-                    # finally, unify FluxFace.h values across boundary
-                    nb_h = nb_h_values[nb_face_idx]
-                    flux_face = rank_discr_boundary.find_facepair_side((el, face_nr))
-                    flux_face.h = max(nb_h, flux_face.h)
-
-                if "parallel_setup" in self.debug:
-                    assert len(from_indices) == len(flat_nb_node_coords)
-
-                # construct from_neighbor_map
-                self.from_neighbor_maps[rank] = \
-                        self.subdiscr.prepare_from_neighbor_map(from_indices)
+        el_ids, starts, stops = self.volume_element_layout()
+        counts = comm.gather((len(el_ids), len(self)), root=head_rank)
 
-    # }}}
+        el_info = numpy.empty((len(el_ids), 2), dtype=numpy.int64)
+        el_info[:, 0] = self.get_global_element_numbers()[el_ids]
+        el_info[:, 1] = starts
+
+        if not self.context.is_head_rank:
+            comm.Gatherv(el_info, None, root=head_rank)
+            return None
+
+        el_counts, node_counts = numpy.array(counts, dtype=numpy.int64).T
+        el_displs = numpy.cumsum(el_counts) - el_counts
+        node_displs = numpy.cumsum(node_counts) - node_counts
+
+        all_el_info = numpy.empty((el_counts.sum(), 2), dtype=numpy.int64)
+        comm.Gatherv(el_info, [all_el_info, (2*el_counts, 2*el_displs)],
+                root=head_rank)
 
-    # dt estimation -----------------------------------------------------------
-    def dt_non_geometric_factor(self):
-        return self.context.communicator.allreduce(
-                self.subdiscr.dt_non_geometric_factor(),
-                op=mpi.MIN)
+        return (node_counts, all_el_info[:, 0],
+                all_el_info[:, 1] + numpy.repeat(node_displs, el_counts))
 
-    def dt_geometric_factor(self):
-        return self.context.communicator.allreduce(
-                self.subdiscr.dt_geometric_factor(),
-                op=mpi.MIN)
+    @memoize_method
+    def get_reassembly_node_indices(self, global_discr):
+        """Return a tuple *(from_nodes, to_nodes)* of index arrays, such
+        that the entries *from_nodes* of the concatenated volume vectors of
+        all ranks belong at *to_nodes* in a volume vector of
+        *global_discr*, a serial discretization of the whole mesh.
+
+        Only available on the head rank.
+        """
+        node_counts, el_numbers, el_starts = self.get_volume_gather_layout()
+
+        g_el_ids, g_starts, g_stops = global_discr.volume_element_layout()
+        global_starts = numpy.empty(len(global_discr.mesh.elements),
+                dtype=numpy.intp)
+        global_starts[g_el_ids] = g_starts
+        global_sizes = numpy.empty_like(global_starts)
+        global_sizes[g_el_ids] = g_stops - g_starts
+
+        from hedge.tools.indexing import expand_ranges
+        sizes = global_sizes[el_numbers]
+        _, from_nodes = expand_ranges(el_starts, el_starts + sizes)
+        to_starts = global_starts[el_numbers]
+        _, to_nodes = expand_ranges(to_starts, to_starts + sizes)
+
+        return from_nodes, to_nodes
+
+    # }}}
 
-    # compilation -------------------------------------------------------------
-    def compile(self, optemplate, post_bind_mapper=lambda x: x, type_hints={}):
-        fci = FluxCommunicationInserter(self.neighbor_ranks)
-        return self.subdiscr.compile(
-                optemplate,
-                post_bind_mapper=lambda x: fci(post_bind_mapper(x)),
-                type_hints=type_hints)
 
 
 def reassemble_volume_field(rcon, global_discr, local_discr, field):
-    from pytools import reverse_dictionary
-    local2global_element = reverse_dictionary(
-            local_discr.global2local_elements)
+    """Return the volume vector *field* of the :class:`ParallelDiscretization`
+    *local_discr* on the head rank, with its values ordered as for
+    *global_discr*, a serial discretization of the whole mesh. Return *None*
+    on all other ranks.
+
+    The parts of *field* are collected with one ``Gatherv`` and put in place
+    through an index map computed on first use. Must be called on all ranks.
+    *global_discr* is only used on the head rank.
+    """
+    comm = rcon.communicator
+    field = numpy.ascontiguousarray(field)
+
+    layout = local_discr.get_volume_gather_layout()
+
+    if not rcon.is_head_rank:
+        comm.Gatherv(field, None, root=rcon.head_rank)
+        return None
 
-    send_packet = {}
-    for eg in local_discr.element_groups:
-        for el, eslice in zip(eg.members, eg.ranges):
-            send_packet[local2global_element[el.id]] = field[eslice]
+    node_counts = layout[0]
+    gathered = numpy.empty(node_counts.sum(), dtype=field.dtype)
+    comm.Gatherv(field,
+            [gathered, (node_counts, numpy.cumsum(node_counts) - node_counts)],
+            root=rcon.head_rank)
 
-    def reduction(a, b):
-        a.update(b)
-        return a
+    from_nodes, to_nodes = local_discr.get_reassembly_node_indices(
+            global_discr)
 
-    gfield_parts = rcon.communicator.reduce(
-            send_packet, root=rcon.head_rank, op=reduction)
+    result = global_discr.volume_zeros(dtype=field.dtype)
+    result[to_nodes] = gathered[from_nodes]
+    return result
 
-    if rcon.is_head_rank:
-        result = global_discr.volume_zeros()
-        for eg in global_discr.element_groups:
-            for el, eslice in zip(eg.members, eg.ranges):
-                my_part = gfield_parts[el.id]
-                assert len(my_part) == eslice.stop-eslice.start
-                result[eslice] = my_part
-        return result
+
+
+
+def write_volume_field(rcon, local_discr, field, filename):
+    """Write the volume vector *field* of the :class:`ParallelDiscretization`
+    *local_discr*, or an object array of them, to *filename* in the format
+    of :func:`hedge.mesh.native.save_volume_field`.
+
+    Each rank writes its own part into the file at an offset computed from
+    the sizes of the parts on all ranks, using collective MPI-IO, so that
+    the field never passes through the head rank. Must be called on all
+    ranks. Read the file with :func:`hedge.mesh.native.load_volume_field`.
+    """
+    from pytools.obj_array import log_shape
+    from hedge.mesh.native import get_volume_field_file_layout
+
+    comm = rcon.communicator
+
+    field_shape = log_shape(field)
+    components = [field[idx] for idx in numpy.ndindex(*field_shape)]
+    dtype = numpy.result_type(*components)
+
+    el_ids, starts, stops = local_discr.volume_element_layout()
+
+    counts = numpy.array(comm.allgather((len(el_ids), len(local_discr))),
+            dtype=numpy.int64)
+    el_count, node_count = counts.sum(axis=0)
+    el_displ, node_displ = (numpy.cumsum(counts, axis=0) - counts)[rcon.rank]
+
+    prefix, data_start, array_info, data_size = \
+            get_volume_field_file_layout(
+                    el_count, node_count, field_shape, dtype)
+
+    fh = mpi.File.Open(comm, filename, mpi.MODE_WRONLY | mpi.MODE_CREATE)
+
+    def write(name, index, ary):
+        fh.Write_at_all(
+                int(data_start + array_info[name]["offset"]
+                    + index*ary.itemsize),
+                ary)
+
+    try:
+        fh.Set_size(int(data_start + data_size))
+
+        if rcon.is_head_rank:
+            fh.Write_at(0, numpy.frombuffer(prefix, dtype=numpy.uint8))
+
+        write("element_numbers", el_displ, numpy.asarray(
+            local_discr.get_global_element_numbers()[el_ids],
+            dtype=numpy.int64))
+        write("element_starts", el_displ,
+                numpy.asarray(starts + node_displ, dtype=numpy.int64))
+
+        for i, component in enumerate(components):
+            write("field", i*node_count + node_displ,
+                    numpy.ascontiguousarray(component, dtype=dtype))
+    finally:
+        fh.Close()
+
+
+
+
+# {{{ load rebalancing
+
+def get_load_imbalance(rcon, rank_time):
+    """Return the imbalance of the times *rank_time* measured on each rank,
+    i.e. by how much the largest exceeds the average, as a fraction of the
+    average. Must be called on all ranks.
+    """
+    times = numpy.array(rcon.communicator.allgather(rank_time),
+            dtype=numpy.float64)
+    mean_time = times.mean()
+    if mean_time == 0:
+        return 0
     else:
+        return times.max()/mean_time - 1
+
+
+def gather_element_values(rcon, local_discr, values, element_count=None):
+    """Return an array of the per-element *values* of all ranks on the head
+    rank, indexed by global element number, and *None* on all other ranks.
+    *values* is indexed by the element ids of *local_discr*.
+
+    *element_count*, the number of elements in the global mesh, is only
+    used on the head rank. Elements not present on any rank get zero.
+    Must be called on all ranks.
+    """
+    comm = rcon.communicator
+    head_rank = rcon.head_rank
+
+    el_numbers = numpy.asarray(local_discr.get_global_element_numbers(),
+            dtype=numpy.int64)
+    values = numpy.ascontiguousarray(values, dtype=numpy.float64)
+    assert values.shape == el_numbers.shape
+
+    counts = comm.gather(len(el_numbers), root=head_rank)
+
+    if not rcon.is_head_rank:
+        comm.Gatherv(el_numbers, None, root=head_rank)
+        comm.Gatherv(values, None, root=head_rank)
         return None
+
+    counts = numpy.array(counts, dtype=numpy.int64)
+    displs = numpy.cumsum(counts) - counts
+
+    all_el_numbers = numpy.empty(counts.sum(), dtype=numpy.int64)
+    all_values = numpy.empty(counts.sum(), dtype=numpy.float64)
+    comm.Gatherv(el_numbers, [all_el_numbers, (counts, displs)],
+            root=head_rank)
+    comm.Gatherv(values, [all_values, (counts, displs)], root=head_rank)
+
+    result = numpy.zeros(element_count, dtype=numpy.float64)
+    result[all_el_numbers] = all_values
+    return result
+
+
+def rebalance(rcon, mesh, local_discr, fields, rank_time,
+        checkpoint_filename, make_discretization, element_costs=None,
+        imbalance_threshold=0.1):
+    """Repartition *mesh* and redistribute the volume vector *fields* (or
+    an object array of them) of *local_discr* if the measured rank
+    imbalance (see :func:`get_load_imbalance`) exceeds
+    *imbalance_threshold*. Must be called on all ranks.
+
+    Each rank's *rank_time*, e.g. the time spent computing right-hand
+    sides since the last call (not counting waits for communication), is
+    spread over its elements in proportion to *element_costs*, an array
+    indexed by the element ids of *local_discr*. By default, each element
+    costs the same. Elements whose cost changes over time, such as those
+    where an artificial viscosity sensor is active, should be given
+    correspondingly larger costs. The head rank repartitions *mesh* with
+    these estimates as element weights.
+
+    *fields* are checkpointed to *checkpoint_filename* by
+    :func:`write_volume_field` and read back by each rank for its new
+    part, so the file must be visible to all ranks. *mesh* is only used
+    on the head rank.
+
+    :param make_discretization: a function taking the mesh chunk of a
+      rank and returning its new :class:`ParallelDiscretization`,
+      typically by calling :meth:`MPIRunContext.make_discretization`.
+    :returns: *None* if the load was balanced well enough. Otherwise, a
+      tuple *(discr, fields)* of the new discretization and the fields
+      on it. Operators bound to *local_discr* need to be bound anew.
+    """
+    if get_load_imbalance(rcon, rank_time) <= imbalance_threshold:
+        return None
+
+    if element_costs is None:
+        element_costs = numpy.ones(
+                len(local_discr.get_global_element_numbers()),
+                dtype=numpy.float64)
+    else:
+        element_costs = numpy.asarray(element_costs, dtype=numpy.float64)
+
+    total_cost = element_costs.sum()
+    if total_cost:
+        element_times = element_costs * (rank_time / total_cost)
+    else:
+        element_times = element_costs
+
+    element_weights = gather_element_values(rcon, local_discr,
+            element_times, len(mesh.elements) if rcon.is_head_rank else None)
+
+    write_volume_field(rcon, local_discr, fields, checkpoint_filename)
+    rcon.communicator.Barrier()
+
+    if rcon.is_head_rank:
+        from hedge.partition import get_metis_partition
+        mesh_data = rcon.distribute_mesh(mesh, get_metis_partition(
+            mesh, len(rcon.ranks), element_weights))
+    else:
+        mesh_data = rcon.receive_mesh()
+
+    discr = make_discretization(mesh_data)
+
+    from hedge.mesh.native import load_volume_field
+    fields = load_volume_field(checkpoint_filename, discr,
+            element_numbers=discr.get_global_element_numbers())
+
+    return discr, fields
+
+# }}}
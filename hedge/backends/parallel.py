@@ -0,0 +1,734 @@
+"""Distributed-memory parallelism support independent of the means of
+communication"""
+
+from __future__ import division
+
+__copyright__ = "Copyright (C) 2007 Andreas Kloeckner"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import numpy
+import hedge.discretization
+import hedge.mesh
+from hedge.optemplate import \
+        IdentityMapper, \
+        FluxOpReducerMixin
+from pytools import Record, memoize_method
+from pymbolic.mapper import CSECachingMapperMixin
+from contextlib import contextmanager
+
+
+# {{{ rank data
+
+class RankData(Record):
+    def __init__(
+            self,
+            mesh,
+            global2local_elements,
+            global2local_vertex_indices,
+            neighbor_ranks,
+            global_periodic_opposite_faces,
+            old_el_numbers=None,
+            tag_to_elements=None
+            ):
+        Record.__init__(self, locals())
+
+    def reordered_by(self, *args, **kwargs):
+        old_el_numbers = self.mesh.get_reorder_oldnumbers(*args, **kwargs)
+        mesh = self.mesh.reordered(old_el_numbers)
+        if self.old_el_numbers is not None:
+            # compose with the previous reordering
+            old_el_numbers = [self.old_el_numbers[i] for i in old_el_numbers]
+        return self.copy(
+                mesh=mesh,
+                old_el_numbers=old_el_numbers
+                )
+
+    def refined_uniformly(self, rcon, levels=1):
+        """Return a copy of *self* in which the local mesh is refined as by
+        :func:`hedge.mesh.refine_uniformly`, without access to the global
+        mesh. Must be called on all ranks of the run context *rcon*.
+
+        Child *k* of global element *i* obtains the global number
+        :math:`2^d i+k`, which agrees with the numbering in the globally
+        refined mesh. Existing vertices keep their global numbers, and the
+        ranks agree on consecutive numbers for the edge midpoints
+        following them. The global vertex numbers therefore stay
+        contiguous if they were, but differ from those of the globally
+        refined mesh.
+        """
+        from hedge.mesh import (_refine_uniformly_once,
+                _get_refined_simplex_vertices)
+
+        mesh = self.mesh
+        global2local_elements = self.global2local_elements
+        if self.old_el_numbers is not None:
+            # fold the reordering into the element map
+            from hedge.tools import reverse_lookup_table
+            new_el_numbers = reverse_lookup_table(self.old_el_numbers)
+            global2local_elements = dict(
+                    (gi, new_el_numbers[li])
+                    for gi, li in global2local_elements.iteritems())
+
+        global2local_vertex_indices = self.global2local_vertex_indices
+        global_periodic_opposite_faces = self.global_periodic_opposite_faces
+
+        from itertools import permutations
+
+        for level in range(levels):
+            local2global_vertex_indices = numpy.empty(
+                    len(global2local_vertex_indices), dtype=numpy.int64)
+            local2global_vertex_indices[
+                    global2local_vertex_indices.values()] = \
+                            global2local_vertex_indices.keys()
+
+            coarse_mesh = mesh
+            mesh, edge_vertices = _refine_uniformly_once(mesh)
+            child_count = 2**mesh.dimensions
+
+            midpoint_numbers, shared_midpoint_numbers = \
+                    _number_edge_midpoints(rcon, coarse_mesh,
+                            local2global_vertex_indices, edge_vertices,
+                            global_periodic_opposite_faces)
+
+            local2global_vertex_indices = numpy.hstack([
+                local2global_vertex_indices, midpoint_numbers])
+            global2local_vertex_indices = dict(
+                    (gvi, lvi) for lvi, gvi in enumerate(
+                        local2global_vertex_indices.tolist()))
+
+            global2local_elements = dict(
+                    (child_count*gi + k, child_count*li + k)
+                    for gi, li in global2local_elements.iteritems()
+                    for k in range(child_count))
+
+            def global_midpoint(gvi_a, gvi_b):
+                return shared_midpoint_numbers[min(gvi_a, gvi_b),
+                        max(gvi_a, gvi_b)]
+
+            # Faces are looked up with their vertices in element order,
+            # which is unknown for faces on other ranks. Enter all orders.
+            new_periodic_opposite_faces = {}
+            seen_faces = set()
+            for face, (opposite, axis) in \
+                    global_periodic_opposite_faces.iteritems():
+                if frozenset(face) in seen_faces:
+                    continue
+                seen_faces.add(frozenset(face))
+
+                for child, opp_child in zip(
+                        _get_refined_simplex_vertices(face, global_midpoint),
+                        _get_refined_simplex_vertices(
+                            opposite, global_midpoint)):
+                    for perm in permutations(range(len(child))):
+                        new_periodic_opposite_faces[
+                                tuple(child[i] for i in perm)] = (
+                                        tuple(opp_child[i] for i in perm), axis)
+            global_periodic_opposite_faces = new_periodic_opposite_faces
+
+        return self.copy(
+                mesh=mesh,
+                global2local_elements=global2local_elements,
+                global2local_vertex_indices=global2local_vertex_indices,
+                global_periodic_opposite_faces=global_periodic_opposite_faces,
+                old_el_numbers=None,
+                tag_to_elements=mesh.tag_to_elements)
+
+
+def _number_edge_midpoints(rcon, mesh, local2global_vertex_indices,
+        edge_vertices, global_periodic_opposite_faces):
+    """Agree with all other ranks of *rcon* on global vertex numbers for the
+    midpoints of the edges of the local *mesh*, given as rows of local
+    vertex numbers in *edge_vertices*. Return a tuple
+    *(midpoint_numbers, shared_midpoint_numbers)*, where the first is an
+    array with the numbers of the midpoints in the order of
+    *edge_vertices*. The second maps pairs of ascending global vertex
+    numbers to the number of the midpoint between them, for all edges
+    that may also be present on other ranks.
+
+    Such edges are those on rank boundaries and on periodic faces,
+    including the periodic faces opposite those of *mesh*. Each of them is
+    numbered by a rank derived from its vertex numbers, which collects
+    the requests of all ranks. Midpoints of these edges are numbered
+    first, following the existing vertices, in the order of the ranks
+    numbering them, then those of the remaining edges, which only occur
+    on a single rank, in order of their rank.
+    """
+    from itertools import combinations
+    from hedge.mesh import TAG_RANK_BOUNDARY
+    from hedge.tools.indexing import find_matching_rows
+
+    l2g = local2global_vertex_indices
+    rank_count = len(rcon.ranks)
+
+    shared_edges = set()
+    for tag, el_faces in mesh.tag_to_boundary.iteritems():
+        if isinstance(tag, TAG_RANK_BOUNDARY):
+            for el, face_nr in el_faces:
+                shared_edges.update(combinations(
+                    sorted(l2g[list(el.faces[face_nr])].tolist()), 2))
+    for face, (opposite, axis) in global_periodic_opposite_faces.iteritems():
+        shared_edges.update(combinations(sorted(face), 2))
+        shared_edges.update(combinations(sorted(opposite), 2))
+    shared_edges = sorted(shared_edges)
+
+    global_edges = numpy.sort(l2g[edge_vertices], axis=1)
+    shared_edge_indices = find_matching_rows(global_edges,
+            numpy.array(shared_edges, dtype=numpy.int64).reshape(-1, 2))
+    is_shared = shared_edge_indices >= 0
+    interior_count = len(global_edges) - numpy.sum(is_shared)
+
+    # {{{ send shared edges to the ranks numbering them
+
+    requests = [[] for rank in range(rank_count)]
+    for edge in shared_edges:
+        requests[sum(edge) % rank_count].append(edge)
+
+    if len(l2g):
+        vertex_bound = int(l2g.max()) + 1
+    else:
+        vertex_bound = 0
+
+    received = rcon.alltoall([
+        (vertex_bound, interior_count, request) for request in requests])
+
+    vertex_count = max(vb for vb, ic, request in received)
+    interior_counts = [ic for vb, ic, request in received]
+
+    owned_edges = sorted(set(
+        edge for vb, ic, request in received for edge in request))
+    owned_edge_indices = dict(
+            (edge, i) for i, edge in enumerate(owned_edges))
+
+    replies = rcon.alltoall([
+        (len(owned_edges), [owned_edge_indices[edge] for edge in request])
+        for vb, ic, request in received])
+
+    # }}}
+
+    owned_counts = numpy.array([oc for oc, indices in replies],
+            dtype=numpy.int64)
+    owned_starts = vertex_count + numpy.cumsum(owned_counts) - owned_counts
+
+    shared_midpoint_numbers = {}
+    for rank, (oc, indices) in enumerate(replies):
+        for edge, index in zip(requests[rank], indices):
+            shared_midpoint_numbers[edge] = int(owned_starts[rank] + index)
+
+    interior_start = (vertex_count + owned_counts.sum()
+            + sum(interior_counts[:rcon.rank]))
+
+    midpoint_numbers = numpy.empty(len(global_edges), dtype=numpy.int64)
+    midpoint_numbers[~is_shared] = interior_start + numpy.arange(
+            interior_count, dtype=numpy.int64)
+    midpoint_numbers[is_shared] = numpy.array(
+            [shared_midpoint_numbers[edge] for edge in shared_edges],
+            dtype=numpy.int64)[shared_edge_indices[is_shared]]
+
+    return midpoint_numbers, shared_midpoint_numbers
+
+
+def make_rank_data(part_arrays):
+    """Return the :class:`RankData` for the part described by the
+    :class:`hedge.partition.PartitionArrays` *part_arrays*.
+    """
+    from hedge.partition import make_partition_data
+    from hedge.mesh import TAG_RANK_BOUNDARY
+    part_data = make_partition_data(part_arrays,
+            part_bdry_tag_factory=TAG_RANK_BOUNDARY)
+
+    return RankData(
+            mesh=part_data.mesh,
+            global2local_elements=part_data.global2local_elements,
+            global2local_vertex_indices=part_data
+                    .global2local_vertex_indices,
+            neighbor_ranks=part_data.neighbor_parts,
+            global_periodic_opposite_faces=part_data
+                    .global_periodic_opposite_faces,
+            tag_to_elements=part_data.tag_to_elements)
+
+# }}}
+
+
+# {{{ operator compilation and execution
+
+def make_custom_exec_mapper_class(superclass):
+    class ExecutionMapper(superclass):
+        def __init__(self, context, executor):
+            superclass.__init__(self, context, executor)
+            self.discr = executor.discr
+
+        def exec_flux_exchange_batch_assign(self, insn):
+            pdiscr = self.discr.parallel_discr
+
+            from pytools.obj_array import make_obj_array
+
+            arg_fields = make_obj_array(
+                    [self.rec(fld) for fld in insn.arg_fields])
+
+            if self.discr.instrumented:
+                pdiscr.comm_flux_counter.add(
+                        len(pdiscr.neighbor_ranks)*len(arg_fields))
+
+            return [], pdiscr.start_flux_exchange(insn, arg_fields)
+
+        def exec_reduction_batch_assign(self, insn):
+            pdiscr = self.discr.parallel_discr
+            if pdiscr.reductions_are_local:
+                return superclass.exec_reduction_batch_assign(self, insn)
+
+            local_values = [
+                    getattr(superclass, op.mapper_method)(self, op, field)
+                    for op, field in zip(insn.operators, insn.fields)]
+            return pdiscr.start_reductions(
+                    insn.names, insn.operators, local_values)
+
+        def map_nodal_sum(self, op, field_expr):
+            return self.discr.parallel_discr.reduce(op,
+                    superclass.map_nodal_sum(self, op, field_expr))
+
+        def map_nodal_max(self, op, field_expr):
+            return self.discr.parallel_discr.reduce(op,
+                    superclass.map_nodal_max(self, op, field_expr))
+
+        def map_nodal_min(self, op, field_expr):
+            return self.discr.parallel_discr.reduce(op,
+                    superclass.map_nodal_min(self, op, field_expr))
+
+    return ExecutionMapper
+
+
+class FluxCommunicationInserter(
+        CSECachingMapperMixin,
+        IdentityMapper,
+        FluxOpReducerMixin):
+    def __init__(self, interacting_ranks):
+        self.interacting_ranks = interacting_ranks
+
+    map_common_subexpression_uncached = \
+            IdentityMapper.map_common_subexpression
+
+    def map_operator_binding(self, expr):
+        from hedge.optemplate import \
+                FluxOperatorBase, \
+                BoundaryPair, OperatorBinding, \
+                FluxExchangeOperator
+
+        if isinstance(expr, OperatorBinding):
+            if isinstance(expr.op, FluxOperatorBase):
+                if isinstance(expr.field, BoundaryPair):
+                    # we're only worried about internal fluxes
+                    return IdentityMapper.map_operator_binding(self, expr)
+
+                # by now we've narrowed it down to a bound interior flux
+
+                def func_on_scalar_or_vector(func, arg_fields):
+                    # No CSE necessary here--the compiler CSE's these
+                    # automatically.
+
+                    from hedge.tools import is_obj_array, make_obj_array
+                    if is_obj_array(arg_fields):
+                        # arg_fields (as an object array) isn't hashable
+                        # --make it so by turning it into a tuple
+                        arg_fields = tuple(arg_fields)
+
+                        return make_obj_array([
+                            func(i, arg_fields)
+                            for i in range(len(arg_fields))])
+                    else:
+                        return func(0, (arg_fields,))
+
+                from hedge.mesh import TAG_RANK_BOUNDARY
+
+                def exchange_and_cse(rank):
+                    return func_on_scalar_or_vector(
+                            lambda i, args: FluxExchangeOperator(i, rank, args),
+                            expr.field)
+
+                from pymbolic.primitives import flattened_sum
+                return flattened_sum([expr]
+                    + [OperatorBinding(expr.op, BoundaryPair(
+                        expr.field,
+                        exchange_and_cse(rank),
+                        TAG_RANK_BOUNDARY(rank)))
+                        for rank in self.interacting_ranks])
+            else:
+                return IdentityMapper.map_operator_binding(self, expr)
+
+# }}}
+
+
+# {{{ parallel discretization
+
+class ParallelDiscretizationBase(hedge.discretization.TimestepCalculator):
+    """A discretization of one rank's part of a mesh that is distributed
+    across several ranks, each of which owns a serial discretization
+    :attr:`subdiscr`, to which all unknown attributes are forwarded.
+
+    Subclasses supply the communication, by implementing
+    :meth:`_exchange_with_neighbors`, :meth:`start_flux_exchange` and
+    :meth:`reduce_values`.
+    """
+
+    @classmethod
+    def my_debug_flags(cls):
+        return set([
+            "parallel_setup",
+            ])
+
+    @classmethod
+    def all_debug_flags(cls, subcls):
+        return cls.my_debug_flags() | subcls.all_debug_flags()
+
+    def __init__(self, rcon, subdiscr_class, rank_data, *args, **kwargs):
+        debug = set(kwargs.pop("debug", set()))
+        self.debug = self.my_debug_flags() & debug
+        kwargs["debug"] = debug - self.debug
+        kwargs["run_context"] = rcon
+
+        # reorder here, so that the element numbers below are adjusted
+        element_order = kwargs.pop("element_order", None)
+        if element_order is not None:
+            rank_data = rank_data.reordered_by(element_order)
+
+        self.subdiscr = subdiscr_class(rank_data.mesh, *args, **kwargs)
+        self.subdiscr.exec_mapper_class = make_custom_exec_mapper_class(
+                self.subdiscr.exec_mapper_class)
+        self.subdiscr.parallel_discr = self
+
+        self.received_bdrys = {}
+        self.context = rcon
+
+        self.global2local_vertex_indices = rank_data.global2local_vertex_indices
+        self.neighbor_ranks = rank_data.neighbor_ranks
+        self.global_periodic_opposite_faces = \
+                rank_data.global_periodic_opposite_faces
+
+        if rank_data.old_el_numbers is not None:
+            from hedge.tools import reverse_lookup_table
+            new_el_numbers = reverse_lookup_table(rank_data.old_el_numbers)
+            self.global2local_elements = dict(
+                    (gi, new_el_numbers[li])
+                    for gi, li in rank_data.global2local_elements.iteritems())
+        else:
+            self.global2local_elements = rank_data.global2local_elements
+
+        self._setup_neighbor_connections()
+
+        self.reductions_are_local = False
+
+        # compiled code, for instrumentation
+        from weakref import WeakSet
+        self.compiled_codes = WeakSet()
+
+    def add_instrumentation(self, mgr):
+        self.subdiscr.add_instrumentation(mgr)
+
+        from pytools.log import EventCounter
+        self.comm_flux_counter = EventCounter("n_comm_flux",
+                "Number of inner flux communication runs")
+
+        mgr.add_quantity(self.comm_flux_counter)
+
+        from hedge.log import OverlapEfficiency, FutureWaitTime
+        mgr.add_quantity(OverlapEfficiency(self.compiled_codes))
+        mgr.add_quantity(FutureWaitTime(self.compiled_codes))
+
+    # property forwards -------------------------------------------------------
+    def __len__(self):
+        return len(self.subdiscr)
+
+    def __getattr__(self, name):
+        if not name.startswith("_"):
+            return getattr(self.subdiscr, name)
+        else:
+            raise AttributeError(name)
+
+    @memoize_method
+    def get_global_element_numbers(self):
+        """Return an integer array mapping the element ids of
+        :attr:`subdiscr` to the numbers of the elements in the global mesh.
+        """
+        global2local = self.global2local_elements
+        result = numpy.empty(len(global2local), dtype=numpy.intp)
+        result[global2local.values()] = global2local.keys()
+        return result
+
+    # {{{ neighbor connectivity
+
+    def _exchange_with_neighbors(self, packets):
+        """Send each value of the dictionary *packets*, a list of
+        :mod:`numpy` arrays, to the neighbor rank given by its key, and
+        return a dictionary mapping each neighbor rank to the list of arrays
+        received from it. Called on all ranks at the same time.
+
+        Since the faces on either side of a rank boundary match up, each
+        received array has the same shape and dtype as the corresponding
+        one sent to that rank.
+        """
+        raise NotImplementedError
+
+    def _setup_neighbor_connections(self):
+        """Exchange the global vertex numbers and h-values of the faces on
+        each rank boundary, match up the faces and compute
+        :attr:`from_neighbor_maps`.
+
+        With the ``parallel_setup`` debug flag, node coordinates are
+        exchanged as well, to verify the resulting node order.
+        """
+        global2local = self.global2local_vertex_indices
+        local2global_vertex_indices = numpy.empty(
+                len(global2local), dtype=numpy.intp)
+        local2global_vertex_indices[global2local.values()] = \
+                global2local.keys()
+
+        check_nodes = "parallel_setup" in self.debug
+
+        from hedge.tools.indexing import find_matching_rows
+
+        # send interface information to neighboring ranks ---------------------
+        face_vertices = {}
+        packets = {}
+        for rank in self.neighbor_ranks:
+            bdry_tag = hedge.mesh.TAG_RANK_BOUNDARY(rank)
+            rank_bdry = self.subdiscr.mesh.tag_to_boundary[bdry_tag]
+            rank_discr_boundary = self.subdiscr.get_boundary(bdry_tag)
+
+            # global vertex numbers, one row per face
+            face_vertices[rank] = local2global_vertex_indices[numpy.array(
+                [el.faces[face_nr] for el, face_nr in rank_bdry],
+                dtype=numpy.intp)]
+
+            # FluxFace.h values, for unification across the rank boundary
+            h_values = numpy.array(
+                    [rank_discr_boundary.find_facepair_side(el_face).h
+                        for el_face in rank_bdry],
+                    dtype=numpy.float64)
+
+            packets[rank] = [face_vertices[rank], h_values]
+
+            if check_nodes:
+                # node coordinates in the order in which nodal values
+                # will be sent
+                packets[rank].append(
+                        self.nodes[self._get_face_node_indices(rank_bdry)])
+
+        received_packets = self._exchange_with_neighbors(packets)
+
+        # process received packets --------------------------------------------
+        # nb_ stands for neighbor_
+
+        self.from_neighbor_maps = {}
+
+        for rank, packet in received_packets.iteritems():
+            bdry_tag = hedge.mesh.TAG_RANK_BOUNDARY(rank)
+            rank_bdry = self.subdiscr.mesh.tag_to_boundary[bdry_tag]
+            rank_discr_boundary = self.subdiscr.get_boundary(bdry_tag)
+
+            my_face_vertices = face_vertices[rank]
+            nb_face_vertices, nb_h_values = packet[:2]
+
+            # step 1: match faces by their sets of global vertices
+            nb_face_keys = numpy.sort(nb_face_vertices, axis=1)
+            nb_face_indices = find_matching_rows(
+                    numpy.sort(my_face_vertices, axis=1), nb_face_keys)
+
+            # step 2: the faces left over are on periodic boundaries,
+            # match them to the opposite faces there
+            nb_vertices_here = nb_face_vertices[nb_face_indices]
+            periodic_axes = {}
+
+            unmatched = numpy.flatnonzero(nb_face_indices < 0)
+            if len(unmatched):
+                my_vertices_there = numpy.empty(
+                        (len(unmatched), my_face_vertices.shape[1]),
+                        dtype=my_face_vertices.dtype)
+                for i, face_idx in enumerate(unmatched):
+                    my_vertices_there[i], periodic_axes[face_idx] = \
+                            self.global_periodic_opposite_faces[
+                                    tuple(my_face_vertices[face_idx].tolist())]
+
+                nb_face_indices[unmatched] = find_matching_rows(
+                        numpy.sort(my_vertices_there, axis=1), nb_face_keys)
+                assert (nb_face_indices >= 0).all()
+
+                for face_idx in unmatched:
+                    his_vertices_here, axis = \
+                            self.global_periodic_opposite_faces[tuple(
+                                nb_face_vertices[
+                                    nb_face_indices[face_idx]].tolist())]
+                    assert axis == periodic_axes[face_idx]
+                    nb_vertices_here[face_idx] = his_vertices_here
+
+            # step 3: express the neighbor's vertex order in terms of ours,
+            # which determines how its face nodes need to be shuffled
+            vertex_matches = (nb_vertices_here[:, :, numpy.newaxis]
+                    == my_face_vertices[:, numpy.newaxis, :])
+            assert vertex_matches.any(axis=2).all()
+            vertex_orders = numpy.argmax(vertex_matches, axis=2)
+
+            # step 4: make a list of indices into the data we
+            # receive from our neighbor that'll tell us how
+            # to reshuffle them to match our node order
+            shuffled_indices_cache = {}
+
+            def get_shuffled_indices(ldis, vertex_order):
+                try:
+                    return shuffled_indices_cache[ldis, vertex_order]
+                except KeyError:
+                    shuffle_op = ldis.get_face_index_shuffle_to_match(
+                            range(len(vertex_order)), vertex_order)
+                    result = shuffled_indices_cache[ldis, vertex_order] = \
+                            numpy.array(
+                                    shuffle_op(range(ldis.face_node_count())),
+                                    dtype=numpy.intp)
+                    return result
+
+            face_shuffles = []
+            for face_idx, (el, face_nr) in enumerate(rank_bdry):
+                eslice, ldis = self.subdiscr.find_el_data(el.id)
+                face_shuffles.append(get_shuffled_indices(
+                    ldis, tuple(vertex_orders[face_idx].tolist())))
+
+                # finally, unify FluxFace.h values across boundary
+                nb_h = nb_h_values[nb_face_indices[face_idx]]
+                flux_face = rank_discr_boundary.find_facepair_side((el, face_nr))
+                flux_face.h = max(nb_h, flux_face.h)
+
+            face_node_counts = numpy.array(
+                    [len(shuffle) for shuffle in face_shuffles],
+                    dtype=numpy.intp)
+
+            # matching faces have the same number of nodes
+            nb_face_node_counts = numpy.empty_like(face_node_counts)
+            nb_face_node_counts[nb_face_indices] = face_node_counts
+            nb_face_starts = (numpy.cumsum(nb_face_node_counts)
+                    - nb_face_node_counts)
+
+            from_indices = (
+                    numpy.repeat(nb_face_starts[nb_face_indices],
+                        face_node_counts)
+                    + numpy.concatenate(face_shuffles))
+
+            # check if the nodes really match up
+            if check_nodes:
+                nb_node_coords = packet[2]
+                assert len(from_indices) == len(nb_node_coords)
+
+                dist = (self.nodes[self._get_face_node_indices(rank_bdry)]
+                        - nb_node_coords[from_indices])
+
+                node_faces = numpy.repeat(
+                        numpy.arange(len(rank_bdry)), face_node_counts)
+                for face_idx, axis in periodic_axes.iteritems():
+                    dist[node_faces == face_idx, axis] = 0
+
+                assert numpy.abs(dist).max() < 1e-14
+
+            # construct from_neighbor_map
+            self.from_neighbor_maps[rank] = \
+                    self.subdiscr.prepare_from_neighbor_map(from_indices)
+
+    def _get_face_node_indices(self, faces):
+        """Return the volume indices of the nodes on *faces*, a list of
+        *(element, face_number)* tuples, in order.
+        """
+        indices = []
+        for el, face_nr in faces:
+            eslice, ldis = self.subdiscr.find_el_data(el.id)
+            indices.extend(eslice.start+i for i in ldis.face_indices()[face_nr])
+
+        return numpy.array(indices, dtype=numpy.intp)
+
+    # }}}
+
+    # {{{ communication
+
+    def start_flux_exchange(self, insn, arg_fields):
+        """Start sending the rank-boundary values of the volume fields
+        *arg_fields* to all neighbor ranks for the
+        :class:`hedge.compiler.FluxExchangeBatchAssign` *insn*, and return
+        a list of :class:`hedge.tools.futures.Future` instances that
+        deliver the received values.
+        """
+        raise NotImplementedError
+
+    def reduce_values(self, operators, local_values):
+        """Return a list of the values in *local_values* reduced across all
+        ranks by the corresponding
+        :class:`hedge.optemplate.operators.NodalReductionOperator` in
+        *operators*.
+        """
+        raise NotImplementedError
+
+    def start_reductions(self, names, operators, local_values):
+        """Like :meth:`reduce_values`, but return a tuple *(assignments,
+        futures)* as expected of an instruction executor, with the results
+        assigned to *names*.
+        """
+        return zip(names, self.reduce_values(operators, local_values)), []
+
+    def reduce(self, op, local_value):
+        if self.reductions_are_local:
+            return local_value
+        else:
+            return self.reduce_values([op], [local_value])[0]
+
+    @contextmanager
+    def local_reductions(self):
+        """Return a context manager within which nodal reductions, and hence
+        norms and integrals, yield the contribution of this rank only,
+        without any communication.
+        """
+        was_local = self.reductions_are_local
+        self.reductions_are_local = True
+        try:
+            yield
+        finally:
+            self.reductions_are_local = was_local
+
+    # }}}
+
+    # dt estimation -----------------------------------------------------------
+    def dt_non_geometric_factor(self):
+        from hedge.optemplate.operators import NodalMin
+        return self.reduce_values([NodalMin()],
+                [self.subdiscr.dt_non_geometric_factor()])[0]
+
+    def dt_geometric_factor(self):
+        from hedge.optemplate.operators import NodalMin
+        return self.reduce_values([NodalMin()],
+                [self.subdiscr.dt_geometric_factor()])[0]
+
+    # compilation -------------------------------------------------------------
+    def compile(self, optemplate, post_bind_mapper=lambda x: x, type_hints={}):
+        fci = FluxCommunicationInserter(self.neighbor_ranks)
+        executor = self.subdiscr.compile(
+                optemplate,
+                post_bind_mapper=lambda x: fci(post_bind_mapper(x)),
+                type_hints=type_hints)
+        self.compiled_codes.add(executor.code)
+        return executor
+
+# }}}
+
+# vim: foldmethod=marker
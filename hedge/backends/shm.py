@@ -0,0 +1,594 @@
+"""Shared-memory parallelism on a single node, using forked processes"""
+
+from __future__ import division
+
+__copyright__ = "Copyright (C) 2007 Andreas Kloeckner"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import os
+import time
+import numpy
+from hedge.tools.futures import Future
+from hedge.backends import RunContext
+from hedge.backends.parallel import ParallelDiscretizationBase, make_rank_data
+
+
+# {{{ process-shared state
+
+class ProcessBarrier(object):
+    """A reusable barrier for *parties* processes, which must be forked
+    after the barrier is created.
+    """
+
+    def __init__(self, parties):
+        import multiprocessing
+        self.parties = parties
+        self.condition = multiprocessing.Condition()
+        self.count = multiprocessing.RawValue("i", 0)
+        self.generation = multiprocessing.RawValue("i", 0)
+
+    def wait(self):
+        with self.condition:
+            generation = self.generation.value
+            self.count.value += 1
+            if self.count.value == self.parties:
+                self.count.value = 0
+                self.generation.value += 1
+                self.condition.notify_all()
+            else:
+                while self.generation.value == generation:
+                    self.condition.wait()
+
+
+class SharedState(object):
+    """The objects shared by the processes of a run: a barrier, a message
+    queue for each rank, buffers for global reductions, and a directory
+    (in ``/dev/shm`` where available) for the halo buffers of
+    :class:`SharedHaloExchange`, along with a lock for each rank that
+    guards the counters of the halo buffers it receives.
+    """
+
+    def __init__(self, rank_count, reduction_capacity):
+        import multiprocessing
+        self.rank_count = rank_count
+        self.barrier = ProcessBarrier(rank_count)
+        self.queues = [multiprocessing.Queue() for rank in range(rank_count)]
+        self.halo_locks = [multiprocessing.Lock() for rank in range(rank_count)]
+
+        # two alternating sets of buffers, so that a reduction need not
+        # wait until all ranks have read the result of the previous one
+        self.reduction_capacity = reduction_capacity
+        self.reduction_buffers = numpy.frombuffer(
+                multiprocessing.RawArray("d",
+                    2*rank_count*reduction_capacity),
+                dtype=numpy.float64).reshape(
+                        2, rank_count, reduction_capacity)
+
+        from tempfile import mkdtemp
+        if os.path.isdir("/dev/shm"):
+            tmp_dir = "/dev/shm"
+        else:
+            tmp_dir = None
+        self.directory = mkdtemp(prefix="hedge-shm-", dir=tmp_dir)
+
+    def close(self):
+        from shutil import rmtree
+        rmtree(self.directory, ignore_errors=True)
+
+
+def _spin_until(predicate):
+    while not predicate():
+        time.sleep(0)
+
+# }}}
+
+
+# {{{ run context
+
+class SharedMemoryRunContext(RunContext):
+    """The run context of one of several processes on a single node, as
+    created by :func:`run_with_processes`. Behaves like
+    :class:`hedge.backends.mpi.MPIRunContext`, but without MPI.
+    """
+
+    communicator = None
+
+    def __init__(self, rank, shared, serial_context):
+        self._rank = rank
+        self.shared = shared
+        self.serial_context = serial_context
+        self._stashed_messages = []
+
+    @property
+    def rank(self):
+        return self._rank
+
+    @property
+    def ranks(self):
+        return range(self.shared.rank_count)
+
+    @property
+    def head_rank(self):
+        return 0
+
+    # {{{ communication
+
+    def barrier(self):
+        self.shared.barrier.wait()
+
+    def send(self, obj, dest, tag):
+        """Send the picklable object *obj* to rank *dest*."""
+        self.shared.queues[dest].put((self.rank, tag, obj))
+
+    def recv(self, source, tag):
+        """Return the next object sent with *tag* by rank *source*."""
+        for i, (msg_source, msg_tag, obj) in enumerate(self._stashed_messages):
+            if msg_source == source and msg_tag == tag:
+                del self._stashed_messages[i]
+                return obj
+
+        while True:
+            msg_source, msg_tag, obj = self.shared.queues[self.rank].get()
+            if msg_source == source and msg_tag == tag:
+                return obj
+            self._stashed_messages.append((msg_source, msg_tag, obj))
+
+    def alltoall(self, objects):
+        for rank in self.ranks:
+            if rank != self.rank:
+                self.send(objects[rank], rank, "alltoall")
+
+        return [objects[rank] if rank == self.rank
+                else self.recv(rank, "alltoall")
+                for rank in self.ranks]
+
+    # }}}
+
+    def distribute_mesh(self, mesh, partition=None, cache_dir=None,
+            element_weights=None):
+        """See :meth:`hedge.backends.mpi.MPIRunContext.distribute_mesh`."""
+        assert self.is_head_rank
+
+        part_count = len(self.ranks)
+
+        if cache_dir is not None:
+            from hedge.partition import (get_mesh_digest,
+                    partition_cache_matches)
+            mesh_digest = get_mesh_digest(mesh, element_weights)
+            if partition_cache_matches(cache_dir, mesh_digest, part_count):
+                for rank in self.ranks:
+                    if rank != self.rank:
+                        self.send(("cache", cache_dir), rank, "mesh")
+                return self._load_partition_cache(cache_dir, mesh_digest)
+
+        if partition is None:
+            partition = part_count
+
+        if isinstance(partition, int):
+            from hedge.partition import get_metis_partition
+            partition = get_metis_partition(mesh, partition,
+                    element_weights)
+
+        from hedge.partition import get_partition_arrays
+        all_part_arrays = dict(
+                (part_arrays.part_nr, part_arrays)
+                for part_arrays in get_partition_arrays(mesh, partition))
+
+        if cache_dir is not None:
+            from hedge.partition import save_partition_cache
+            save_partition_cache(cache_dir, mesh_digest, part_count,
+                    all_part_arrays.itervalues())
+
+        for rank in self.ranks:
+            if rank != self.rank:
+                self.send(("arrays", all_part_arrays.get(rank)), rank, "mesh")
+
+        return self._make_rank_data(all_part_arrays.get(self.rank))
+
+    def receive_mesh(self):
+        kind, data = self.recv(self.head_rank, "mesh")
+        if kind == "cache":
+            return self._load_partition_cache(data)
+        else:
+            return self._make_rank_data(data)
+
+    def read_mesh(self, filename):
+        """See :meth:`hedge.backends.mpi.MPIRunContext.read_mesh`."""
+        from hedge.partition import get_partition_arrays_from_file
+        return self._make_rank_data(
+                get_partition_arrays_from_file(filename, self.rank))
+
+    def _load_partition_cache(self, cache_dir, mesh_digest=None):
+        from hedge.partition import load_partition_cache
+        return self._make_rank_data(load_partition_cache(cache_dir, self.rank,
+                mesh_digest=mesh_digest, part_count=len(self.ranks)))
+
+    def _make_rank_data(self, part_arrays):
+        if part_arrays is None:
+            return None
+        else:
+            return make_rank_data(part_arrays)
+
+    def make_discretization(self, mesh_data, *args, **kwargs):
+        return SharedMemoryDiscretization(self,
+                self.serial_context.discr_class, mesh_data,
+                *args, **kwargs)
+
+    @property
+    def thread_count(self):
+        return self.serial_context.thread_count
+
+    def get_thread_pool(self):
+        return self.serial_context.get_thread_pool()
+
+    def make_timer(self, name, description=None):
+        return self.serial_context.make_timer(name, description)
+
+    def make_linear_combiner(self, *args, **kwargs):
+        return self.serial_context.make_linear_combiner(*args, **kwargs)
+
+
+def run_with_processes(func, rank_count, args=(), serial_context=None,
+        reduction_capacity=256):
+    """Fork *rank_count* processes, each of which calls *func* with its
+    :class:`SharedMemoryRunContext` followed by *args*, and return a list
+    of the (picklable) return values, by rank.
+
+    If a rank fails, the remaining processes are terminated and a
+    :exc:`RuntimeError` is raised.
+
+    :param reduction_capacity: the number of values that a global
+      reduction may carry at once. Larger batches are split.
+    """
+    import multiprocessing
+    from Queue import Empty
+
+    if serial_context is None:
+        from hedge.backends import CPURunContext
+        serial_context = CPURunContext()
+
+    shared = SharedState(rank_count, reduction_capacity)
+    result_queue = multiprocessing.Queue()
+
+    def run_rank(rank):
+        try:
+            result = func(
+                    SharedMemoryRunContext(rank, shared, serial_context),
+                    *args)
+        except Exception:
+            from traceback import format_exc
+            result_queue.put((rank, False, format_exc()))
+        else:
+            result_queue.put((rank, True, result))
+
+    processes = [multiprocessing.Process(target=run_rank, args=(rank,))
+            for rank in range(rank_count)]
+    for process in processes:
+        process.start()
+
+    results = [None]*rank_count
+    try:
+        received_count = 0
+        while received_count < rank_count:
+            try:
+                rank, success, result = result_queue.get(timeout=1)
+            except Empty:
+                for rank, process in enumerate(processes):
+                    if process.exitcode not in [None, 0]:
+                        raise RuntimeError("rank %d exited with code %d"
+                                % (rank, process.exitcode))
+                continue
+
+            if not success:
+                raise RuntimeError("rank %d failed:\n%s" % (rank, result))
+
+            results[rank] = result
+            received_count += 1
+    except:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        raise
+    finally:
+        for process in processes:
+            process.join()
+        shared.close()
+
+    return results
+
+# }}}
+
+
+# {{{ halo exchange through shared buffers
+
+class SharedHaloExchange(object):
+    """Exchanges the values of *component_count* volume fields on the rank
+    boundaries of a :class:`SharedMemoryDiscretization` with all neighbor
+    ranks.
+
+    Each rank packs the values bound for each neighbor into a buffer in a
+    shared file, from which the neighbor gathers them directly into its
+    own boundary order. Each buffer begins with two counters, the number
+    of times it has been filled and the number of times it has been read,
+    through which sender and receiver wait for each other. The counters
+    are only accessed while holding the receiving rank's lock in
+    :attr:`SharedState.halo_locks`. Since acquiring and releasing that
+    lock orders memory accesses, data written before a counter update is
+    visible to whoever observes the update, on any processor.
+
+    Boundary fields returned by :meth:`receive` are views into buffers
+    that are overwritten by the next exchange.
+    """
+
+    header_size = 16
+
+    def __init__(self, sdiscr, key, component_count):
+        from hedge.mesh import TAG_RANK_BOUNDARY
+
+        self.directory = sdiscr.context.shared.directory
+        self.key = key
+        self.my_rank = sdiscr.context.rank
+        self.locks = sdiscr.context.shared.halo_locks
+        self.dtype = numpy.dtype(sdiscr.default_scalar_type)
+
+        self.shapes = {}
+        self.send_indices = {}
+        self.from_neighbor_maps = {}
+        self.send_counters = {}
+        self.send_buffers = {}
+        self.recv_counters = {}
+        self.recv_buffers = {}
+        self.result_buffers = {}
+        self.send_counts = {}
+        self.recv_counts = {}
+
+        for rank in sdiscr.neighbor_ranks:
+            bdry = sdiscr.get_boundary(TAG_RANK_BOUNDARY(rank))
+            self.shapes[rank] = shape = (component_count, len(bdry.nodes))
+
+            self.send_indices[rank] = numpy.asarray(
+                    bdry.vol_indices, dtype=numpy.intp)
+            self.from_neighbor_maps[rank] = numpy.asarray(
+                    sdiscr.from_neighbor_maps[rank], dtype=numpy.intp)
+
+            # create under a temporary name, so that the neighbor never
+            # sees an incomplete file
+            filename = self._get_filename(self.my_rank, rank)
+            self.send_counters[rank], self.send_buffers[rank] = \
+                    self._map_buffer(filename+".tmp", shape, "w+")
+            os.rename(filename+".tmp", filename)
+
+            # mapped on first receive
+            self.recv_counters[rank] = self.recv_buffers[rank] = None
+
+            self.result_buffers[rank] = numpy.empty(shape, self.dtype)
+            self.send_counts[rank] = self.recv_counts[rank] = 0
+
+    def _get_filename(self, from_rank, to_rank):
+        return os.path.join(self.directory,
+                "halo-%d-%d-%d" % (self.key, from_rank, to_rank))
+
+    def _map_buffer(self, filename, shape, mode):
+        data_size = int(numpy.prod(shape))*self.dtype.itemsize
+        mapped = numpy.memmap(filename, dtype=numpy.uint8, mode=mode,
+                shape=(self.header_size+data_size,))
+        counters = mapped[:self.header_size].view(numpy.int64)
+        data = mapped[self.header_size:].view(self.dtype).reshape(shape)
+        return counters, data
+
+    def can_send(self, rank):
+        """Return whether the neighbor has read the previous values sent to
+        it.
+        """
+        with self.locks[rank]:
+            return self.send_counters[rank][1] == self.send_counts[rank]
+
+    def send(self, rank, fields):
+        """Gather the values of the volume fields *fields* on the boundary
+        with *rank* into its shared buffer. Requires :meth:`can_send`.
+        """
+        send_buf = self.send_buffers[rank]
+        send_indices = self.send_indices[rank]
+
+        for i, field in enumerate(fields):
+            if isinstance(field, numpy.ndarray):
+                numpy.take(field, send_indices, out=send_buf[i], mode="clip")
+            else:
+                # a scalar, will be broadcast
+                send_buf[i] = field
+
+        self.send_counts[rank] += 1
+        with self.locks[rank]:
+            self.send_counters[rank][0] = self.send_counts[rank]
+
+    def can_receive(self, rank):
+        """Return whether *rank* has sent values not yet received."""
+        if self.recv_counters[rank] is None:
+            filename = self._get_filename(rank, self.my_rank)
+            if not os.path.exists(filename):
+                return False
+
+            self.recv_counters[rank], self.recv_buffers[rank] = \
+                    self._map_buffer(filename, self.shapes[rank], "r+")
+
+        with self.locks[self.my_rank]:
+            return self.recv_counters[rank][0] > self.recv_counts[rank]
+
+    def receive(self, rank, indices_and_names):
+        """Copy the values sent by *rank* from its shared buffer, reordered
+        to match the local boundary nodes, and return a list of *(name,
+        boundary field)* tuples. Requires :meth:`can_receive`.
+        """
+        result = self.result_buffers[rank]
+        numpy.take(self.recv_buffers[rank], self.from_neighbor_maps[rank],
+                axis=1, out=result, mode="clip")
+
+        self.recv_counts[rank] += 1
+        with self.locks[self.my_rank]:
+            self.recv_counters[rank][1] = self.recv_counts[rank]
+
+        return [(name, result[idx]) for idx, name in indices_and_names]
+
+
+class SharedSendFuture(Future):
+    def __init__(self, exchange, rank, fields):
+        self.exchange = exchange
+        self.rank = rank
+        self.fields = fields
+
+    def is_ready(self):
+        return self.exchange.can_send(self.rank)
+
+    def __call__(self):
+        _spin_until(self.is_ready)
+        self.exchange.send(self.rank, self.fields)
+        return [], []
+
+
+class SharedReceiveFuture(Future):
+    def __init__(self, exchange, rank, indices_and_names):
+        self.exchange = exchange
+        self.rank = rank
+        self.indices_and_names = indices_and_names
+
+    def is_ready(self):
+        return self.exchange.can_receive(self.rank)
+
+    def __call__(self):
+        _spin_until(self.is_ready)
+        return self.exchange.receive(self.rank, self.indices_and_names), []
+
+# }}}
+
+
+# {{{ discretization
+
+class SharedMemoryDiscretization(ParallelDiscretizationBase):
+    """A :class:`hedge.backends.parallel.ParallelDiscretizationBase` whose
+    ranks are processes on one node, which exchange rank-boundary values
+    through shared memory.
+
+    Halo buffers are identified by the order in which operators are
+    compiled, so all ranks must compile the same operators in the same
+    order.
+    """
+
+    def __init__(self, rcon, subdiscr_class, rank_data, *args, **kwargs):
+        ParallelDiscretizationBase.__init__(self,
+                rcon, subdiscr_class, rank_data, *args, **kwargs)
+
+        self._halo_exchanges = {}
+        self._halo_exchange_count = 0
+        self._reduction_count = 0
+
+    def _exchange_with_neighbors(self, packets):
+        for rank, packet in packets.iteritems():
+            self.context.send(packet, rank, "interface")
+
+        return dict(
+                (rank, self.context.recv(rank, "interface"))
+                for rank in self.neighbor_ranks)
+
+    def compile(self, optemplate, post_bind_mapper=lambda x: x, type_hints={}):
+        executor = ParallelDiscretizationBase.compile(self, optemplate,
+                post_bind_mapper=post_bind_mapper, type_hints=type_hints)
+
+        from hedge.compiler import FluxExchangeBatchAssign
+        for insn in executor.code.instructions:
+            if isinstance(insn, FluxExchangeBatchAssign):
+                # keep insn alive, so that its id is not reused
+                self._halo_exchanges[id(insn)] = insn, SharedHaloExchange(
+                        self, self._halo_exchange_count, len(insn.arg_fields))
+                self._halo_exchange_count += 1
+
+        return executor
+
+    def start_flux_exchange(self, insn, arg_fields):
+        exchange = self._halo_exchanges[id(insn)][1]
+
+        futures = []
+        for rank in self.neighbor_ranks:
+            if exchange.can_send(rank):
+                exchange.send(rank, arg_fields)
+            else:
+                futures.append(SharedSendFuture(exchange, rank, arg_fields))
+
+        return futures + [
+                SharedReceiveFuture(exchange, rank,
+                    insn.rank_to_index_and_name[rank])
+                for rank in self.neighbor_ranks]
+
+    def reduce_values(self, operators, local_values):
+        from hedge.optemplate.operators import NodalSum, NodalMax, NodalMin
+
+        shared = self.context.shared
+        values = numpy.array(local_values)
+        is_complex = values.dtype.kind == "c"
+        if is_complex:
+            if not all(isinstance(op, NodalSum) for op in operators):
+                raise ValueError(
+                        "cannot take maxima or minima of complex values")
+            flat_values = values.astype(numpy.complex128).view(numpy.float64)
+            flat_operators = [op for op in operators for i in range(2)]
+        else:
+            flat_values = values.astype(numpy.float64)
+            flat_operators = operators
+
+        count = len(flat_values)
+        if count > shared.reduction_capacity:
+            if len(operators) < 2:
+                raise ValueError("a reduction of %d values does not fit "
+                        "into the reduction capacity of %d"
+                        % (count, shared.reduction_capacity))
+
+            half = len(operators)//2
+            return (self.reduce_values(operators[:half], local_values[:half])
+                    + self.reduce_values(operators[half:], local_values[half:]))
+
+        buffers = shared.reduction_buffers[self._reduction_count % 2]
+        self._reduction_count += 1
+
+        buffers[self.context.rank, :count] = flat_values
+        self.context.barrier()
+
+        # all ranks combine the partial results in the same order, so that
+        # they obtain identical results
+        partials = buffers[:, :count]
+        result = numpy.empty(count, dtype=numpy.float64)
+        for op_class, reduce_func in [
+                (NodalSum, numpy.sum),
+                (NodalMax, numpy.max),
+                (NodalMin, numpy.min)]:
+            indices = [i for i, op in enumerate(flat_operators)
+                    if isinstance(op, op_class)]
+            if indices:
+                result[indices] = reduce_func(partials[:, indices], axis=0)
+
+        if is_complex:
+            result = result.view(numpy.complex128)
+
+        return list(result)
+
+# }}}
+
+# vim: foldmethod=marker
@@ -25,6 +25,7 @@ THE SOFTWARE.
 """
 
 
+from time import time
 from pytools import Record, memoize_method
 from hedge.optemplate import IdentityMapper
 
@@ -263,6 +264,43 @@ class FluxExchangeBatchAssign(Instruction):
     def get_executor_method(self, executor):
         return executor.exec_flux_exchange_batch_assign
 
+
+class ReductionBatchAssign(Instruction):
+    """
+    :ivar names:
+    :ivar operators: a list of
+        :class:`hedge.optemplate.operators.NodalReductionOperator` instances.
+    :ivar fields: the fields to which *operators* apply, one per operator.
+
+    The reductions in a batch do not depend on each other, so that
+    distributed-memory backends may carry out all of them in a single
+    global reduction.
+    """
+
+    def get_assignees(self):
+        return set(self.names)
+
+    @memoize_method
+    def get_dependencies(self):
+        dep_mapper = self.dep_mapper_factory()
+        result = set()
+        for fld in self.fields:
+            result |= dep_mapper(fld)
+        return result
+
+    def __str__(self):
+        lines = []
+
+        lines.append("{")
+        for n, op, fld in zip(self.names, self.operators, self.fields):
+            lines.append("  %s <- %s(%s)" % (n, op, fld))
+        lines.append("}")
+
+        return "\n".join(lines)
+
+    def get_executor_method(self, executor):
+        return executor.exec_reduction_batch_assign
+
 # }}}
 
 
@@ -292,8 +330,8 @@ def dot_dataflow_graph(code, max_node_label_length=30,
 
         node_label = node_label.replace("\n", "\\l") + "\\l"
 
-        result.append("%s [ label=\"p%d: %s\" shape=box ];" % (
-            node_name, insn.priority, node_label))
+        result.append("%s [ label=\"p%s: %s\" shape=box ];" % (
+            node_name, code.get_priority(insn), node_label))
 
         for assignee in insn.get_assignees():
             origins[assignee] = node_name
@@ -329,12 +367,57 @@ def dot_dataflow_graph(code, max_node_label_length=30,
 # {{{ code representation
 
 class Code(object):
-    def __init__(self, instructions, result):
+    """
+    .. attribute:: priorities
+
+        A dictionary mapping instructions to their effective priorities,
+        see :meth:`get_priority`.
+
+    .. attribute:: last_schedule_delay_free
+
+        Whether no future had to be waited for during the most recent run
+        of the static schedule, or *None* if it has not run yet.
+
+    .. attribute:: future_count
+
+        The number of futures evaluated so far.
+
+    .. attribute:: future_wait_count
+
+        The number of futures that were evaluated before they were ready,
+        i.e. that had to be waited for.
+
+    .. attribute:: future_wait_time
+
+        The wall time in seconds spent evaluating futures that had to be
+        waited for.
+    """
+
+    def __init__(self, instructions, result, priorities=None):
         self.instructions = instructions
         self.result = result
         self.last_schedule = None
         self.static_schedule_attempts = 5
 
+        if priorities is None:
+            priorities = {}
+        self.priorities = priorities
+
+        self.last_schedule_delay_free = None
+        self.future_count = 0
+        self.future_wait_count = 0
+        self.future_wait_time = 0
+
+    def get_priority(self, insn):
+        """Return the effective priority of *insn*, a tuple
+        *(communication class, priority)* as assigned by
+        :meth:`OperatorCompilerBase.get_communication_priorities`.
+        """
+        try:
+            return self.priorities[insn]
+        except KeyError:
+            return (0, insn.priority)
+
     def dump_dataflow_graph(self):
         from hedge.tools import open_unique_debug_file
 
@@ -357,7 +440,7 @@ class Code(object):
     def get_next_step(self, available_names, done_insns):
         from pytools import all, argmax2
         available_insns = [
-                (insn, insn.priority) for insn in self.instructions
+                (insn, self.get_priority(insn)) for insn in self.instructions
                 if insn not in done_insns
                 and all(dep.name in available_names
                     for dep in insn.get_dependencies())]
@@ -419,9 +502,17 @@ class Code(object):
                 if force_future or future.is_ready():
                     futures.pop(i)
 
+                    self.future_count += 1
                     insn = self.EvaluateFuture(future.id)
 
-                    assignments, new_futures = future()
+                    if force_future:
+                        self.future_wait_count += 1
+                        wait_start = time()
+                        assignments, new_futures = future()
+                        self.future_wait_time += time() - wait_start
+                    else:
+                        assignments, new_futures = future()
+
                     force_future = False
                     break
                 else:
@@ -508,9 +599,15 @@ class Code(object):
 
             if isinstance(insn, self.EvaluateFuture):
                 future = id_to_future.pop(insn.future_id)
-                if not future.is_ready():
+                self.future_count += 1
+                if future.is_ready():
+                    assignments, new_futures = future()
+                else:
+                    self.future_wait_count += 1
                     schedule_is_delay_free = False
-                assignments, new_futures = future()
+                    wait_start = time()
+                    assignments, new_futures = future()
+                    self.future_wait_time += time() - wait_start
                 del future
             else:
                 assignments, new_futures = \
@@ -530,6 +627,7 @@ class Code(object):
                 id_to_future[next_future_id] = future
                 next_future_id += 1
 
+        self.last_schedule_delay_free = schedule_is_delay_free
         if not schedule_is_delay_free:
             self.last_schedule = None
             self.static_schedule_attempts -= 1
@@ -591,6 +689,32 @@ class OperatorCompilerBase(IdentityMapper):
         from hedge.optemplate.mappers import FluxExchangeCollector
         return FluxExchangeCollector()(expr)
 
+    def collect_reductions(self, expr):
+        from hedge.optemplate.operators import NodalReductionOperator
+        from hedge.optemplate.mappers import BoundOperatorCollector
+        return BoundOperatorCollector(NodalReductionOperator)(expr)
+
+    def get_reduction_batches(self, expr):
+        """Return a list of lists of the nodal reductions in *expr*, such
+        that each reduction depends only on reductions in earlier lists.
+        """
+        queue = [(red, self.collect_reductions(red.field))
+                for red in self.collect_reductions(expr)]
+
+        batches = []
+        admissible_deps = set()
+        while queue:
+            batch = [red for red, deps in queue if deps <= admissible_deps]
+            if not batch:
+                raise RuntimeError("cannot resolve reduction order")
+
+            queue = [(red, deps) for red, deps in queue
+                    if not deps <= admissible_deps]
+            batches.append(batch)
+            admissible_deps.update(batch)
+
+        return batches
+
     # }}}
 
     # {{{ top-level driver ----------------------------------------------------
@@ -654,10 +778,16 @@ class OperatorCompilerBase(IdentityMapper):
         # Flux exchange also works better when batched.
         self.flux_exchange_ops = self.collect_flux_exchange_ops(expr)
 
+        # Independent global reductions are batched, so that a parallel
+        # run can carry out each batch in one collective operation.
+        self.reduction_batches = self.get_reduction_batches(expr)
+
         # Finally, walk the expression and build the code.
         result = IdentityMapper.__call__(self, expr)
 
-        return Code(self.aggregate_assignments(self.code, result), result)
+        instructions = self.aggregate_assignments(self.code, result)
+        return Code(instructions, result,
+                self.get_communication_priorities(instructions))
 
     # }}}
 
@@ -740,10 +870,13 @@ class OperatorCompilerBase(IdentityMapper):
     def map_operator_binding(self, expr, name_hint=None):
         from hedge.optemplate.operators import (
                 ReferenceDiffOperatorBase,
-                FluxOperatorBase)
+                FluxOperatorBase,
+                NodalReductionOperator)
 
         if isinstance(expr.op, ReferenceDiffOperatorBase):
             return self.map_ref_diff_op_binding(expr)
+        elif isinstance(expr.op, NodalReductionOperator):
+            return self.map_reduction_binding(expr)
         elif isinstance(expr.op, FluxOperatorBase):
             raise RuntimeError("OperatorCompiler encountered a flux operator.\n\n"
                     "We are expecting flux operators to be converted to custom "
@@ -853,6 +986,34 @@ class OperatorCompilerBase(IdentityMapper):
 
             return self.expr_to_var[expr]
 
+    def map_reduction_binding(self, expr):
+        try:
+            return self.expr_to_var[expr]
+        except KeyError:
+            for batch in self.reduction_batches:
+                if expr in batch:
+                    break
+            else:
+                raise RuntimeError("reduction '%s' not in any batch" % expr)
+
+            # make sure the reduced fields stand alone
+            fields = [self.assign_to_new_var(self.rec(red.field))
+                    for red in batch]
+            names = [self.get_var_name() for red in batch]
+
+            self.code.append(
+                    ReductionBatchAssign(
+                        names=names,
+                        operators=[red.op for red in batch],
+                        fields=fields,
+                        dep_mapper_factory=self.dep_mapper_factory))
+
+            from pymbolic import var
+            for n, red in zip(names, batch):
+                self.expr_to_var[red] = var(n)
+
+            return self.expr_to_var[expr]
+
     def map_planned_flux(self, expr):
         try:
             return self.expr_to_var[expr]
@@ -896,6 +1057,60 @@ class OperatorCompilerBase(IdentityMapper):
 
     # }}}
 
+    # {{{ communication-aware priorities
+
+    def get_communication_priorities(self, instructions):
+        """Return a dictionary mapping each of *instructions* to an
+        effective priority *(communication class, priority)*, where
+        tuples compare by communication class first.
+
+        Instructions on which a :class:`FluxExchangeBatchAssign` depends,
+        directly or indirectly, get class 1, so that sends start as early
+        as possible. Instructions using exchanged values, i.e. the gathers
+        of rank-boundary fluxes, get class -1, so that they run after all
+        local work and messages have the most time to arrive. All others
+        get class 0.
+        """
+        origins = dict(
+                (name, insn)
+                for insn in instructions
+                for name in insn.get_assignees())
+
+        exchanges = [insn for insn in instructions
+                if isinstance(insn, FluxExchangeBatchAssign)]
+
+        critical_insns = set()
+        queue = list(exchanges)
+        while queue:
+            insn = queue.pop()
+            if insn in critical_insns:
+                continue
+
+            critical_insns.add(insn)
+            for dep in insn.get_dependencies():
+                dep_origin = origins.get(getattr(dep, "name", None))
+                if dep_origin is not None:
+                    queue.append(dep_origin)
+
+        exchanged_names = set(
+                name for insn in exchanges for name in insn.names)
+
+        result = {}
+        for insn in instructions:
+            if insn in critical_insns:
+                comm_class = 1
+            elif any(getattr(dep, "name", None) in exchanged_names
+                    for dep in insn.get_dependencies()):
+                comm_class = -1
+            else:
+                comm_class = 0
+
+            result[insn] = (comm_class, insn.priority)
+
+        return result
+
+    # }}}
+
     # {{{ assignment aggregration pass
 
     def aggregate_assignments(self, instructions, result):
@@ -36,6 +36,8 @@ warn("hedge.data is deprecated and should no longer be used. Instead, "
 # {{{ helpers
 
 class _ConstantFunctionContainer:
+    supports_arrays = True
+
     def __init__(self, value):
         self.value = value
 
@@ -43,8 +45,9 @@ class _ConstantFunctionContainer:
     def shape(self):
         return self.value.shape
 
-    def __call__(self, x, el):
-        return self.value
+    def __call__(self, x, el_ids):
+        # broadcast along the node axis
+        return numpy.asarray(self.value)[..., numpy.newaxis]
 
 # }}}
 
@@ -122,6 +125,8 @@ class GivenFunction(IGivenFunction):
 
         :param f: a valid argument to 
           :meth:`hedge.discretization.Discretization.interpolate_volume_function`.
+          If it declares *supports_arrays*, it is evaluated at all nodes
+          in a single call.
         """
         from weakref import WeakKeyDictionary
 
@@ -272,6 +277,10 @@ class TimeIntervalGivenFunction(ITimeDependentGivenFunction):
 class TimeDependentGivenFunction(ITimeDependentGivenFunction):
     """Adapts a function :math:`f(x,t)` into the
     :class:`GivenFunction` framework.
+
+    If *f* has a true *supports_arrays* attribute, it is called as
+    ``f(x, el_ids, t)`` with the arrays described in
+    :class:`hedge.discretization.ArrayFunction`.
     """
     def __init__(self, f):
         self.f = f
@@ -280,7 +289,7 @@ class TimeDependentGivenFunction(ITimeDependentGivenFunction):
         def __init__(self, f, t):
             """Adapt a function :math:`f(x, el, t)` in such a way that
             it can be fed to `interpolate_*_function()`. In particular,
-            preserve the `shape` attribute.
+            preserve the `shape` and `supports_arrays` attributes.
             """
             self.f = f
             self.t = t
@@ -289,6 +298,10 @@ class TimeDependentGivenFunction(ITimeDependentGivenFunction):
         def shape(self):
             return self.f.shape
 
+        @property
+        def supports_arrays(self):
+            return getattr(self.f, "supports_arrays", False)
+
         def __call__(self, x, el):
             return self.f(x, el, self.t)
 
@@ -65,6 +65,29 @@ class _PointEvaluator(object):
             return np.dot(self.interp_coeff, field[self.el_range])
 
 
+class ArrayFunction(object):
+    """Wraps a function *f(x, el_ids)* that evaluates at all nodes at once
+    so that it can be passed to
+    :meth:`Discretization.interpolate_volume_function` and
+    :meth:`Discretization.interpolate_boundary_function`.
+
+    *x* is the *(d, n_nodes)* array of node coordinates, and *el_ids* is an
+    integer array holding the id of each node's element. *f* must return
+    an array of shape *shape + (n_nodes,)* (or one that broadcasts to it),
+    or, for nonempty *shape*, an object array of that shape whose entries
+    are arrays of length *n_nodes* or scalars.
+    """
+
+    supports_arrays = True
+
+    def __init__(self, f, shape=()):
+        self.f = f
+        self.shape = shape
+
+    def __call__(self, x, el_ids):
+        return self.f(x, el_ids)
+
+
 # {{{ timestep calculator (deprecated)
 
 class TimestepCalculator(object):
@@ -216,13 +239,18 @@ class Discretization(TimestepCalculator):
     # {{{ construction / finalization
     def __init__(self, mesh, local_discretization=None,
             order=None, quad_min_degrees={},
-            debug=set(), default_scalar_type=np.float64, run_context=None):
+            debug=set(), default_scalar_type=np.float64, run_context=None,
+            element_order=None):
         """
         :param quad_min_degrees: A mapping from quadrature tags to the degrees to
           which the desired quadrature is supposed to be exact.
         :param debug: A set of strings indicating which debug checks should
           be activated. See validity check below for the currently defined
           set of debug flags.
+        :param element_order: if not *None*, a reordering method accepted by
+          :meth:`hedge.mesh.ConformalMesh.reordered_by`, such as
+          ``"hilbert"``. The discretization is then built on the reordered
+          mesh, available as :attr:`mesh`.
         """
 
         self.run_context = run_context
@@ -230,6 +258,9 @@ class Discretization(TimestepCalculator):
         if not isinstance(mesh, hedge.mesh.Mesh):
             raise TypeError("mesh must be of type hedge.mesh.Mesh")
 
+        if element_order is not None:
+            mesh = mesh.reordered_by(element_order)
+
         self.mesh = mesh
 
         local_discretization = self.get_local_discretization(
@@ -963,7 +994,83 @@ class Discretization(TimestepCalculator):
             dtype = self.default_scalar_type
         return np.zeros(shape + (len(self.nodes),), dtype)
 
+    @memoize_method
+    def node_element_ids(self):
+        """Return an integer array containing, for each volume node, the
+        :attr:`hedge.mesh.element.Element.id` of the element it belongs to.
+        """
+        result = np.empty(len(self.nodes), dtype=np.intp)
+        for eg in self.element_groups:
+            rng = eg.ranges
+            result[rng.start:rng.start+rng.total_size] = np.repeat(
+                    eg.member_nrs, rng.el_size)
+        return result
+
+    @memoize_method
+    def volume_element_layout(self):
+        """Return a tuple *(el_ids, starts, stops)* of integer arrays giving,
+        for each element in the order in which they are stored in volume
+        vectors, its :attr:`hedge.mesh.element.Element.id` and the half-open
+        range of its nodes.
+        """
+        el_ids = []
+        starts = []
+        el_sizes = []
+        for eg in self.element_groups:
+            rng = eg.ranges
+            el_ids.append(np.asarray(eg.member_nrs, dtype=np.intp))
+            starts.append(rng.start
+                    + rng.el_size*np.arange(len(rng), dtype=np.intp))
+            el_sizes.append(np.repeat(rng.el_size, len(rng)))
+
+        el_ids = np.hstack(el_ids)
+        starts = np.hstack(starts)
+        stops = starts + np.hstack(el_sizes)
+
+        order = np.argsort(starts, kind="mergesort")
+        return el_ids[order], starts[order], stops[order]
+
+    @memoize_method
+    def boundary_node_element_ids(self, tag):
+        """Return an integer array containing, for each node of the boundary
+        tagged *tag*, the id of the element it belongs to.
+        """
+        el_ids = []
+        face_node_counts = []
+        for el, face_nr in self.mesh.tag_to_boundary.get(tag, []):
+            el_ids.append(el.id)
+            face_node_counts.append(len(
+                self.find_el_discretization(el.id).face_indices()[face_nr]))
+
+        return np.repeat(np.array(el_ids, dtype=np.intp),
+                np.array(face_node_counts, dtype=np.intp))
+
+    @staticmethod
+    def _fill_from_array_function(out, shape, f, points, el_ids):
+        result = f(points, el_ids)
+
+        from hedge.tools import is_obj_array
+        if shape and is_obj_array(result):
+            from pytools import indices_in_shape
+            for i in indices_in_shape(shape):
+                out[i] = result[i]
+        else:
+            out[...] = result
+
     def interpolate_volume_function(self, f, dtype=None, kind=None):
+        """Return the nodal interpolant of *f*.
+
+        By default, *f* is called as ``f(x, el)`` for each node, where *x* is
+        the node's coordinate vector and *el* the
+        :class:`hedge.mesh.element.Element` it belongs to. If *f* has an
+        attribute *supports_arrays* that is *True*, it is instead called
+        only once as ``f(x, el_ids)``, where *x* is the *(d, n_nodes)* array
+        of all node coordinates and *el_ids* is the array returned by
+        :meth:`node_element_ids`. See also :class:`ArrayFunction`.
+
+        If *f* has a *shape* attribute, an object array of that shape is
+        returned, each entry of which is a volume vector.
+        """
         if kind is None:
             kind = self.compute_kind
 
@@ -974,8 +1081,14 @@ class Discretization(TimestepCalculator):
             # no, just one
             shape = ()
 
-        slice_pfx = (slice(None),) * len(shape)
         out = self.volume_empty(shape, dtype, kind="numpy")
+
+        if getattr(f, "supports_arrays", False):
+            self._fill_from_array_function(out, shape, f,
+                    self.nodes.T, self.node_element_ids())
+            return self.convert_volume(out, kind=kind)
+
+        slice_pfx = (slice(None),) * len(shape)
         for eg in self.element_groups:
             for el, el_slice in zip(eg.members, eg.ranges):
                 for point_nr in xrange(el_slice.start, el_slice.stop):
@@ -1000,6 +1113,13 @@ class Discretization(TimestepCalculator):
         return np.zeros(shape + (len(self.get_boundary(tag).nodes),), dtype)
 
     def interpolate_boundary_function(self, f, tag, dtype=None, kind=None):
+        """Return the interpolant of *f* on the boundary tagged *tag*.
+
+        *f* is treated as in :meth:`interpolate_volume_function`, except
+        that it receives *None* in place of the element in the per-node
+        case, and the array returned by :meth:`boundary_node_element_ids`
+        in the array case.
+        """
         if kind is None:
             kind = self.compute_kind
 
@@ -1011,6 +1131,13 @@ class Discretization(TimestepCalculator):
             shape = ()
 
         out = self.boundary_zeros(tag, shape, dtype, kind="numpy")
+
+        if getattr(f, "supports_arrays", False):
+            self._fill_from_array_function(out, shape, f,
+                    self.get_boundary(tag).nodes.T,
+                    self.boundary_node_element_ids(tag))
+            return self.convert_boundary(out, tag, kind)
+
         slice_pfx = (slice(None),) * len(shape)
         for point_nr, x in enumerate(self.get_boundary(tag).nodes):
             out[slice_pfx + (point_nr,)] = f(x, None)  # FIXME
@@ -1248,26 +1375,63 @@ class Discretization(TimestepCalculator):
                 "point %s not found. Consider changing threshold."
                 % point)
 
+    @memoize_method
+    def _get_regrid_operator_cache(self):
+        from weakref import WeakKeyDictionary
+        return WeakKeyDictionary()
+
+    def get_regrid_operator(self, new_discr, thresh=0, index="grid"):
+        """Return a :class:`hedge.discretization.sampling.RegridOperator`
+        interpolating volume fields from this discretization to *new_discr*.
+
+        Operators are cached per *new_discr*, which is only weakly
+        referenced, so the cache entry goes away along with *new_discr*.
+        """
+        per_target = self._get_regrid_operator_cache().setdefault(
+                new_discr, {})
+        try:
+            return per_target[thresh, index]
+        except KeyError:
+            from hedge.discretization.sampling import RegridOperator
+            result = per_target[thresh, index] = RegridOperator(
+                    self, new_discr, thresh,
+                    locator=self.get_element_locator(index))
+            return result
+
     def get_regrid_values(self, field_in, new_discr, dtype=None,
             use_btree=True, thresh=0):
         """:param field_in: nodal values on old grid.
         :param new_discr: new discretization.
-        :param use_btree: bool to decide if a spatial binary tree will be used.
+        :param dtype: the scalar type of the result. Defaults to the
+            *default_scalar_type* of *new_discr*.
+        :param use_btree: ignored, retained for compatibility. Points are
+            always located using :meth:`get_element_locator`.
+
+        The transfer operator is cached, see :meth:`get_regrid_operator`.
         """
 
         if self.get_kind(field_in) != "numpy":
             raise NotImplementedError(
                     "get_regrid_values needs numpy input field")
 
-        def regrid(scalar_field):
-            result = new_discr.volume_empty(dtype=dtype, kind="numpy")
-            for ii in range(len(new_discr.nodes)):
-                pe = self.get_point_evaluator(new_discr.nodes[ii], use_btree, thresh)
-                result[ii] = pe(scalar_field)
-            return result
+        return self.get_regrid_operator(new_discr, thresh)(field_in, dtype)
+
+    @memoize_method
+    def get_element_locator(self, index="grid"):
+        """Return a :class:`hedge.discretization.sampling.ElementLocator`
+        for this discretization.
+        """
+        from hedge.discretization.sampling import ElementLocator
+        return ElementLocator(self, index)
 
-        from pytools.obj_array import with_object_array_or_scalar
-        return with_object_array_or_scalar(regrid, field_in)
+    def get_point_sampler(self, points, thresh=0, index="grid"):
+        """Return a :class:`hedge.discretization.sampling.PointSampler`
+        evaluating volume fields at *points*, an array of shape
+        *(n_points, d)*.
+        """
+        from hedge.discretization.sampling import PointSampler
+        return PointSampler(self, points, thresh,
+                locator=self.get_element_locator(index))
 
     @memoize_method
     def get_spatial_btree(self):
@@ -111,16 +111,144 @@ class TriangleWarper:
 # }}}
 
 
+# {{{ persistent matrix cache -------------------------------------------------
+
+MATRIX_CACHE_VERSION = 1
+"""Bump this whenever the construction of any cached local matrix changes."""
+
+
+def node_set_digest(*node_sets):
+    """Return a hex digest identifying the given sequences of nodes (or
+    weights). Used to key persistent caches, so that a change in a node set
+    leads to a cache miss instead of stale matrices.
+    """
+    from hashlib import sha1
+    checksum = sha1()
+    for nodes in node_sets:
+        nodes = numpy.asarray(nodes, dtype=numpy.float64)
+        checksum.update(str(nodes.shape))
+        checksum.update(numpy.ascontiguousarray(nodes).tostring())
+
+    return checksum.hexdigest()
+
+
+_matrix_cache = []
+
+
+def get_matrix_cache():
+    """Return the on-disk cache of local operator matrices, or *None* if
+    it has been disabled by setting the environment variable
+    :envvar:`HEDGE_NO_MATRIX_CACHE` or is not available.
+
+    The cache directory may be set using :envvar:`HEDGE_MATRIX_CACHE_DIR`.
+    Since entries are written atomically and guarded by lock files, the
+    cache may be shared by concurrently running processes, e.g. the
+    ranks of an MPI job.
+    """
+    if _matrix_cache:
+        return _matrix_cache[0]
+
+    import os
+    result = None
+    if not os.environ.get("HEDGE_NO_MATRIX_CACHE"):
+        try:
+            from pytools.persistent_dict import PersistentDict
+        except ImportError:
+            pass
+        else:
+            try:
+                result = PersistentDict(
+                        "hedge-local-matrices-v%d" % MATRIX_CACHE_VERSION,
+                        container_dir=os.environ.get("HEDGE_MATRIX_CACHE_DIR"))
+            except (OSError, IOError), e:
+                from warnings import warn
+                warn("local matrix cache unavailable: %s" % e)
+
+    _matrix_cache.append(result)
+    return result
+
+
+def persistent_matrix(method):
+    """Decorator for argument-less methods of objects providing a
+    :meth:`matrix_cache_key` that looks up the method's result in the
+    on-disk cache returned by :func:`get_matrix_cache` before computing it.
+
+    Combine with :func:`pytools.memoize_method` for in-process caching.
+    """
+    from functools import wraps
+
+    @wraps(method)
+    def wrapper(self):
+        cache = get_matrix_cache()
+        if cache is None:
+            return method(self)
+
+        key = (MATRIX_CACHE_VERSION, self.matrix_cache_key(), method.__name__)
+        try:
+            return cache.fetch(key)
+        except KeyError:
+            pass
+
+        result = method(self)
+
+        try:
+            cache.store(key, result)
+        except (OSError, IOError), e:
+            from warnings import warn
+            warn("could not store local matrix in cache: %s" % e)
+
+        return result
+
+    return wrapper
+
+# }}}
+
+
 TriangleBasisFunction = hedge._internal.TriangleBasisFunction
 GradTriangleBasisFunction = hedge._internal.GradTriangleBasisFunction
 TetrahedronBasisFunction = hedge._internal.TetrahedronBasisFunction
 GradTetrahedronBasisFunction = hedge._internal.GradTetrahedronBasisFunction
 
 
+# {{{ face index shuffles ----------------------------------------------------
+
+class FaceIndexShuffle:
+    def __init__(self, vert_perm, idx_map):
+        self.vert_perm = vert_perm
+        self.idx_map = idx_map
+
+    def __hash__(self):
+        return hash(self.vert_perm)
+
+    def __eq__(self, other):
+        return self.vert_perm == other.vert_perm
+
+    def __call__(self, indices):
+        return tuple(indices[i] for i in self.idx_map)
+
+
+def make_face_index_shuffle_lookup_map(idx_maps):
+    return dict(
+            (vert_perm, FaceIndexShuffle(vert_perm, idx_map))
+            for vert_perm, idx_map in idx_maps.iteritems())
+
+# }}}
+
+
 # {{{ base classes ------------------------------------------------------------
 # {{{ generic base classes ----------------------------------------------------
 class LocalDiscretization(object):
     # {{{ numbering -----------------------------------------------------------
+    @memoize_method
+    def matrix_cache_key(self):
+        """Return a key identifying this discretization's local matrices
+        in the persistent cache. Includes a digest of :meth:`unit_nodes`,
+        so that cached matrices are invalidated when the node set changes.
+        """
+        cls = type(self)
+        return (cls.__module__, cls.__name__, self.dimensions, self.order,
+                node_set_digest(self.unit_nodes()))
+
     @memoize_method
     def face_count(self):
         return len(self.face_indices())
@@ -133,6 +261,7 @@ class LocalDiscretization(object):
 
     # {{{ matrices ------------------------------------------------------------
     @memoize_method
+    @persistent_matrix
     def vandermonde(self):
         from hedge.polynomial import generic_vandermonde
 
@@ -169,6 +298,7 @@ class LocalDiscretization(object):
         return result
 
     @memoize_method
+    @persistent_matrix
     def multi_face_mass_matrix(self):
         """Return a matrix that combines the effect of multiple face
         mass matrices applied to a vector of the shape::
@@ -181,6 +311,7 @@ class LocalDiscretization(object):
         return self._assemble_multi_face_mass_matrix(self.face_mass_matrix())
 
     @memoize_method
+    @persistent_matrix
     def lifting_matrix(self):
         """Return a matrix that combines the effect of the inverse
         mass matrix applied after the multi-face mass matrix to a vector
@@ -226,6 +357,7 @@ class LocalDiscretization(object):
 
 class OrthonormalLocalDiscretization(LocalDiscretization):
     @memoize_method
+    @persistent_matrix
     def inverse_mass_matrix(self):
         """Return the inverse of the mass matrix of the unit element
         with respect to the nodal coefficients. Divide by the Jacobian
@@ -237,6 +369,7 @@ class OrthonormalLocalDiscretization(LocalDiscretization):
         return numpy.dot(v, v.T)
 
     @memoize_method
+    @persistent_matrix
     def mass_matrix(self):
         """Return the mass matrix of the unit element with respect
         to the nodal coefficients. Multiply by the Jacobian to obtain
@@ -246,6 +379,7 @@ class OrthonormalLocalDiscretization(LocalDiscretization):
         return numpy.asarray(la.inv(self.inverse_mass_matrix()), order="C")
 
     @memoize_method
+    @persistent_matrix
     def differentiation_matrices(self):
         """Return matrices that map the nodal values of a function
         to the nodal values of its derivative in each of the unit
@@ -348,6 +482,7 @@ class PkSimplexDiscretization(OrthonormalLocalDiscretization):
                 self.face_basis())
 
     @memoize_method
+    @persistent_matrix
     def face_mass_matrix(self):
         face_vdm = self.face_vandermonde()
 
@@ -398,7 +533,10 @@ class PkSimplexDiscretization(OrthonormalLocalDiscretization):
                 for to_points in sets_of_to_points]
 
     # {{{ face matching
-    def get_face_index_shuffle_lookup_map_for_nodes(self, face_nodes):
+    def get_face_index_shuffle_idx_maps_for_nodes(self, face_nodes):
+        """Return a dictionary mapping each permutation of the face
+        vertices to the corresponding index map of *face_nodes*.
+        """
         first_face_vertex_node_index_lists = \
                 self.geometry.face_vertices(self.vertex_indices())[0]
 
@@ -410,20 +548,6 @@ class PkSimplexDiscretization(OrthonormalLocalDiscretization):
         face_unit_vertices = [check_and_chop(unodes[i])
                 for i in first_face_vertex_node_index_lists]
 
-        class FaceIndexShuffle:
-            def __init__(self, vert_perm, idx_map):
-                self.vert_perm = vert_perm
-                self.idx_map = idx_map
-
-            def __hash__(self):
-                return hash(self.vert_perm)
-
-            def __eq__(self, other):
-                return self.vert_perm == other.vert_perm
-
-            def __call__(self, indices):
-                return tuple(indices[i] for i in self.idx_map)
-
         result = {}
 
         from pytools import generate_unique_permutations
@@ -440,12 +564,17 @@ class PkSimplexDiscretization(OrthonormalLocalDiscretization):
             imap = find_index_map_from_node_sets(
                     face_nodes, [amap(node) for node in face_nodes])
 
-            result[vert_perm] = FaceIndexShuffle(vert_perm, imap)
+            result[vert_perm] = tuple(imap)
 
         return result
 
+    def get_face_index_shuffle_lookup_map_for_nodes(self, face_nodes):
+        return make_face_index_shuffle_lookup_map(
+                self.get_face_index_shuffle_idx_maps_for_nodes(face_nodes))
+
     @memoize_method
-    def get_face_index_shuffle_lookup_map(self):
+    @persistent_matrix
+    def get_face_index_shuffle_idx_maps(self):
         def check_and_chop(pt):
             assert abs(pt[-1] - (-1)) < 1e-13
             return pt[:-1]
@@ -455,7 +584,12 @@ class PkSimplexDiscretization(OrthonormalLocalDiscretization):
                 check_and_chop(unodes[i])
                 for i in self.face_indices()[0]]
 
-        return self.get_face_index_shuffle_lookup_map_for_nodes(face_unit_nodes)
+        return self.get_face_index_shuffle_idx_maps_for_nodes(face_unit_nodes)
+
+    @memoize_method
+    def get_face_index_shuffle_lookup_map(self):
+        return make_face_index_shuffle_lookup_map(
+                self.get_face_index_shuffle_idx_maps())
 
     def get_face_index_shuffle_backend(self, face_1_vertices, face_2_vertices,
             lookup_map):
@@ -565,6 +699,14 @@ class PkSimplexDiscretization(OrthonormalLocalDiscretization):
         def face_node_count(self):
             return len(self.face_nodes)
 
+        @memoize_method
+        def matrix_cache_key(self):
+            return self.ldis.matrix_cache_key() + (
+                    "quadrature", self.exact_to_degree,
+                    node_set_digest(
+                        self.volume_nodes, self.volume_weights,
+                        self.face_nodes, self.face_weights))
+
         @memoize_method
         def face_indices(self):
             """Return a list of face index lists. Each face index list contains
@@ -592,6 +734,7 @@ class PkSimplexDiscretization(OrthonormalLocalDiscretization):
                     list(self.ldis.face_basis()))
 
         @memoize_method
+        @persistent_matrix
         def volume_up_interpolation_matrix(self):
             from hedge.tools.linalg import leftsolve
             return numpy.asarray(
@@ -608,6 +751,7 @@ class PkSimplexDiscretization(OrthonormalLocalDiscretization):
                     list(self.ldis.grad_basis_functions()))
 
         @memoize_method
+        @persistent_matrix
         def volume_to_face_up_interpolation_matrix(self):
             """Generate a matrix that maps volume nodal values to
             a vector of face nodal values on the quadrature grid, with
@@ -633,6 +777,7 @@ class PkSimplexDiscretization(OrthonormalLocalDiscretization):
             return leftsolve(self.ldis.vandermonde(), vdm)
 
         @memoize_method
+        @persistent_matrix
         def face_up_interpolation_matrix(self):
             from hedge.tools.linalg import leftsolve
             return leftsolve(
@@ -640,6 +785,7 @@ class PkSimplexDiscretization(OrthonormalLocalDiscretization):
                         self.face_vandermonde())
 
         @memoize_method
+        @persistent_matrix
         def mass_matrix(self):
             return numpy.asarray(
                     la.solve(
@@ -650,6 +796,7 @@ class PkSimplexDiscretization(OrthonormalLocalDiscretization):
                     order="C")
 
         @memoize_method
+        @persistent_matrix
         def stiffness_t_matrices(self):
             return [numpy.asarray(
                 la.solve(
@@ -661,6 +808,7 @@ class PkSimplexDiscretization(OrthonormalLocalDiscretization):
                     for diff_vdm in self.diff_vandermonde_matrices()]
 
         @memoize_method
+        @persistent_matrix
         def face_mass_matrix(self):
             return numpy.asarray(
                     la.solve(
@@ -671,6 +819,7 @@ class PkSimplexDiscretization(OrthonormalLocalDiscretization):
                     order="C")
 
         @memoize_method
+        @persistent_matrix
         def multi_face_mass_matrix(self):
             z = self.ldis._assemble_multi_face_mass_matrix(
                     self.face_mass_matrix())
@@ -679,10 +828,16 @@ class PkSimplexDiscretization(OrthonormalLocalDiscretization):
 
         # {{{ face matching
         @memoize_method
-        def get_face_index_shuffle_lookup_map(self):
-            return self.ldis.get_face_index_shuffle_lookup_map_for_nodes(
+        @persistent_matrix
+        def get_face_index_shuffle_idx_maps(self):
+            return self.ldis.get_face_index_shuffle_idx_maps_for_nodes(
                     self.face_nodes)
 
+        @memoize_method
+        def get_face_index_shuffle_lookup_map(self):
+            return make_face_index_shuffle_lookup_map(
+                    self.get_face_index_shuffle_idx_maps())
+
         def get_face_index_shuffle_to_match(self, face_1_vertices, face_2_vertices):
             return self.ldis.get_face_index_shuffle_backend(
                     face_1_vertices, face_2_vertices,
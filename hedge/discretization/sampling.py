@@ -0,0 +1,323 @@
+"""Batched location of points and evaluation of volume fields."""
+
+from __future__ import division
+
+__copyright__ = "Copyright (C) 2007 Andreas Kloeckner"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import numpy as np
+import numpy.linalg as la
+
+
+# {{{ element location
+
+class ElementLocator(object):
+    """Finds the elements of a :class:`hedge.discretization.Discretization`
+    that contain a batch of points.
+
+    Elements are indexed by their centroids. Since a point contained in an
+    element is never further from its centroid than the largest
+    centroid-to-vertex distance *r* in the mesh, candidates are gathered
+    from centroids within that distance, using either a uniform grid with
+    cells slightly larger than *r* (*index* = ``"grid"``) or a
+    :class:`scipy.spatial.cKDTree` (*index* = ``"kdtree"``). The candidates
+    are then checked all at once by mapping the points to unit coordinates.
+
+    Elements are numbered consecutively across element groups, in the
+    order of :attr:`Discretization.element_groups`.
+
+    .. attribute:: group_numbers
+
+        The number of the element group of each element.
+
+    .. attribute:: node_starts
+
+        The index of the first volume node of each element.
+    """
+
+    def __init__(self, discr, index="grid"):
+        if index not in ["grid", "kdtree"]:
+            raise ValueError("unknown element index type '%s'" % index)
+
+        from hedge.mesh.element import SimplicialElement
+
+        self.discr = discr
+        self.index = index
+        self.dimensions = dim = discr.dimensions
+
+        inv_matrices = []
+        inv_vectors = []
+        vertex_indices = []
+        group_numbers = []
+        node_starts = []
+        for igrp, eg in enumerate(discr.element_groups):
+            for el in eg.members:
+                if not isinstance(el, SimplicialElement):
+                    raise NotImplementedError(
+                            "point location in non-simplicial elements")
+
+                inv_matrices.append(el.inverse_map.matrix)
+                inv_vectors.append(el.inverse_map.vector)
+                vertex_indices.append(el.vertex_indices)
+
+            group_numbers.append(np.empty(len(eg.members), dtype=np.intp))
+            group_numbers[-1].fill(igrp)
+            node_starts.append(eg.ranges.start
+                    + eg.ranges.el_size*np.arange(len(eg.members), dtype=np.intp))
+
+        self.inverse_matrices = np.array(inv_matrices, dtype=np.float64) \
+                .reshape(-1, dim, dim)
+        self.inverse_vectors = np.array(inv_vectors, dtype=np.float64) \
+                .reshape(-1, dim)
+        self.group_numbers = np.hstack(group_numbers)
+        self.node_starts = np.hstack(node_starts)
+
+        el_vertices = np.asarray(discr.mesh.points, dtype=np.float64)[
+                np.array(vertex_indices, dtype=np.intp)]
+        self.centroids = np.average(el_vertices, axis=1)
+        self.search_radius = np.sqrt(np.max(np.sum(
+            (el_vertices - self.centroids[:, np.newaxis, :])**2, axis=-1)))
+
+        if index == "grid":
+            # leave some slack for points admitted by a nonzero threshold
+            self.grid_spacing = 1.1*self.search_radius
+            self.grid_origin = np.min(self.centroids, axis=0)
+            self.grid_shape = np.asarray(np.floor(
+                (np.max(self.centroids, axis=0) - self.grid_origin)
+                / self.grid_spacing), dtype=np.intp) + 1
+
+            cell_keys = self._get_cell_keys(self._get_cells(self.centroids))
+            self.sorted_element_numbers = np.argsort(cell_keys, kind="mergesort")
+            self.sorted_cell_keys = cell_keys[self.sorted_element_numbers]
+        elif index == "kdtree":
+            from scipy.spatial import cKDTree
+            self.kdtree = cKDTree(self.centroids)
+
+    def __len__(self):
+        return len(self.centroids)
+
+    def _get_cells(self, points):
+        return np.asarray(np.floor(
+            (points - self.grid_origin) / self.grid_spacing), dtype=np.intp)
+
+    def _get_cell_keys(self, cells):
+        return np.ravel_multi_index(tuple(cells.T), self.grid_shape)
+
+    def _get_candidates(self, points, thresh):
+        """Return a tuple *(point_numbers, element_numbers)* of pairs
+        that need to be checked for containment.
+        """
+        if self.index == "grid":
+            from pytools import generate_nonnegative_integer_tuples_below
+            from hedge.tools.indexing import expand_ranges
+            cells = self._get_cells(points)
+
+            point_numbers = []
+            element_numbers = []
+            for offset in generate_nonnegative_integer_tuples_below(
+                    3, self.dimensions):
+                nb_cells = cells + np.array(offset, dtype=np.intp) - 1
+                valid = np.all((nb_cells >= 0) & (nb_cells < self.grid_shape),
+                        axis=1)
+                valid_nrs, = np.where(valid)
+                nb_keys = self._get_cell_keys(nb_cells[valid])
+
+                owners, sorted_idx = expand_ranges(
+                        np.searchsorted(self.sorted_cell_keys, nb_keys, "left"),
+                        np.searchsorted(self.sorted_cell_keys, nb_keys, "right"))
+                point_numbers.append(valid_nrs[owners])
+                element_numbers.append(self.sorted_element_numbers[sorted_idx])
+
+            return np.hstack(point_numbers), np.hstack(element_numbers)
+        else:
+            candidates = self.kdtree.query_ball_point(
+                    points, self.search_radius*(1+thresh))
+            counts = np.fromiter((len(c) for c in candidates), dtype=np.intp,
+                    count=len(candidates))
+            point_numbers = np.repeat(np.arange(len(points)), counts)
+            element_numbers = np.fromiter(
+                    (el_nr for c in candidates for el_nr in c), dtype=np.intp,
+                    count=counts.sum())
+            return point_numbers, element_numbers
+
+    def to_unit(self, points, element_numbers):
+        """Map each of *points* to the unit coordinates of the element given
+        by the corresponding entry of *element_numbers*.
+        """
+        return (np.einsum("nij,nj->ni",
+                self.inverse_matrices[element_numbers], points)
+                + self.inverse_vectors[element_numbers])
+
+    def locate(self, points, thresh=0, chunk_size=10000):
+        """Return an array containing, for each row of the *(n_points, d)*
+        array *points*, the number of an element containing it, or -1 if
+        no element was found. *thresh* has the same meaning as in
+        :meth:`hedge.mesh.element.SimplicialElement.contains_point`.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if len(points.shape) != 2 or points.shape[1] != self.dimensions:
+            raise ValueError("points must be an array of shape (n_points, %d)"
+                    % self.dimensions)
+
+        el_count = len(self)
+        result = np.empty(len(points), dtype=np.intp)
+        result.fill(el_count)
+
+        for chunk_start in xrange(0, len(points), chunk_size):
+            chunk = points[chunk_start:chunk_start+chunk_size]
+            pt_nrs, el_nrs = self._get_candidates(chunk, thresh)
+
+            unit_coords = self.to_unit(chunk[pt_nrs], el_nrs)
+            inside = (
+                    np.all(unit_coords >= -1-thresh, axis=1)
+                    & (np.sum(unit_coords, axis=1)
+                        <= -(self.dimensions-2)+thresh))
+
+            # prefer the lowest-numbered element for points on interfaces
+            np.minimum.at(result, chunk_start+pt_nrs[inside], el_nrs[inside])
+
+        result[result == el_count] = -1
+        return result
+
+# }}}
+
+
+# {{{ point sampler
+
+class PointSampler(object):
+    """Evaluates volume fields of a :class:`hedge.discretization.Discretization`
+    at a fixed set of points.
+
+    Upon construction, the points are located and a sparse matrix
+    interpolating from the volume nodes to the points is built, so that
+    each subsequent evaluation amounts to one sparse matrix-vector product
+    per field. Requires :mod:`scipy`.
+
+    .. attribute:: points
+
+        The *(n_points, d)* array of sample points.
+
+    .. attribute:: element_numbers
+
+        For each point, the number of the containing element in the
+        numbering of :class:`ElementLocator`.
+
+    .. attribute:: matrix
+
+        A :class:`scipy.sparse.csr_matrix` of shape *(n_points, len(discr))*.
+    """
+
+    def __init__(self, discr, points, thresh=0, locator=None):
+        """
+        :param points: an array of shape *(n_points, d)*.
+        :param locator: an :class:`ElementLocator` for *discr*. If not given,
+          the one returned by :meth:`Discretization.get_element_locator` is
+          used.
+        """
+        if locator is None:
+            locator = discr.get_element_locator()
+
+        self.discr = discr
+        self.points = points = np.asarray(points, dtype=np.float64)
+        self.element_numbers = el_nrs = locator.locate(points, thresh)
+
+        missing_count = np.sum(el_nrs < 0)
+        if missing_count:
+            raise RuntimeError(
+                    "%d of %d points not found (e.g. %s). "
+                    "Consider changing threshold."
+                    % (missing_count, len(points),
+                        points[np.where(el_nrs < 0)[0][0]]))
+
+        from hedge.polynomial import generic_vandermonde
+
+        rows = []
+        columns = []
+        data = []
+        for igrp, eg in enumerate(discr.element_groups):
+            pt_nrs, = np.where(locator.group_numbers[el_nrs] == igrp)
+            if not len(pt_nrs):
+                continue
+
+            ldis = eg.local_discretization
+            unit_points = locator.to_unit(points[pt_nrs], el_nrs[pt_nrs])
+            basis_values = generic_vandermonde(
+                    unit_points, list(ldis.basis_functions()))
+
+            # interpolation coefficients for all points in one solve
+            coefficients = la.solve(ldis.vandermonde().T, basis_values.T).T
+
+            node_count = ldis.node_count()
+            rows.append(np.repeat(pt_nrs, node_count))
+            columns.append((locator.node_starts[el_nrs[pt_nrs]][:, np.newaxis]
+                + np.arange(node_count)).ravel())
+            data.append(coefficients.ravel())
+
+        from scipy.sparse import csr_matrix
+        self.matrix = csr_matrix(
+                (np.hstack(data), (np.hstack(rows), np.hstack(columns))),
+                shape=(len(points), len(discr)))
+
+    def __call__(self, field):
+        """Return the values of *field*, a volume vector or an object array
+        of them, at :attr:`points`.
+        """
+        def sample(subfield):
+            return self.matrix * self.discr.convert_volume(
+                    subfield, kind="numpy")
+
+        from pytools.obj_array import with_object_array_or_scalar
+        return with_object_array_or_scalar(sample, field)
+
+# }}}
+
+# {{{ regridding
+
+class RegridOperator(PointSampler):
+    """Interpolates volume fields from one
+    :class:`hedge.discretization.Discretization` onto the nodes of another.
+
+    The transfer is stored as a sparse matrix, so that an instance may be
+    reused for as long as the pair of discretizations stays the same.
+    No reference to the target discretization is kept.
+    """
+
+    def __init__(self, from_discr, to_discr, thresh=0, locator=None):
+        PointSampler.__init__(self, from_discr, to_discr.nodes, thresh, locator)
+        self.default_dtype = to_discr.default_scalar_type
+
+    def __call__(self, field, dtype=None):
+        """Return *field*, a volume vector of the source discretization or an
+        object array of them, interpolated to the target discretization.
+
+        :param dtype: the scalar type of the result. Defaults to the
+          *default_scalar_type* of the target discretization.
+        """
+        if dtype is None:
+            dtype = self.default_dtype
+
+        from hedge.tools import cast_field
+        return cast_field(PointSampler.__call__(self, field), dtype)
+
+# }}}
+
+# vim: foldmethod=marker
@@ -67,6 +67,29 @@ namespace hedge {
 
 
 
+  // threading ----------------------------------------------------------------
+  /* Releases the Python global interpreter lock for as long as it is in
+   * scope, so that element-local kernels may run on several threads of
+   * one rank. Nothing in its scope may touch Python objects, not even
+   * reference counts--so don't copy numpy_vectors there.
+   */
+  class scoped_gil_release
+  {
+    private:
+      PyThreadState *m_thread_state;
+
+    public:
+      scoped_gil_release()
+        : m_thread_state(PyEval_SaveThread())
+      { }
+
+      ~scoped_gil_release()
+      { PyEval_RestoreThread(m_thread_state); }
+  };
+
+
+
+
   // basic linear algebra -----------------------------------------------------
   /* Matrix inversion 
    * Modified from original by Fredrik Orderud. 
@@ -206,12 +206,188 @@ class CGStateContainer:
 
 
 
+class SumReduction(object):
+    """Sums the rank-local values *local_values* across all ranks of
+    *communicator*, which may be *None* for serial runs. The reduction
+    proceeds in the background if MPI supports nonblocking collectives.
+    """
+
+    def __init__(self, communicator, local_values):
+        self.send_buf = numpy.array(local_values)
+        self.request = None
+
+        if communicator is None:
+            self.result = self.send_buf
+            return
+
+        import pytools.mpiwrap as mpi
+        recv_buf = numpy.empty_like(self.send_buf)
+        if hasattr(communicator, "Iallreduce"):
+            self.request = communicator.Iallreduce(
+                    self.send_buf, recv_buf, op=mpi.SUM)
+            self.recv_buf = recv_buf
+            self.result = None
+        else:
+            communicator.Allreduce(self.send_buf, recv_buf, op=mpi.SUM)
+            self.result = recv_buf
+
+    def wait(self):
+        """Return the reduced values, waiting for them if necessary."""
+        if self.result is None:
+            self.request.Wait()
+            self.result = self.recv_buf
+            self.request = None
+
+        return self.result
+
+
+
+
+class PipelinedCGStateContainer(CGStateContainer):
+    """Preconditioned conjugate gradients with one fused reduction per
+    iteration, which overlaps with an application of the preconditioner and
+    the operator.
+
+    This is the pipelined variant of the Chronopoulos-Gear method from
+    P. Ghysels and W. Vanroose, Hiding global synchronization latency in
+    the preconditioned Conjugate Gradient algorithm, Parallel Computing 40
+    (2014). It needs three more vector updates per iteration than
+    :class:`CGStateContainer`, and its recurrences drift further from the
+    true residual, which is why the true residual is recomputed together
+    with all auxiliary vectors whenever *compute_real_residual* is passed.
+
+    *dot* computes the contribution of this rank to an inner product. The
+    contributions are summed across the ranks of *communicator*, if given.
+    """
+
+    def __init__(self, operator, precon=None, dot=None, communicator=None):
+        CGStateContainer.__init__(self, operator, precon, dot=dot)
+
+        self.communicator = communicator
+        self.reduction_count = 0
+
+        local_inner = self.inner
+
+        def inner(a, b):
+            return self.reduce_sums([local_inner(a, b)]).wait()[0]
+
+        self.local_inner = local_inner
+        self.inner = inner
+
+    def reduce_sums(self, local_values):
+        self.reduction_count += 1
+        return SumReduction(self.communicator, local_values)
+
+    def _start_reduction(self):
+        # gamma = (r, M r), delta = (A M r, M r)
+        self.reduction = self.reduce_sums([
+            self.local_inner(self.residual, self.u),
+            self.local_inner(self.w, self.u)])
+
+    def _replace_residual(self):
+        self.residual = self.rhs - self.operator(self.x)
+        self.u = self.precon(self.residual)
+        self.w = self.operator(self.u)
+
+        if self.d is not None:
+            self.s = self.operator(self.d)
+            self.q = self.precon(self.s)
+            self.z = self.operator(self.q)
+
+    def reset(self, rhs, x=None):
+        self.rhs = rhs
+
+        if x is None:
+            x = numpy.zeros((self.operator.shape[0],))
+        self.x = x
+
+        self.d = None
+        self.alpha = None
+        self._replace_residual()
+        self._start_reduction()
+
+        self.delta = self.gamma = self.reduction.wait()[0]
+        return self.delta
+
+    def one_iteration(self, compute_real_residual=False):
+        """Carry out one iteration and return the preconditioned residual
+        norm *(r, M r)*. This is only up to date if *compute_real_residual*
+        is passed, otherwise it is that of the residual before the
+        iteration.
+        """
+        # overlaps with the reduction started at the end of the last
+        # iteration
+        m = self.precon(self.w)
+        n = self.operator(m)
+
+        gamma, delta = self.reduction.wait()
+
+        if self.d is None:
+            beta = 0
+            alpha = gamma / delta
+
+            self.z = n
+            self.q = m
+            self.s = self.w
+            self.d = self.u
+        else:
+            beta = gamma / self.gamma
+            alpha = gamma / (delta - beta * gamma / self.alpha)
+
+            self.z = n + beta * self.z
+            self.q = m + beta * self.q
+            self.s = self.w + beta * self.s
+            self.d = self.u + beta * self.d
+
+        self.gamma = gamma
+        self.alpha = alpha
+
+        self.x += alpha * self.d
+
+        if compute_real_residual:
+            self._replace_residual()
+        else:
+            # not in place: the preconditioner may return its argument
+            self.residual = self.residual - alpha * self.s
+            self.u = self.u - alpha * self.q
+            self.w = self.w - alpha * self.z
+
+        self._start_reduction()
+
+        if compute_real_residual:
+            self.delta = self.reduction.wait()[0]
+        else:
+            self.delta = gamma
+
+        return self.delta
+
+
+
+
 def parallel_cg(pcon, operator, b, precon=None, x=None, tol=1e-7, max_iterations=None,
-        debug=False, debug_callback=None, dot=None):
+        debug=False, debug_callback=None, dot=None, pipelined=False):
+    """Solve *operator(x) = b* by preconditioned conjugate gradients and
+    return *x*.
+
+    :param dot: computes inner products. By default, :func:`numpy.dot` is
+      used.
+    :param pipelined: if *True*, use :class:`PipelinedCGStateContainer`,
+      which needs one global reduction per iteration instead of two and
+      hides its latency behind the operator. *dot* must then compute only
+      the contribution of this rank to an inner product; the contributions
+      are summed across the communicator of *pcon*.
+    """
     if x is None:
         x = numpy.zeros((operator.shape[1],))
 
-    cg = CGStateContainer(operator, precon, dot=dot)
+    if pipelined:
+        if pcon.communicator is None and len(pcon.ranks) > 1:
+            raise ValueError("pipelined CG needs an MPI run context")
+
+        cg = PipelinedCGStateContainer(operator, precon, dot=dot,
+                communicator=pcon.communicator)
+    else:
+        cg = CGStateContainer(operator, precon, dot=dot)
     cg.reset(b, x)
 
     if not pcon.is_head_rank:
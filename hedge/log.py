@@ -26,6 +26,7 @@ THE SOFTWARE.
 
 
 from pytools.log import LogQuantity, MultiLogQuantity
+from contextlib import contextmanager
 import numpy as np
 
 
@@ -40,6 +41,24 @@ def axis_name(axis):
         raise RuntimeError("invalid axis index")
 
 
+@contextmanager
+def local_reductions(discr):
+    """Return a context manager within which norms and integrals on *discr*
+    are taken over this rank's part of a distributed discretization only.
+
+    Log quantities are aggregated across ranks by the
+    :class:`pytools.log.LogManager` (using their *default_aggregator*) in
+    the one gather it performs per watch tick, so they need no collective
+    operations of their own.
+    """
+    local_discr_reductions = getattr(discr, "local_reductions", None)
+    if local_discr_reductions is None:
+        yield
+    else:
+        with local_discr_reductions():
+            yield
+
+
 class Integral(LogQuantity):
     """Log the volume integral of a variable in a scope."""
 
@@ -76,12 +95,13 @@ class Integral(LogQuantity):
 
         from hedge.tools import log_shape
 
-        if len(log_shape(var)) == 1:
-            return sum(
-                    self.discr.integral(np.abs(v))
-                    for v in var)
-        else:
-            return self.discr.integral(var)
+        with local_reductions(self.discr):
+            if len(log_shape(var)) == 1:
+                return sum(
+                        self.discr.integral(np.abs(v))
+                        for v in var)
+            else:
+                return self.discr.integral(var)
 
 
 class LpNorm(LogQuantity):
@@ -124,7 +144,81 @@ class LpNorm(LogQuantity):
 
     def __call__(self):
         var = self.getter()
-        return self.discr.norm(var, self.p)
+        with local_reductions(self.discr):
+            return self.discr.norm(var, self.p)
+
+
+class OverlapEfficiency(LogQuantity):
+    """Log the fraction of futures, such as pending messages, that were
+    complete by the time the schedule needed their results, counted since
+    the previous log step. A value of 1 means that all communication was
+    hidden behind computation.
+    """
+
+    def __init__(self, codes, name="overlap_eff"):
+        """
+        :param codes: a collection of :class:`hedge.compiler.Code`
+          instances, which may grow later, such as the one maintained
+          by :class:`hedge.backends.mpi.ParallelDiscretization`.
+        """
+        LogQuantity.__init__(self, name, "1",
+                "Fraction of futures complete when needed")
+
+        self.codes = codes
+
+        from weakref import WeakKeyDictionary
+        self.last_counts = WeakKeyDictionary()
+
+    @property
+    def default_aggregator(self):
+        return min
+
+    def __call__(self):
+        future_count = 0
+        wait_count = 0
+        for code in list(self.codes):
+            last_future_count, last_wait_count = \
+                    self.last_counts.get(code, (0, 0))
+            future_count += code.future_count - last_future_count
+            wait_count += code.future_wait_count - last_wait_count
+            self.last_counts[code] = (
+                    code.future_count, code.future_wait_count)
+
+        if not future_count:
+            return 1
+
+        return 1 - wait_count/future_count
+
+
+class FutureWaitTime(LogQuantity):
+    """Log the wall time spent waiting for futures, such as pending
+    messages, since the previous log step.
+    """
+
+    def __init__(self, codes, name="t_future_wait"):
+        """
+        :param codes: a collection of :class:`hedge.compiler.Code`
+          instances, as for :class:`OverlapEfficiency`.
+        """
+        LogQuantity.__init__(self, name, "s",
+                "Time spent waiting for futures")
+
+        self.codes = codes
+
+        from weakref import WeakKeyDictionary
+        self.last_times = WeakKeyDictionary()
+
+    @property
+    def default_aggregator(self):
+        return max
+
+    def __call__(self):
+        result = 0
+        for code in list(self.codes):
+            result += code.future_wait_time - self.last_times.get(code, 0)
+            self.last_times[code] = code.future_wait_time
+
+        return result
 
 
 # {{{ electromagnetic quantities
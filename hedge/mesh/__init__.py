@@ -162,27 +162,119 @@ class Mesh(pytools.Record):
 
 
 
-def find_matching_vertices_along_axis(axis, points_a, points_b, numbers_a, numbers_b):
+def find_matching_vertices_along_axis(axis, points_a, points_b, numbers_a, numbers_b,
+        threshold=1e-12):
+    """Match up the vertices *points_a* and *points_b* whose coordinates
+    agree up to *threshold* except along *axis*.
+
+    Return a tuple *(a_to_b, not_found)*, where *a_to_b* maps entries of
+    *numbers_a* to their counterparts in *numbers_b*, and *not_found* lists
+    the entries of *numbers_a* for which no counterpart was found.
+    """
+    from hedge.tools.indexing import find_matching_points
+
+    if not len(points_a):
+        return {}, []
+
+    points_a = numpy.asarray(points_a, dtype=numpy.float64)
+    points_b = numpy.asarray(points_b, dtype=numpy.float64).reshape(
+            -1, points_a.shape[1])
+
+    b_indices = find_matching_points(
+            numpy.delete(points_a, axis, axis=1),
+            numpy.delete(points_b, axis, axis=1),
+            threshold)
+
     a_to_b = {}
     not_found = []
-
-    for i, pi in enumerate(points_a):
-        found = False
-        for j, pj in enumerate(points_b):
-            dist = pi-pj
-            dist[axis] = 0
-            if la.norm(dist) < 1e-12:
-                a_to_b[numbers_a[i]] = numbers_b[j]
-                found = True
-                break
-        if not found:
-            not_found.append(numbers_a[i])
+    for number_a, b_index in zip(numbers_a, b_indices):
+        if b_index >= 0:
+            a_to_b[number_a] = numbers_b[b_index]
+        else:
+            not_found.append(number_a)
 
     return a_to_b, not_found
 
 
 
 
+def find_face_connectivity(elements):
+    """Match up the faces of *elements* by sorting their vertex indices.
+
+    Return a tuple *(face_vertex_indices, interfaces, boundary_faces)*.
+    Faces are numbered so that face *fn* of ``elements[i]`` has number
+    ``i*face_count+fn``. *face_vertex_indices* is an integer array whose
+    row for each face number contains the face's vertex indices, in the
+    order given by :attr:`hedge.mesh.element.Element.faces`. *interfaces*
+    is an integer array of shape *(n_interfaces, 2)* containing the numbers
+    of pairs of matching faces, and *boundary_faces* is an integer array
+    containing the numbers of the faces that border only one element.
+    """
+    local_face_vertices = None
+    for el_class in set(type(el) for el in elements):
+        el_local_face_vertices = el_class.face_vertices(
+                range(el_class.dimensions+1))
+        if local_face_vertices is None:
+            local_face_vertices = el_local_face_vertices
+        elif local_face_vertices != el_local_face_vertices:
+            raise ValueError("all elements must have the same face structure")
+
+    el_vertex_indices = numpy.array(
+            [el.vertex_indices for el in elements], dtype=numpy.intp)
+    local_face_vertices = numpy.array(local_face_vertices, dtype=numpy.intp)
+    face_vertex_indices = el_vertex_indices[:, local_face_vertices].reshape(
+            -1, local_face_vertices.shape[1])
+
+    # bring identical faces next to each other
+    face_keys = numpy.sort(face_vertex_indices, axis=1)
+    order = numpy.lexsort(face_keys.T[::-1])
+    sorted_keys = face_keys[order]
+    same_as_next = numpy.all(sorted_keys[1:] == sorted_keys[:-1], axis=1)
+
+    if numpy.any(same_as_next[1:] & same_as_next[:-1]):
+        raise RuntimeError("face can at most border two elements")
+
+    pair_starts, = numpy.where(same_as_next)
+    interfaces = numpy.column_stack((order[pair_starts], order[pair_starts+1]))
+
+    is_boundary = numpy.ones(len(order), dtype=numpy.bool)
+    is_boundary[pair_starts] = False
+    is_boundary[pair_starts+1] = False
+
+    return face_vertex_indices, interfaces, order[is_boundary]
+
+
+
+
+def _get_boundary_face_tags(boundary_tagger, face_nrs, face_vertex_indices,
+        elements, points):
+    """Return a list of tag lists, one for each face in *face_nrs*."""
+    face_count = len(face_vertex_indices) // len(elements)
+    face_nrs = numpy.asarray(face_nrs, dtype=numpy.intp)
+    el_indices = face_nrs // face_count
+    face_indices = face_nrs % face_count
+
+    if getattr(boundary_tagger, "supports_arrays", False):
+        el_ids = numpy.array([el.id for el in elements], dtype=numpy.intp)
+        tag_to_mask = boundary_tagger(face_vertex_indices[face_nrs],
+                el_ids[el_indices], face_indices, points)
+
+        result = [[] for face_nr in face_nrs]
+        for tag, mask in tag_to_mask.iteritems():
+            for i in numpy.where(mask)[0]:
+                result[i].append(tag)
+        return result
+    else:
+        return [
+                boundary_tagger(
+                    frozenset(face_vertex_indices[face_nr]),
+                    elements[el_index], face_index, points)
+                for face_nr, el_index, face_index in zip(
+                    face_nrs, el_indices, face_indices)]
+
+
+
+
 def make_conformal_mesh_ext(points, elements,
         boundary_tagger=None,
         volume_tagger=None,
@@ -206,6 +298,14 @@ def make_conformal_mesh_ext(points, elements,
       in question, *el* is an :class:`Element` instance,
       *fn* is the face number within *el*, and *all_v* is 
       a list of all vertices.
+
+      If *boundary_tagger* has an attribute *supports_arrays* that is
+      *True*, it is instead called once for all faces as
+      *(fvi, el_ids, fns, all_v)*, where *fvi* is an integer array
+      of shape *(n_faces, n_face_vertices)*, and *el_ids* and *fns*
+      are integer arrays of element ids and face numbers. It must return
+      a dictionary mapping each tag to a boolean array of length
+      *n_faces* indicating which faces carry the tag.
     :param volume_tagger: A function of *(el, all_v)* 
       returning a list of volume tags for the element identified
       by the parameters.
@@ -255,13 +355,14 @@ def make_conformal_mesh_ext(points, elements,
             tag_to_elements.setdefault(el_tag, []).append(el)
         tag_to_elements[TAG_ALL].append(el)
 
-    # create face_map, which is a mapping of
-    # (vertices on a face) ->
-    #  [(element, face_idx) for elements bordering that face]
-    face_map = {}
-    for el in elements:
-        for fid, face_vertices in enumerate(el.faces):
-            face_map.setdefault(frozenset(face_vertices), []).append((el, fid))
+    # find face connectivity
+    face_vertex_indices, interface_faces, boundary_faces = \
+            find_face_connectivity(elements)
+    face_count = len(face_vertex_indices) // len(elements)
+
+    def get_el_face(face_nr):
+        el_index, face_index = divmod(int(face_nr), face_count)
+        return elements[el_index], face_index
 
     # build non-periodic connectivity structures
     interfaces = []
@@ -271,62 +372,66 @@ def make_conformal_mesh_ext(points, elements,
             TAG_REALLY_ALL: [],
             }
 
-    for face_vertices, els_faces in face_map.iteritems():
-        boundary_el_faces_tags = []
-        if len(els_faces) == 2:
-            if allow_internal_boundaries:
-                el_face_a, el_face_b = els_faces
-                el_a, face_a = el_face_a
-                el_b, face_b = el_face_b
-
-                tags_a = boundary_tagger(face_vertices, el_a, face_a, points)
-                tags_b = boundary_tagger(face_vertices, el_b, face_b, points)
-
-                if not tags_a and not tags_b:
-                    interfaces.append(els_faces)
-                elif tags_a and tags_b:
-                    boundary_el_faces_tags.append((el_face_a, tags_a))
-                    boundary_el_faces_tags.append((el_face_b, tags_b))
-                else:
-                    raise RuntimeError("boundary tagger is inconsistent "
-                            "about boundary-ness of interior interface")
+    boundary_el_faces_tags = []
+
+    if allow_internal_boundaries:
+        interface_tags = _get_boundary_face_tags(boundary_tagger,
+                interface_faces.ravel(), face_vertex_indices, elements, points)
+
+        for (face_a, face_b), tags_a, tags_b in zip(interface_faces,
+                interface_tags[::2], interface_tags[1::2]):
+            el_face_a = get_el_face(face_a)
+            el_face_b = get_el_face(face_b)
+
+            if not tags_a and not tags_b:
+                interfaces.append([el_face_a, el_face_b])
+            elif tags_a and tags_b:
+                boundary_el_faces_tags.append((el_face_a, tags_a))
+                boundary_el_faces_tags.append((el_face_b, tags_b))
             else:
-                interfaces.append(els_faces)
-        elif len(els_faces) == 1:
-            el_face = el, face = els_faces[0]
-            tags = boundary_tagger(face_vertices, el, face, points)
-            boundary_el_faces_tags.append((el_face, tags))
-        else:
-            raise RuntimeError("face can at most border two elements")
+                raise RuntimeError("boundary tagger is inconsistent "
+                        "about boundary-ness of interior interface")
+    else:
+        interfaces.extend(
+                [get_el_face(face_a), get_el_face(face_b)]
+                for face_a, face_b in interface_faces)
 
-        for el_face, tags in boundary_el_faces_tags:
-            el, face = el_face
-            tags = set(tags) - MESH_CREATION_TAGS
-            assert not isinstance(tags, str), \
-                RuntimeError("Received string as tag list")
-            assert TAG_ALL not in tags
-            assert TAG_REALLY_ALL not in tags
+    boundary_el_faces_tags.extend(zip(
+        [get_el_face(face_nr) for face_nr in boundary_faces],
+        _get_boundary_face_tags(boundary_tagger,
+            boundary_faces, face_vertex_indices, elements, points)))
 
-            for btag in tags:
-                tag_to_boundary.setdefault(btag, []) \
-                        .append(el_face)
+    for el_face, tags in boundary_el_faces_tags:
+        tags = set(tags) - MESH_CREATION_TAGS
+        assert not isinstance(tags, str), \
+            RuntimeError("Received string as tag list")
+        assert TAG_ALL not in tags
+        assert TAG_REALLY_ALL not in tags
 
-            if TAG_NO_BOUNDARY not in tags:
-                # TAG_NO_BOUNDARY is used to mark rank interfaces
-                # as not being part of the boundary
-                tag_to_boundary[TAG_ALL].append(el_face)
+        for btag in tags:
+            tag_to_boundary.setdefault(btag, []) \
+                    .append(el_face)
 
-            tag_to_boundary[TAG_REALLY_ALL].append(el_face)
+        if TAG_NO_BOUNDARY not in tags:
+            # TAG_NO_BOUNDARY is used to mark rank interfaces
+            # as not being part of the boundary
+            tag_to_boundary[TAG_ALL].append(el_face)
+
+        tag_to_boundary[TAG_REALLY_ALL].append(el_face)
 
     # add periodicity-induced connectivity
     from pytools import flatten, reverse_dictionary
 
     periodic_opposite_faces = {}
     periodic_opposite_vertices = {}
+    bdry_face_map = None
 
     for tag_bdries in tag_to_boundary.itervalues():
         assert len(set(tag_bdries)) == len(tag_bdries)
 
+    # faces that turn out to be periodic are dropped from these at the end
+    periodic_el_faces = set()
+
     for axis, axis_periodicity in enumerate(periodicity):
         if axis_periodicity is not None:
             # find faces on +-axis boundaries
@@ -340,8 +445,10 @@ def make_conformal_mesh_ext(points, elements,
             plus_vertex_indices = list(set(flatten(el.faces[face]
                 for el, face in plus_faces)))
 
-            minus_z_points = [points[pi] for pi in minus_vertex_indices]
-            plus_z_points = [points[pi] for pi in plus_vertex_indices]
+            minus_z_points = points[numpy.array(
+                minus_vertex_indices, dtype=numpy.intp)]
+            plus_z_points = points[numpy.array(
+                plus_vertex_indices, dtype=numpy.intp)]
 
             # find a mapping from -axis to +axis vertices
             minus_to_plus, not_found = find_matching_vertices_along_axis(
@@ -354,14 +461,19 @@ def make_conformal_mesh_ext(points, elements,
                 periodic_opposite_vertices.setdefault(b, []).append((a, axis))
 
             # establish face connectivity
+            if bdry_face_map is None:
+                bdry_face_map = dict(
+                        (tuple(sorted(face_vertex_indices[face_nr])),
+                            get_el_face(face_nr))
+                        for face_nr in boundary_faces)
+
             for minus_face in minus_faces:
                 minus_el, minus_fi = minus_face
                 minus_fvi = minus_el.faces[minus_fi]
 
                 try:
                     mapped_plus_fvi = tuple(minus_to_plus[i] for i in minus_fvi)
-                    plus_faces = face_map[frozenset(mapped_plus_fvi)]
-                    assert len(plus_faces) == 1
+                    plus_face = bdry_face_map[tuple(sorted(mapped_plus_fvi))]
                 except KeyError:
                     # is our periodic counterpart is in a different mesh clump?
                     if _is_rankbdry_face(minus_face):
@@ -371,7 +483,6 @@ def make_conformal_mesh_ext(points, elements,
                         # if not, bad.
                         raise
 
-                plus_face = plus_faces[0]
                 interfaces.append([minus_face, plus_face])
 
                 plus_el, plus_fi = plus_face
@@ -386,11 +497,14 @@ def make_conformal_mesh_ext(points, elements,
                 periodic_opposite_faces[minus_fvi] = mapped_plus_fvi, axis
                 periodic_opposite_faces[plus_fvi] = mapped_minus_fvi, axis
 
-                tag_to_boundary[TAG_ALL].remove(plus_face)
-                tag_to_boundary[TAG_ALL].remove(minus_face)
+                periodic_el_faces.add(plus_face)
+                periodic_el_faces.add(minus_face)
 
-                tag_to_boundary[TAG_REALLY_ALL].remove(plus_face)
-                tag_to_boundary[TAG_REALLY_ALL].remove(minus_face)
+    if periodic_el_faces:
+        for tag in [TAG_ALL, TAG_REALLY_ALL]:
+            tag_to_boundary[tag] = [el_face
+                    for el_face in tag_to_boundary[tag]
+                    if el_face not in periodic_el_faces]
 
     return ConformalMesh(
             points=points,
@@ -407,6 +521,293 @@ def make_conformal_mesh_ext(points, elements,
 
 
 
+class ArrayBoundaryTagger(object):
+    """A batched boundary tagger for :func:`make_conformal_mesh_ext`
+    that looks faces up in arrays of tagged faces.
+
+    :param face_tags: a dictionary mapping each tag to an integer array
+      of shape *(n_tagged_faces, n_face_vertices)* containing the vertex
+      indices of the faces that carry the tag, in any order.
+    """
+
+    supports_arrays = True
+
+    def __init__(self, face_tags):
+        self.face_tags = dict(
+                (tag, numpy.sort(
+                    numpy.asarray(tag_fvi, dtype=numpy.intp), axis=1))
+                for tag, tag_fvi in face_tags.iteritems())
+
+    def __call__(self, fvi, el_ids, fns, all_v):
+        from hedge.tools.indexing import find_matching_rows
+        face_keys = numpy.sort(fvi, axis=1)
+        return dict(
+                (tag, find_matching_rows(face_keys, tag_fvi) >= 0)
+                for tag, tag_fvi in self.face_tags.iteritems())
+
+
+
+
+def make_conformal_mesh_from_arrays(points, element_vertex_indices,
+        element_tags=None,
+        face_tags=None,
+        boundary_tagger=None,
+        periodicity=None,
+        allow_internal_boundaries=False,
+        _is_rankbdry_face=None,
+        ):
+    """Construct a simplicial mesh from arrays.
+
+    :param points: an array of vertex coordinates of shape *(n_points, d)*.
+    :param element_vertex_indices: an integer array of shape
+      *(n_elements, d+1)* containing the vertex indices of each element.
+    :param element_tags: a dictionary mapping each volume tag to a
+      boolean mask or an integer array of the numbers of the elements
+      that carry it.
+    :param face_tags: a dictionary mapping each boundary tag to an
+      integer array of face vertex indices, as accepted by
+      :class:`ArrayBoundaryTagger`.
+    :param boundary_tagger: a boundary tagger as accepted by
+      :func:`make_conformal_mesh_ext`, used instead of *face_tags*.
+
+    The remaining arguments are passed on to :func:`make_conformal_mesh_ext`.
+    """
+    points = numpy.asarray(points, dtype=numpy.float64, order="C")
+    element_vertex_indices = numpy.asarray(
+            element_vertex_indices, dtype=numpy.intp)
+
+    if len(points) == 0:
+        raise ValueError("mesh contains no points")
+
+    from hedge.mesh.element import Interval, Triangle, Tetrahedron
+    dim = element_vertex_indices.shape[1] - 1
+    try:
+        el_class = {1: Interval, 2: Triangle, 3: Tetrahedron}[dim]
+    except KeyError:
+        raise ValueError("%d-dimensional meshes are unsupported" % dim)
+
+    elements = [el_class(el_id, vertex_indices, points)
+            for el_id, vertex_indices in enumerate(element_vertex_indices)]
+
+    volume_tagger = None
+    if element_tags:
+        el_id_to_tags = [[] for el in elements]
+        for tag, tagged in element_tags.iteritems():
+            tagged = numpy.asarray(tagged)
+            if tagged.dtype == numpy.bool:
+                tagged, = numpy.where(tagged)
+            for el_id in tagged:
+                el_id_to_tags[el_id].append(tag)
+
+        def volume_tagger(el, all_v):
+            return el_id_to_tags[el.id]
+
+    if boundary_tagger is None and face_tags:
+        boundary_tagger = ArrayBoundaryTagger(face_tags)
+
+    return make_conformal_mesh_ext(points, elements,
+            boundary_tagger=boundary_tagger,
+            volume_tagger=volume_tagger,
+            periodicity=periodicity,
+            allow_internal_boundaries=allow_internal_boundaries,
+            _is_rankbdry_face=_is_rankbdry_face)
+
+
+
+
+def make_conformal_mesh_from_connectivity(points, element_vertex_indices,
+        interfaces, boundary_tags,
+        boundary_tagger=None,
+        element_tags=None,
+        periodicity=None,
+        periodic_interfaces=None,
+        periodic_vertices=None,
+        boundary_faces=None,
+        ):
+    """Construct a simplicial mesh whose connectivity is already known,
+    without matching up faces.
+
+    Faces are given as pairs *(element number, face number)*, with face
+    numbers following :attr:`hedge.mesh.element.Element.faces`.
+
+    :param points: an array of vertex coordinates of shape *(n_points, d)*.
+    :param element_vertex_indices: an integer array of shape
+      *(n_elements, d+1)* containing the vertex indices of each element.
+    :param interfaces: an integer array of shape *(n_interfaces, 4)*
+      containing *(element_a, face_a, element_b, face_b)* for each pair
+      of elements sharing a face.
+    :param boundary_tags: a dictionary mapping each boundary tag to an
+      integer array of shape *(n_tagged_faces, 2)* of faces. Boundary
+      faces not listed in *boundary_faces* must carry at least one
+      tag. Periodic faces keep their
+      tags, but do not become part of :class:`TAG_ALL`.
+    :param boundary_tagger: a boundary tagger as accepted by
+      :func:`make_conformal_mesh_ext`, whose tags are added to those of
+      the non-periodic boundary faces.
+    :param element_tags: a dictionary mapping each volume tag to a
+      boolean mask or an integer array of element numbers.
+    :param periodicity: as for :func:`make_conformal_mesh_ext`.
+    :param periodic_interfaces: an integer array of shape *(n, 5)*
+      containing *(minus_element, minus_face, plus_element, plus_face,
+      axis)* for each pair of faces connected by periodicity.
+    :param periodic_vertices: an integer array of shape *(n, 3)*
+      containing *(minus_vertex, plus_vertex, axis)* for each pair of
+      vertices identified by periodicity.
+    :param boundary_faces: an integer array of shape *(n, 2)* of
+      further boundary faces, which need not carry any tag.
+    """
+    points = numpy.asarray(points, dtype=numpy.float64, order="C")
+    element_vertex_indices = numpy.asarray(
+            element_vertex_indices, dtype=numpy.intp)
+
+    from hedge.mesh.element import Interval, Triangle, Tetrahedron
+    dim = element_vertex_indices.shape[1] - 1
+    try:
+        el_class = {1: Interval, 2: Triangle, 3: Tetrahedron}[dim]
+    except KeyError:
+        raise ValueError("%d-dimensional meshes are unsupported" % dim)
+
+    if periodicity is None:
+        periodicity = dim*[None]
+    if periodic_interfaces is None:
+        periodic_interfaces = []
+    periodic_interfaces = numpy.asarray(
+            periodic_interfaces, dtype=numpy.intp).reshape(-1, 5)
+    if periodic_vertices is None:
+        periodic_vertices = []
+    periodic_vertices = numpy.asarray(
+            periodic_vertices, dtype=numpy.intp).reshape(-1, 3)
+
+    elements = [el_class(el_id, vertex_indices, points)
+            for el_id, vertex_indices in enumerate(element_vertex_indices)]
+
+    def get_el_faces(faces):
+        return [(elements[el_nr], fn) for el_nr, fn in faces.tolist()]
+
+    # {{{ boundary
+
+    face_count = dim+1
+
+    def get_face_nrs(faces):
+        faces = numpy.asarray(faces, dtype=numpy.intp).reshape(-1, 2)
+        return faces[:, 0]*face_count + faces[:, 1]
+
+    def get_faces(face_nrs):
+        return numpy.column_stack(
+                [face_nrs // face_count, face_nrs % face_count])
+
+    periodic_face_nrs = numpy.union1d(
+            get_face_nrs(periodic_interfaces[:, :2]),
+            get_face_nrs(periodic_interfaces[:, 2:4]))
+
+    tag_to_face_nrs = dict(
+            (tag, get_face_nrs(faces))
+            for tag, faces in boundary_tags.iteritems())
+    all_face_nrs = tag_to_face_nrs.values()
+    if boundary_faces is not None:
+        all_face_nrs.append(get_face_nrs(boundary_faces))
+    if all_face_nrs:
+        boundary_face_nrs = numpy.setdiff1d(
+                numpy.unique(numpy.hstack(all_face_nrs)),
+                periodic_face_nrs)
+    else:
+        boundary_face_nrs = numpy.empty(0, dtype=numpy.intp)
+
+    tag_to_boundary = dict(
+            (tag, get_el_faces(get_faces(face_nrs)))
+            for tag, face_nrs in tag_to_face_nrs.iteritems())
+
+    if boundary_tagger is not None:
+        local_face_vertices = numpy.array(
+                el_class.face_vertices(range(dim+1)), dtype=numpy.intp)
+        face_vertex_indices = element_vertex_indices[
+                :, local_face_vertices].reshape(-1, dim)
+
+        extra_tags = _get_boundary_face_tags(boundary_tagger,
+                boundary_face_nrs, face_vertex_indices, elements, points)
+        for face_nr, tags in zip(boundary_face_nrs, extra_tags):
+            for tag in tags:
+                tag_to_boundary.setdefault(tag, []).append(
+                        (elements[face_nr // face_count],
+                            face_nr % face_count))
+
+    for tag in MESH_CREATION_TAGS:
+        if tag in tag_to_boundary:
+            raise ValueError("boundary tag %s is assigned automatically"
+                    % tag.__name__)
+
+    no_boundary_face_nrs = set(
+            el.id*face_count + fn
+            for el, fn in tag_to_boundary.get(TAG_NO_BOUNDARY, []))
+
+    tag_to_boundary[TAG_NONE] = []
+    tag_to_boundary[TAG_REALLY_ALL] = get_el_faces(get_faces(boundary_face_nrs))
+    tag_to_boundary[TAG_ALL] = get_el_faces(get_faces(numpy.array(
+        [face_nr for face_nr in boundary_face_nrs
+            if face_nr not in no_boundary_face_nrs], dtype=numpy.intp)))
+
+    # }}}
+
+    # {{{ volume tags
+
+    tag_to_elements = {TAG_NONE: [], TAG_ALL: elements}
+    if element_tags:
+        for tag, tagged in element_tags.iteritems():
+            tagged = numpy.asarray(tagged)
+            if tagged.dtype == numpy.bool:
+                tagged, = numpy.where(tagged)
+            tag_to_elements[tag] = [elements[el_nr] for el_nr in tagged]
+
+    # }}}
+
+    # {{{ periodicity
+
+    periodic_opposite_vertices = {}
+    minus_to_plus = {}
+    plus_to_minus = {}
+    for minus_vi, plus_vi, axis in periodic_vertices.tolist():
+        periodic_opposite_vertices.setdefault(minus_vi, []).append(
+                (plus_vi, axis))
+        periodic_opposite_vertices.setdefault(plus_vi, []).append(
+                (minus_vi, axis))
+        minus_to_plus[minus_vi, axis] = plus_vi
+        plus_to_minus[plus_vi, axis] = minus_vi
+
+    periodic_opposite_faces = {}
+    for minus_el, minus_fn, plus_el, plus_fn, axis in \
+            periodic_interfaces.tolist():
+        minus_fvi = tuple(elements[minus_el].faces[minus_fn])
+        plus_fvi = tuple(elements[plus_el].faces[plus_fn])
+        periodic_opposite_faces[minus_fvi] = (
+                tuple(minus_to_plus[vi, axis] for vi in minus_fvi), axis)
+        periodic_opposite_faces[plus_fvi] = (
+                tuple(plus_to_minus[vi, axis] for vi in plus_fvi), axis)
+
+    # }}}
+
+    interface_list = [
+            [(elements[el_a], fn_a), (elements[el_b], fn_b)]
+            for el_a, fn_a, el_b, fn_b in numpy.asarray(
+                interfaces, dtype=numpy.intp).reshape(-1, 4).tolist()]
+    interface_list.extend(
+            [(elements[el_a], fn_a), (elements[el_b], fn_b)]
+            for el_a, fn_a, el_b, fn_b, axis in periodic_interfaces.tolist())
+
+    return ConformalMesh(
+            points=points,
+            elements=elements,
+            interfaces=interface_list,
+            tag_to_boundary=tag_to_boundary,
+            tag_to_elements=tag_to_elements,
+            periodicity=periodicity,
+            periodic_opposite_faces=periodic_opposite_faces,
+            periodic_opposite_vertices=periodic_opposite_vertices,
+            has_internal_boundaries=False,
+            )
+
+
+
+
 def make_conformal_mesh(points, elements,
         boundary_tagger=None,
         volume_tagger=None,
@@ -489,13 +890,37 @@ class ConformalMesh(Mesh):
         if method == "cuthill":
             from hedge.mesh.tools import cuthill_mckee
             return cuthill_mckee(self.element_adjacency_graph())
+        elif method == "rcm":
+            from hedge.mesh.tools import reverse_cuthill_mckee
+            return reverse_cuthill_mckee(len(self.elements), numpy.array(
+                [(el_a.id, el_b.id) for (el_a, fn_a), (el_b, fn_b)
+                    in self.interfaces], dtype=numpy.intp))
+        elif method in ["morton", "hilbert"]:
+            import hedge.mesh.tools as mesh_tools
+            get_keys = getattr(mesh_tools, "%s_keys" % method)
+
+            el_vertex_indices = numpy.array(
+                    [el.vertex_indices for el in self.elements],
+                    dtype=numpy.intp)
+            centroids = numpy.average(
+                    numpy.asarray(self.points)[el_vertex_indices], axis=1)
+            return numpy.argsort(get_keys(centroids), kind="mergesort")
         else:
             raise ValueError("invalid mesh reorder method")
 
     def reordered_by(self, method):
         """Return a reordered copy of *self*.
 
-        :param method: "cuthill"
+        :param method: one of
+
+          - ``"cuthill"``: Cuthill-McKee ordering of the element
+            adjacency graph, see :func:`hedge.mesh.tools.cuthill_mckee`.
+          - ``"rcm"``: reverse Cuthill-McKee ordering, see
+            :func:`hedge.mesh.tools.reverse_cuthill_mckee`.
+          - ``"morton"``, ``"hilbert"``: order of the element centroids
+            along a space-filling curve, see
+            :func:`hedge.mesh.tools.morton_keys` and
+            :func:`hedge.mesh.tools.hilbert_keys`.
         """
 
         old_numbers = self.get_reorder_oldnumbers(method)
@@ -592,3 +1017,171 @@ def check_bc_coverage(mesh, bc_tags, incomplete_ok=False):
     elif bdry_face_countdown < 0:
         raise RuntimeError("More BCs were assigned than boundary faces are present "
                 "(did something screw up your periodicity?)")
+
+
+
+
+# {{{ uniform refinement
+
+# Edges of a simplex of each dimension, as pairs of local vertex numbers. In
+# the tables below, local vertex number nv+i stands for the midpoint of edge i,
+# where nv is the number of vertices.
+_SIMPLEX_EDGES = {
+        0: [],
+        1: [(0, 1)],
+        2: [(0, 1), (1, 2), (0, 2)],
+        3: [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)],
+        }
+
+# Children of a uniformly refined simplex. Tetrahedra are split as proposed
+# by J. Bey, "Tetrahedral grid refinement", Computing 55 (1995), which,
+# applied repeatedly, produces at most three similarity classes.
+_SIMPLEX_CHILDREN = {
+        0: [(0,)],
+        1: [(0, 2), (2, 1)],
+        2: [(0, 3, 5), (3, 1, 4), (5, 4, 2), (3, 4, 5)],
+        3: [(0, 4, 5, 6), (4, 1, 7, 8), (5, 7, 2, 9), (6, 8, 9, 3),
+            (4, 5, 6, 8), (4, 5, 7, 8), (5, 6, 8, 9), (5, 7, 8, 9)],
+        }
+
+
+def _get_refined_simplex_vertices(vertices, midpoint):
+    """Return the children of a uniformly refined simplex.
+
+    :param vertices: a sequence of the simplex's vertices.
+    :param midpoint: a function mapping a pair of vertices to the
+      vertex at the midpoint of the edge between them.
+    """
+    dim = len(vertices) - 1
+    ext_vertices = list(vertices) + [
+            midpoint(vertices[i], vertices[j]) for i, j in _SIMPLEX_EDGES[dim]]
+    return [tuple(ext_vertices[i] for i in child)
+            for child in _SIMPLEX_CHILDREN[dim]]
+
+
+def _refine_uniformly_once(mesh):
+    """Return a tuple *(refined_mesh, edge_vertices)*. Vertices of *mesh*
+    keep their numbers, and the vertex number ``len(mesh.points)+i`` is
+    assigned to the midpoint of the edge between the vertices in row *i* of
+    the integer array *edge_vertices*. The children of element *i* are
+    numbered consecutively, starting at ``i*child_count``.
+    """
+    from hedge.mesh.element import SimplicialElement
+    for el in mesh.elements:
+        if not isinstance(el, SimplicialElement):
+            raise NotImplementedError(
+                    "uniform refinement of non-simplicial elements")
+
+    points = numpy.asarray(mesh.points, dtype=numpy.float64)
+    element_vertex_indices = numpy.array(
+            [el.vertex_indices for el in mesh.elements], dtype=numpy.intp)
+    el_count, vertex_count = element_vertex_indices.shape
+    dim = vertex_count - 1
+
+    # {{{ number edge midpoints
+
+    local_edges = numpy.array(_SIMPLEX_EDGES[dim], dtype=numpy.intp) \
+            .reshape(-1, 2)
+    el_edges = numpy.sort(
+            element_vertex_indices[:, local_edges], axis=-1).reshape(-1, 2)
+    edge_keys = (el_edges[:, 0].astype(numpy.int64)*len(points)
+            + el_edges[:, 1])
+    unique_keys, edge_numbers = numpy.unique(edge_keys, return_inverse=True)
+    edge_vertices = numpy.column_stack(
+            [unique_keys // len(points), unique_keys % len(points)]) \
+                    .astype(numpy.intp)
+
+    new_points = numpy.vstack([points,
+        (points[edge_vertices[:, 0]] + points[edge_vertices[:, 1]])/2])
+
+    # vertices and edge midpoints of each element, numbered as in
+    # _SIMPLEX_CHILDREN
+    ext_vertex_indices = numpy.hstack([element_vertex_indices,
+        len(points) + edge_numbers.reshape(el_count, -1)])
+
+    # }}}
+
+    children = numpy.array(_SIMPLEX_CHILDREN[dim], dtype=numpy.intp)
+    child_count = len(children)
+    new_element_vertex_indices = ext_vertex_indices[:, children] \
+            .reshape(-1, vertex_count)
+
+    # {{{ carry over tags
+
+    def get_children(el_ids):
+        el_ids = numpy.asarray(el_ids, dtype=numpy.intp)
+        return (child_count*el_ids[:, numpy.newaxis]
+                + numpy.arange(child_count)).ravel()
+
+    element_tags = dict(
+            (tag, get_children([el.id for el in tagged]))
+            for tag, tagged in mesh.tag_to_elements.iteritems()
+            if tag not in MESH_CREATION_TAGS and tag is not TAG_NONE)
+
+    # face_children[fn] contains the children of face fn, given as
+    # columns of ext_vertex_indices
+    el_class = type(mesh.elements[0])
+    face_children = numpy.array([
+        _get_refined_simplex_vertices(face_vertices,
+            lambda i, j: vertex_count + _SIMPLEX_EDGES[dim].index(
+                tuple(sorted((i, j)))))
+        for face_vertices in el_class.face_vertices(range(vertex_count))],
+        dtype=numpy.intp)
+
+    def get_face_children(el_faces):
+        el_ids = numpy.array([el.id for el, fn in el_faces], dtype=numpy.intp)
+        fns = numpy.array([fn for el, fn in el_faces], dtype=numpy.intp)
+        return ext_vertex_indices[
+                el_ids[:, numpy.newaxis, numpy.newaxis],
+                face_children[fns]].reshape(-1, dim)
+
+    face_tags = dict(
+            (tag, get_face_children(el_faces))
+            for tag, el_faces in mesh.tag_to_boundary.iteritems()
+            if tag not in MESH_CREATION_TAGS and tag is not TAG_NONE
+            and el_faces)
+
+    rank_bdry_faces = set()
+    for tag, face_vertex_indices in face_tags.iteritems():
+        if isinstance(tag, TAG_RANK_BOUNDARY):
+            rank_bdry_faces.update(frozenset(fvi)
+                    for fvi in face_vertex_indices.tolist())
+
+    def is_rankbdry_face((el, fn)):
+        return frozenset(el.faces[fn]) in rank_bdry_faces
+
+    # }}}
+
+    refined_mesh = make_conformal_mesh_from_arrays(
+            new_points, new_element_vertex_indices,
+            element_tags=element_tags,
+            face_tags=face_tags,
+            periodicity=mesh.periodicity,
+            allow_internal_boundaries=getattr(
+                mesh, "has_internal_boundaries", False),
+            _is_rankbdry_face=is_rankbdry_face)
+
+    return refined_mesh, edge_vertices
+
+
+def refine_uniformly(mesh, levels=1):
+    """Return a copy of the simplicial *mesh* in which each element is
+    split *levels* times into :math:`2^d` children by connecting the
+    midpoints of its edges.
+
+    Boundary tags, volume tags and periodicity are carried over to the
+    children. The children of element *i* are numbered consecutively,
+    starting at :math:`2^{d\\cdot \\text{levels}} i`, and the vertices of
+    *mesh* keep their numbers.
+
+    *mesh* may also be the local part of a partitioned mesh, see
+    :meth:`hedge.backends.parallel.RankData.refined_uniformly`.
+    """
+    for i in range(levels):
+        mesh, edge_vertices = _refine_uniformly_once(mesh)
+
+    return mesh
+
+# }}}
+
+# vim: foldmethod=marker
@@ -116,6 +116,88 @@ def make_single_element_mesh(a=-0.5, b=0.5,
             boundary_tags)
 
 
+def _finish_lattice_mesh(points, element_vertex_indices, interfaces,
+        axis_faces, axis_vertices, periodicity, boundary_tagger):
+    """Build a mesh with stock boundary tags from lattice connectivity.
+
+    *axis_faces* contains, for each axis, a tuple *(minus_faces,
+    plus_faces)* of face arrays as accepted by
+    :func:`hedge.mesh.make_conformal_mesh_from_connectivity`, and
+    *axis_vertices* a tuple *(minus_vertices, plus_vertices)* of vertex
+    numbers. Corresponding entries are identified if the axis is periodic.
+    """
+    if periodicity is None:
+        periodicity = len(axis_faces)*(False,)
+
+    boundary_tags = {}
+    mesh_periodicity = []
+    periodic_interfaces = []
+    periodic_vertices = []
+    for axis, ((minus_faces, plus_faces), (minus_vertices, plus_vertices)) \
+            in enumerate(zip(axis_faces, axis_vertices)):
+        minus_tag = "minus_"+"xyz"[axis]
+        plus_tag = "plus_"+"xyz"[axis]
+        boundary_tags[minus_tag] = minus_faces
+        boundary_tags[plus_tag] = plus_faces
+
+        if periodicity[axis]:
+            mesh_periodicity.append((minus_tag, plus_tag))
+            periodic_interfaces.append(numpy.column_stack([
+                minus_faces, plus_faces,
+                numpy.tile(axis, len(minus_faces))]))
+            periodic_vertices.append(numpy.column_stack([
+                minus_vertices, plus_vertices,
+                numpy.tile(axis, len(minus_vertices))]))
+        else:
+            mesh_periodicity.append(None)
+
+    def stack(arrays, width):
+        if arrays:
+            return numpy.vstack(arrays)
+        else:
+            return numpy.empty((0, width), dtype=numpy.intp)
+
+    from hedge.mesh import make_conformal_mesh_from_connectivity
+    return make_conformal_mesh_from_connectivity(
+            points, element_vertex_indices,
+            stack(interfaces, 4), boundary_tags,
+            boundary_tagger=boundary_tagger,
+            periodicity=mesh_periodicity,
+            periodic_interfaces=stack(periodic_interfaces, 5),
+            periodic_vertices=stack(periodic_vertices, 3))
+
+
+def _make_faces(el_nrs, face_nr):
+    el_nrs = numpy.asarray(el_nrs, dtype=numpy.intp).ravel()
+    return numpy.column_stack([el_nrs, numpy.tile(face_nr, len(el_nrs))])
+
+
+def _make_interfaces(el_nrs_a, face_nr_a, el_nrs_b, face_nr_b):
+    return numpy.hstack([
+        _make_faces(el_nrs_a, face_nr_a),
+        _make_faces(el_nrs_b, face_nr_b)])
+
+
+def _make_lattice_points(a, b, n):
+    """Return a tuple *(points, node_nrs)*, where *node_nrs* is an integer
+    array of shape *n* containing the number of each lattice point.
+    Points are numbered with the x index varying fastest."""
+    points_1d = [numpy.linspace(a_i, b_i, n_i)
+            for a_i, b_i, n_i in zip(a, b, n)]
+    points = numpy.column_stack([pts[idx.ravel(order="F")]
+        for pts, idx in zip(points_1d, numpy.indices(n))])
+    node_nrs = numpy.arange(len(points), dtype=numpy.intp).reshape(
+            n, order="F")
+    return points, node_nrs
+
+
+def _get_axis_vertices(node_nrs):
+    return [
+            (numpy.take(node_nrs, 0, axis=axis).ravel(),
+                numpy.take(node_nrs, -1, axis=axis).ravel())
+            for axis in range(len(node_nrs.shape))]
+
+
 def make_regular_rect_mesh(a=(0, 0), b=(1, 1), n=(5, 5), periodicity=None,
         boundary_tagger=(lambda fvi, el, fn, all_v: [])):
     """Create a semi-structured rectangular mesh.
@@ -126,74 +208,47 @@ def make_regular_rect_mesh(a=(0, 0), b=(1, 1), n=(5, 5), periodicity=None,
       on [a,b].
     :param periodicity: either None, or a tuple of bools specifying whether
       the mesh is to be periodic in x and y.
+
+    Connectivity, boundary tags and periodic pairings are derived from
+    the lattice structure, without matching up faces.
     """
     if min(n) < 2:
         raise ValueError("need at least two points in each direction")
 
-    node_dict = {}
-    points = []
-    points_1d = [numpy.linspace(a_i, b_i, n_i)
-            for a_i, b_i, n_i in zip(a, b, n)]
-
-    for j in range(n[1]):
-        for i in range(n[0]):
-            node_dict[i, j] = len(points)
-            points.append(numpy.array([points_1d[0][i], points_1d[1][j]]))
+    points, node_nrs = _make_lattice_points(a, b, n)
 
-    elements = []
+    # c--d
+    # |  |
+    # a--b
 
-    if periodicity is None:
-        periodicity = (False, False)
+    ci, cj = [idx.ravel() for idx in numpy.indices((n[0]-1, n[1]-1))]
+    a = node_nrs[ci, cj]
+    b = node_nrs[ci+1, cj]
+    c = node_nrs[ci, cj+1]
+    d = node_nrs[ci+1, cj+1]
 
-    axes = ["x", "y"]
-    mesh_periodicity = []
-    periodic_tags = set()
-    for i, axis in enumerate(axes):
-        if periodicity[i]:
-            minus_tag = "minus_"+axis
-            plus_tag = "plus_"+axis
-            mesh_periodicity.append((minus_tag, plus_tag))
-            periodic_tags.add(minus_tag)
-            periodic_tags.add(plus_tag)
-        else:
-            mesh_periodicity.append(None)
-
-    fvi2fm = {}
+    element_vertex_indices = numpy.empty((2*len(ci), 3), dtype=numpy.intp)
+    element_vertex_indices[0::2] = numpy.column_stack([a, b, c])
+    element_vertex_indices[1::2] = numpy.column_stack([d, c, b])
 
-    for i in range(n[0]-1):
-        for j in range(n[1]-1):
+    # element numbers of the two triangles in each cell, indexed by (i, j)
+    lower = 2*numpy.arange(len(ci), dtype=numpy.intp).reshape(n[0]-1, n[1]-1)
+    upper = lower + 1
 
-            # c--d
-            # |  |
-            # a--b
-
-            a = node_dict[i, j]
-            b = node_dict[i+1, j]
-            c = node_dict[i, j+1]
-            d = node_dict[i+1, j+1]
-
-            elements.append((a, b, c))
-            elements.append((d, c, b))
-
-            if i == 0:
-                fvi2fm[frozenset((a, c))] = "minus_x"
-            if i == n[0]-2:
-                fvi2fm[frozenset((b, d))] = "plus_x"
-            if j == 0:
-                fvi2fm[frozenset((a, b))] = "minus_y"
-            if j == n[1]-2:
-                fvi2fm[frozenset((c, d))] = "plus_y"
+    interfaces = [
+            _make_interfaces(lower, 1, upper, 1),
+            _make_interfaces(upper[:-1, :], 2, lower[1:, :], 2),
+            _make_interfaces(upper[:, :-1], 0, lower[:, 1:], 0),
+            ]
 
-    def wrapped_boundary_tagger(fvi, el, fn, all_v):
-        btag = fvi2fm[frozenset(fvi)]
-        if btag in periodic_tags:
-            return [btag]
-        else:
-            return [btag] + boundary_tagger(fvi, el, fn, all_v)
+    axis_faces = [
+            (_make_faces(lower[0, :], 2), _make_faces(upper[-1, :], 2)),
+            (_make_faces(lower[:, 0], 0), _make_faces(upper[:, -1], 0)),
+            ]
 
-    from hedge.mesh import make_conformal_mesh
-    return make_conformal_mesh(points, elements, wrapped_boundary_tagger,
-            periodicity=mesh_periodicity)
+    return _finish_lattice_mesh(points, element_vertex_indices, interfaces,
+            axis_faces, _get_axis_vertices(node_nrs), periodicity,
+            boundary_tagger)
 
 
 def make_centered_regular_rect_mesh(a=(0, 0), b=(1, 1), n=(5, 5), periodicity=None,
@@ -206,31 +261,72 @@ def make_centered_regular_rect_mesh(a=(0, 0), b=(1, 1), n=(5, 5), periodicity=No
       on [a,b].
     :param periodicity: either None, or a tuple of bools specifying whether
       the mesh is to be periodic in x and y.
+
+    Unless *post_refine_factor* is greater than one, connectivity,
+    boundary tags and periodic pairings are derived from the lattice
+    structure, without matching up faces.
     """
     if min(n) < 2:
         raise ValueError("need at least two points in each direction")
 
-    node_dict = {}
-    centered_node_dict = {}
-    points = []
-    points_1d = [numpy.linspace(a_i, b_i, n_i)
-            for a_i, b_i, n_i in zip(a, b, n)]
+    lattice_points, node_nrs = _make_lattice_points(a, b, n)
     dx = (numpy.array(b, dtype=numpy.float64)
             - numpy.array(a, dtype=numpy.float64)) / (numpy.array(n)-1)
-    half_dx = dx/2
 
-    for j in range(n[1]):
-        for i in range(n[0]):
-            node_dict[i, j] = len(points)
-            points.append(numpy.array([points_1d[0][i], points_1d[1][j]]))
+    # c---d
+    # |\ /|
+    # | m |
+    # |/ \|
+    # a---b
+
+    ci, cj = [idx.ravel() for idx in numpy.indices((n[0]-1, n[1]-1))]
+    cell_count = len(ci)
+    a = node_nrs[ci, cj]
+    b = node_nrs[ci+1, cj]
+    c = node_nrs[ci, cj+1]
+    d = node_nrs[ci+1, cj+1]
+    m = len(lattice_points) + numpy.arange(cell_count, dtype=numpy.intp)
+
+    points = numpy.vstack([lattice_points, lattice_points[a] + dx/2])
+
+    element_vertex_indices = numpy.empty((4*cell_count, 3), dtype=numpy.intp)
+    element_vertex_indices[0::4] = numpy.column_stack([a, b, m])
+    element_vertex_indices[1::4] = numpy.column_stack([b, d, m])
+    element_vertex_indices[2::4] = numpy.column_stack([d, c, m])
+    element_vertex_indices[3::4] = numpy.column_stack([c, a, m])
+
+    # element numbers of the four triangles in each cell, indexed by (i, j)
+    bottom = 4*numpy.arange(cell_count, dtype=numpy.intp).reshape(
+            n[0]-1, n[1]-1)
+    right = bottom + 1
+    top = bottom + 2
+    left = bottom + 3
+
+    axis_faces = [
+            (_make_faces(left[0, :], 0), _make_faces(right[-1, :], 0)),
+            (_make_faces(bottom[:, 0], 0), _make_faces(top[:, -1], 0)),
+            ]
 
-    for j in range(n[1]-1):
-        for i in range(n[0]-1):
-            centered_node_dict[i, j] = len(points)
-            points.append(numpy.array([points_1d[0][i], points_1d[1][j]]) + half_dx)
+    if post_refine_factor > 1:
+        return _refine_centered_rect_mesh(points, element_vertex_indices,
+                axis_faces, periodicity, post_refine_factor, boundary_tagger)
+
+    interfaces = [
+            _make_interfaces(bottom, 1, right, 2),
+            _make_interfaces(right, 1, top, 2),
+            _make_interfaces(top, 1, left, 2),
+            _make_interfaces(left, 1, bottom, 2),
+            _make_interfaces(right[:-1, :], 0, left[1:, :], 0),
+            _make_interfaces(top[:, :-1], 0, bottom[:, 1:], 0),
+            ]
+
+    return _finish_lattice_mesh(points, element_vertex_indices, interfaces,
+            axis_faces, _get_axis_vertices(node_nrs), periodicity,
+            boundary_tagger)
 
-    elements = []
 
+def _refine_centered_rect_mesh(points, element_vertex_indices, axis_faces,
+        periodicity, post_refine_factor, boundary_tagger):
     if periodicity is None:
         periodicity = (False, False)
 
@@ -247,37 +343,16 @@ def make_centered_regular_rect_mesh(a=(0, 0), b=(1, 1), n=(5, 5), periodicity=No
         else:
             mesh_periodicity.append(None)
 
-    fvi2fm = {}
-
-    for i in range(n[0]-1):
-        for j in range(n[1]-1):
-
-            # c---d
-            # |\ /|
-            # | m |
-            # |/ \|
-            # a---b
-
-            a = node_dict[i, j]
-            b = node_dict[i+1, j]
-            c = node_dict[i, j+1]
-            d = node_dict[i+1, j+1]
-
-            m = centered_node_dict[i, j]
-
-            elements.append((a, b, m))
-            elements.append((b, d, m))
-            elements.append((d, c, m))
-            elements.append((c, a, m))
+    from hedge.mesh.element import Triangle
+    local_face_vertices = numpy.array(
+            Triangle.face_vertices(range(3)), dtype=numpy.intp)
 
-            if i == 0:
-                fvi2fm[frozenset((a, c))] = "minus_x"
-            if i == n[0]-2:
-                fvi2fm[frozenset((b, d))] = "plus_x"
-            if j == 0:
-                fvi2fm[frozenset((a, b))] = "minus_y"
-            if j == n[1]-2:
-                fvi2fm[frozenset((c, d))] = "plus_y"
+    fvi2fm = {}
+    for axis, faces in zip(axes, axis_faces):
+        for tag, tag_faces in zip(["minus_"+axis, "plus_"+axis], faces):
+            for el_nr, fn in tag_faces:
+                fvi2fm[frozenset(element_vertex_indices[
+                    el_nr, local_face_vertices[fn]])] = tag
 
     def wrapped_boundary_tagger(fvi, el, fn, all_v):
         btag = fvi2fm[frozenset(fvi)]
@@ -286,21 +361,20 @@ def make_centered_regular_rect_mesh(a=(0, 0), b=(1, 1), n=(5, 5), periodicity=No
         else:
             return [btag] + boundary_tagger(fvi, el, fn, all_v)
 
-    if post_refine_factor > 1:
-        from meshpy.tools import uniform_refine_triangles
-        points, elements, of2nf = uniform_refine_triangles(
-                points, elements, post_refine_factor)
-        old_fvi2fm = fvi2fm
-        fvi2fm = {}
+    from meshpy.tools import uniform_refine_triangles
+    points, elements, of2nf = uniform_refine_triangles(
+            list(points), [tuple(el) for el in element_vertex_indices],
+            post_refine_factor)
+    old_fvi2fm = fvi2fm
+    fvi2fm = {}
 
-        for fvi, fm in old_fvi2fm.iteritems():
-            for new_fvi in of2nf[fvi]:
-                fvi2fm[frozenset(new_fvi)] = fm
+    for fvi, fm in old_fvi2fm.iteritems():
+        for new_fvi in of2nf[fvi]:
+            fvi2fm[frozenset(new_fvi)] = fm
 
     vertices = numpy.asarray(points, dtype=float, order="C")
 
     from hedge.mesh import make_conformal_mesh_ext
-    from hedge.mesh.element import Triangle
     return make_conformal_mesh_ext(
             vertices,
             [Triangle(i, el_idx, vertices)
@@ -735,6 +809,101 @@ def make_box_mesh(a=(0, 0, 0), b=(1, 1, 1),
         return result
 
 
+def make_regular_box_mesh(a=(0, 0, 0), b=(1, 1, 1), n=(5, 5, 5),
+        periodicity=None, boundary_tagger=(lambda fvi, el, fn, all_v: [])):
+    """Create a structured tetrahedral mesh of a brick.
+
+    :param a: the lower corner of the brick
+    :param b: the upper corner of the brick
+    :param n: a triple of integers indicating the total number of points
+      on [a,b] along each axis.
+    :param periodicity: either None, or a triple of bools specifying whether
+      the mesh is to be periodic in x, y and z.
+
+    Each cell of the lattice is split into six tetrahedra sharing its main
+    diagonal (the Kuhn subdivision), so that faces on opposite sides of
+    the brick match up. As for :func:`make_box_mesh`, the stock boundary
+    tags plus_[xyz] and minus_[xyz] are provided. Connectivity, boundary
+    tags and periodic pairings are derived from the lattice structure,
+    without matching up faces.
+    """
+    n = tuple(n)
+    if len(n) != 3:
+        raise ValueError("n must have three entries")
+    if min(n) < 2:
+        raise ValueError("need at least two points in each direction")
+
+    points, node_nrs = _make_lattice_points(a, b, n)
+
+    cell_shape = tuple(n_i-1 for n_i in n)
+    cell_indices = [idx.ravel() for idx in numpy.indices(cell_shape)]
+
+    # Tetrahedron number p in a cell visits the corners c, c+e[s0],
+    # c+e[s0]+e[s1], c+(1,1,1), where s is the permutation number p.
+    from itertools import permutations
+    perms = list(permutations(range(3)))
+    perm_numbers = dict((perm, i) for i, perm in enumerate(perms))
+
+    element_vertex_indices = numpy.empty(
+            (len(cell_indices[0]), len(perms), 4), dtype=numpy.intp)
+    for perm_nr, perm in enumerate(perms):
+        corner = list(cell_indices)
+        element_vertex_indices[:, perm_nr, 0] = node_nrs[tuple(corner)]
+        for i, axis in enumerate(perm):
+            corner[axis] = corner[axis] + 1
+            element_vertex_indices[:, perm_nr, i+1] = node_nrs[tuple(corner)]
+    element_vertex_indices = element_vertex_indices.reshape(-1, 4)
+
+    el_nrs = numpy.arange(len(element_vertex_indices), dtype=numpy.intp) \
+            .reshape(cell_shape + (len(perms),))
+
+    def swapped(perm, i):
+        perm = list(perm)
+        perm[i], perm[i+1] = perm[i+1], perm[i]
+        return perm_numbers[tuple(perm)]
+
+    def rotated(perm):
+        return perm_numbers[perm[1:] + perm[:1]]
+
+    def cell_slice(axis, slc):
+        result = [slice(None)]*3
+        result[axis] = slc
+        return tuple(result)
+
+    interfaces = []
+    for perm_nr, perm in enumerate(perms):
+        # faces 2 and 1 are shared with the tetrahedra in the same cell
+        # that have the first two and the last two axes swapped
+        if perm[0] < perm[1]:
+            interfaces.append(_make_interfaces(
+                el_nrs[..., perm_nr], 2, el_nrs[..., swapped(perm, 0)], 2))
+        if perm[1] < perm[2]:
+            interfaces.append(_make_interfaces(
+                el_nrs[..., perm_nr], 1, el_nrs[..., swapped(perm, 1)], 1))
+
+        # face 3 is face 0 of a tetrahedron in the next cell along perm[0]
+        interfaces.append(_make_interfaces(
+            el_nrs[cell_slice(perm[0], slice(None, -1))][..., perm_nr], 3,
+            el_nrs[cell_slice(perm[0], slice(1, None))][..., rotated(perm)], 0))
+
+    axis_faces = []
+    for axis in range(3):
+        minus_faces = []
+        plus_faces = []
+        for perm_nr, perm in enumerate(perms):
+            if perm[0] == axis:
+                plus_faces.append(_make_faces(
+                    el_nrs[cell_slice(axis, -1)][..., perm_nr], 3))
+                minus_faces.append(_make_faces(
+                    el_nrs[cell_slice(axis, 0)][..., rotated(perm)], 0))
+
+        axis_faces.append((numpy.vstack(minus_faces), numpy.vstack(plus_faces)))
+
+    return _finish_lattice_mesh(points, element_vertex_indices, interfaces,
+            axis_faces, _get_axis_vertices(node_nrs), periodicity,
+            boundary_tagger)
+
+
 # poke generator bits into hedge.mesh for backwards compatibility -------------
 def _add_depr_generator_functions():
     from pytools import MovedFunctionDeprecationWrapper
@@ -0,0 +1,813 @@
+"""A native binary file format for meshes."""
+
+from __future__ import division
+
+__copyright__ = "Copyright (C) 2009 Andreas Kloeckner"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import numpy
+from pytools import Record
+
+import hedge.mesh as hmesh
+
+
+
+
+# The file layout, shared by mesh, partition and volume field files, is
+#
+# - the magic string MESH_FILE_MAGIC, PARTITION_FILE_MAGIC or
+#   FIELD_FILE_MAGIC,
+# - the format version and the header length, as little-endian uint32
+#   and uint64,
+# - the header, a JSON-encoded dictionary, and
+# - the arrays it describes, each starting at a multiple of
+#   MESH_FILE_ALIGNMENT bytes.
+#
+# Array offsets in the header are relative to the end of the header,
+# rounded up to the alignment.
+
+MESH_FILE_MAGIC = "HEDGEMSH"
+PARTITION_FILE_MAGIC = "HEDGEPRT"
+FIELD_FILE_MAGIC = "HEDGEFLD"
+MESH_FILE_VERSION = 1
+MESH_FILE_ALIGNMENT = 64
+
+_PREFIX_DTYPE = numpy.dtype([
+    ("magic", "S8"), ("version", "<u4"), ("header_length", "<u8")])
+
+_INT_DTYPE = numpy.dtype("<i8")
+_FLOAT_DTYPE = numpy.dtype("<f8")
+
+_FILE_KINDS = {
+        MESH_FILE_MAGIC: "mesh",
+        PARTITION_FILE_MAGIC: "mesh partition",
+        FIELD_FILE_MAGIC: "volume field",
+        }
+
+
+
+
+def _align(offset):
+    return -(-offset // MESH_FILE_ALIGNMENT) * MESH_FILE_ALIGNMENT
+
+
+
+
+def _get_array_layout(array_specs):
+    """Return a tuple *(array_info, data_size)* for arrays with the
+    *(dtype, shape)* tuples in the dictionary *array_specs*, where
+    *array_info* is the information on them stored in the header.
+    """
+    array_info = {}
+    offset = 0
+    for name in sorted(array_specs):
+        dtype, shape = array_specs[name]
+        dtype = numpy.dtype(dtype)
+
+        offset = _align(offset)
+        array_info[name] = {
+                "dtype": dtype.str,
+                "shape": list(shape),
+                "offset": offset}
+        offset += dtype.itemsize * int(numpy.prod(shape))
+
+    return array_info, offset
+
+
+
+
+def _encode_array_file_prefix(magic, header, array_info):
+    """Return a tuple *(prefix, data_start)*, where *prefix* is the string
+    preceding the array data in the layout described above.
+    """
+    import json
+    header = json.dumps(dict(header, arrays=array_info))
+
+    prefix = numpy.array([(magic, MESH_FILE_VERSION, len(header))],
+            dtype=_PREFIX_DTYPE)
+    prefix = prefix.tostring() + header
+
+    return prefix, _align(len(prefix))
+
+
+
+
+def _write_array_file(filename, magic, header, arrays):
+    """Write the dictionary *header* and the arrays in the dictionary
+    *arrays* to *filename* in the layout described above. Information on
+    the arrays is added to *header* under the key ``"arrays"``.
+    """
+    for name in arrays:
+        ary = numpy.ascontiguousarray(arrays[name])
+        if ary.dtype.kind in "iu":
+            ary = ary.astype(_INT_DTYPE)
+        arrays[name] = ary
+
+    array_info, data_size = _get_array_layout(dict(
+        (name, (ary.dtype, ary.shape)) for name, ary in arrays.iteritems()))
+    prefix, data_start = _encode_array_file_prefix(magic, header, array_info)
+
+    outf = open(filename, "wb")
+    try:
+        outf.write(prefix)
+
+        for name in sorted(arrays):
+            outf.write("\0" * (data_start + array_info[name]["offset"]
+                - outf.tell()))
+            outf.write(arrays[name].tostring())
+    finally:
+        outf.close()
+
+
+
+
+def _read_array_file_header(filename, magic):
+    """Return a tuple *(header, data_start)* for a file written by
+    :func:`_write_array_file`.
+    """
+    inf = open(filename, "rb")
+    try:
+        prefix = numpy.frombuffer(inf.read(_PREFIX_DTYPE.itemsize),
+                dtype=_PREFIX_DTYPE)
+        if len(prefix) != 1 or prefix["magic"][0] != magic:
+            raise ValueError("'%s' is not a hedge %s file"
+                    % (filename, _FILE_KINDS[magic]))
+        if prefix["version"][0] != MESH_FILE_VERSION:
+            raise ValueError("'%s' has unsupported file version %d"
+                    % (filename, prefix["version"][0]))
+
+        import json
+        header = json.loads(inf.read(int(prefix["header_length"][0])))
+        data_start = _align(inf.tell())
+    finally:
+        inf.close()
+
+    return header, data_start
+
+
+
+
+def _map_array(filename, data_start, info):
+    """Return a read-only memory map of the array described by *info* in
+    the header of *filename*.
+    """
+    shape = tuple(info["shape"])
+    if not numpy.prod(shape):
+        return numpy.empty(shape, dtype=info["dtype"])
+
+    return numpy.memmap(filename, dtype=info["dtype"], mode="r",
+            offset=data_start+info["offset"], shape=shape)
+
+
+
+
+# {{{ tag encoding
+
+_SYSTEM_TAG_NAMES = dict((tag.__name__, tag) for tag in hmesh.SYSTEM_TAGS)
+
+
+def _encode_tag(tag):
+    if isinstance(tag, basestring):
+        return tag
+    elif isinstance(tag, hmesh.TAG_RANK_BOUNDARY):
+        return {"system_tag": "TAG_RANK_BOUNDARY", "rank": tag.rank}
+    elif tag in hmesh.SYSTEM_TAGS:
+        return {"system_tag": tag.__name__}
+    else:
+        raise ValueError("cannot store mesh tag %r: only strings and "
+                "system tags are supported" % (tag,))
+
+
+def _decode_tag(tag):
+    if isinstance(tag, dict):
+        if tag["system_tag"] == "TAG_RANK_BOUNDARY":
+            return hmesh.TAG_RANK_BOUNDARY(tag["rank"])
+        else:
+            return _SYSTEM_TAG_NAMES[tag["system_tag"]]
+    else:
+        try:
+            return str(tag)
+        except UnicodeEncodeError:
+            return tag
+
+
+def _encode_periodicity(periodicity):
+    if periodicity is None:
+        return None
+    else:
+        return [
+                axis_periodicity
+                and [_encode_tag(tag) for tag in axis_periodicity]
+                for axis_periodicity in periodicity]
+
+
+def _decode_periodicity(periodicity):
+    if periodicity is None:
+        return None
+    else:
+        return [
+                axis_periodicity
+                and tuple(_decode_tag(tag) for tag in axis_periodicity)
+                for axis_periodicity in periodicity]
+
+# }}}
+
+
+
+
+# {{{ writing
+
+def save_mesh(mesh, filename, partition=None, with_interfaces=True):
+    """Write the :class:`hedge.mesh.ConformalMesh` *mesh* to *filename*.
+
+    :param partition: if given, a sequence assigning a part number to
+      each element. Elements are then stored sorted by part, so that each
+      part can be read on its own by :func:`load_mesh_arrays`. Element
+      numbers in the file follow this order.
+    :param with_interfaces: whether to store the list of element
+      interfaces. If it is not stored, :func:`load_mesh` recomputes it.
+    """
+    from hedge.mesh.element import SimplicialElement
+
+    elements = mesh.elements
+    for i, el in enumerate(elements):
+        if el.id != i:
+            raise ValueError("element ids must match element numbers")
+        if not isinstance(el, SimplicialElement):
+            raise NotImplementedError("storing non-simplicial elements")
+
+    # {{{ element order
+
+    if partition is not None:
+        partition = numpy.asarray(partition, dtype=numpy.intp)
+        el_order = numpy.argsort(partition, kind="mergesort")
+        part_count = int(partition.max()) + 1
+        part_starts = numpy.searchsorted(partition[el_order],
+                numpy.arange(part_count+1))
+    else:
+        el_order = numpy.arange(len(elements), dtype=numpy.intp)
+        part_starts = None
+
+    new_el_numbers = numpy.empty(len(elements), dtype=numpy.intp)
+    new_el_numbers[el_order] = numpy.arange(len(elements), dtype=numpy.intp)
+
+    def el_faces_to_array(el_faces):
+        result = numpy.array(
+                [(el.id, fn) for el, fn in el_faces],
+                dtype=numpy.intp).reshape(-1, 2)
+        result[:, 0] = new_el_numbers[result[:, 0]]
+        return result[numpy.lexsort(result.T[::-1])]
+
+    # }}}
+
+    arrays = {}
+    arrays["points"] = numpy.asarray(mesh.points, dtype=_FLOAT_DTYPE)
+    arrays["element_vertex_indices"] = numpy.array(
+            [elements[i].vertex_indices for i in el_order], dtype=_INT_DTYPE)
+    if part_starts is not None:
+        arrays["part_starts"] = part_starts
+
+    element_tags = []
+    for tag, tag_els in mesh.tag_to_elements.iteritems():
+        arrays["element_tag_%d" % len(element_tags)] = numpy.sort(
+                new_el_numbers[
+                    numpy.array([el.id for el in tag_els], dtype=numpy.intp)])
+        element_tags.append(_encode_tag(tag))
+
+    boundary_tags = []
+    for tag, tag_el_faces in mesh.tag_to_boundary.iteritems():
+        arrays["boundary_tag_%d" % len(boundary_tags)] = \
+                el_faces_to_array(tag_el_faces)
+        boundary_tags.append(_encode_tag(tag))
+
+    # {{{ interfaces
+
+    # Interfaces are stored with the lower element number first, sorted by
+    # it. Periodic interfaces join faces with different vertices and are
+    # always stored, since they cannot be recovered from the vertices.
+
+    interfaces = []
+    periodic_interfaces = []
+    for (el_a, fn_a), (el_b, fn_b) in mesh.interfaces:
+        row = (new_el_numbers[el_a.id], fn_a, new_el_numbers[el_b.id], fn_b)
+        if set(el_a.faces[fn_a]) == set(el_b.faces[fn_b]):
+            interfaces.append(row)
+        else:
+            periodic_interfaces.append(row)
+
+    def interfaces_to_array(interfaces):
+        result = numpy.array(interfaces, dtype=numpy.intp).reshape(-1, 4)
+        swap = result[:, 0] > result[:, 2]
+        result[swap] = result[swap][:, [2, 3, 0, 1]]
+        return result[numpy.lexsort(result.T[::-1])]
+
+    if with_interfaces:
+        arrays["interfaces"] = interfaces_to_array(interfaces)
+    arrays["periodic_interfaces"] = interfaces_to_array(periodic_interfaces)
+
+    if partition is not None:
+        # faces on part boundaries, with the part on the other side
+        all_interfaces = numpy.array(interfaces + periodic_interfaces,
+                dtype=numpy.intp).reshape(-1, 4)
+        new_partition = partition[el_order]
+        part_a = new_partition[all_interfaces[:, 0]]
+        part_b = new_partition[all_interfaces[:, 2]]
+        crossing = part_a != part_b
+        part_boundary_faces = numpy.vstack([
+            numpy.column_stack([all_interfaces[crossing, :2], part_b[crossing]]),
+            numpy.column_stack([all_interfaces[crossing, 2:], part_a[crossing]]),
+            ])
+        arrays["part_boundary_faces"] = part_boundary_faces[
+                numpy.lexsort(part_boundary_faces.T[::-1])]
+
+    # }}}
+
+    # {{{ periodicity
+
+    face_vertex_count = mesh.dimensions
+    pof_items = mesh.periodic_opposite_faces.items()
+    arrays["periodic_faces"] = numpy.array(
+            [fvi for fvi, (opp_fvi, axis) in pof_items],
+            dtype=numpy.intp).reshape(-1, face_vertex_count)
+    arrays["periodic_opposite_faces"] = numpy.array(
+            [opp_fvi for fvi, (opp_fvi, axis) in pof_items],
+            dtype=numpy.intp).reshape(-1, face_vertex_count)
+    arrays["periodic_face_axes"] = numpy.array(
+            [axis for fvi, (opp_fvi, axis) in pof_items], dtype=numpy.intp)
+
+    arrays["periodic_vertices"] = numpy.array(
+            [(vi, opp_vi, axis)
+                for vi, opposites in mesh.periodic_opposite_vertices.iteritems()
+                for opp_vi, axis in opposites],
+            dtype=numpy.intp).reshape(-1, 3)
+
+    # }}}
+
+    _write_array_file(filename, MESH_FILE_MAGIC, {
+        "dimensions": mesh.dimensions,
+        "element_count": len(elements),
+        "element_tags": element_tags,
+        "boundary_tags": boundary_tags,
+        "periodicity": _encode_periodicity(mesh.periodicity),
+        "has_internal_boundaries": bool(
+            getattr(mesh, "has_internal_boundaries", False)),
+        }, arrays)
+
+# }}}
+
+
+
+
+# {{{ reading
+
+def read_mesh_file_header(filename):
+    """Return a tuple *(header, data_start)* for the mesh file *filename*,
+    where *header* is the decoded header dictionary and *data_start* is
+    the offset of the array data.
+    """
+    return _read_array_file_header(filename, MESH_FILE_MAGIC)
+
+
+
+
+class MeshArrays(Record):
+    """The contents of a mesh file written by :func:`save_mesh`, as arrays.
+    All index arrays refer to the elements and vertices contained in this
+    instance, which may be one part of the stored mesh.
+
+    .. attribute:: points
+    .. attribute:: element_vertex_indices
+    .. attribute:: element_numbers
+
+        The number of each element in the file.
+
+    .. attribute:: vertex_numbers
+
+        The number of each vertex in the file.
+
+    .. attribute:: element_tags
+
+        A dictionary mapping volume tags to arrays of element numbers.
+
+    .. attribute:: boundary_tags
+
+        A dictionary mapping boundary tags to arrays of shape *(n, 2)*
+        containing element and face numbers.
+
+    .. attribute:: interfaces
+
+        An array of shape *(n, 4)* containing *(element_a, face_a,
+        element_b, face_b)* for each pair of elements sharing a face, or
+        *None* if the file does not contain interfaces.
+
+    .. attribute:: periodic_interfaces
+
+        Like :attr:`interfaces`, for faces connected by periodicity.
+
+    .. attribute:: periodicity
+    .. attribute:: periodic_faces
+    .. attribute:: periodic_opposite_faces
+    .. attribute:: periodic_face_axes
+    .. attribute:: periodic_vertices
+
+        An array of shape *(n, 3)* containing *(vertex, opposite vertex,
+        axis)*.
+
+    .. attribute:: has_internal_boundaries
+    .. attribute:: part_starts
+
+        The first element number of each part, followed by the element
+        count, or *None* if the file was written without a partition.
+
+    .. attribute:: part_boundary_faces
+
+        An array of shape *(n, 3)* containing *(element, face, part)* for
+        each face shared with an element of a different part, or *None*
+        if the file was written without a partition.
+
+    The periodicity arrays always use the vertex numbers of the file.
+    """
+
+
+
+
+def load_mesh_arrays(filename, part=None):
+    """Map the mesh file *filename* into memory and return a
+    :class:`MeshArrays` instance.
+
+    If *part* is given, only the elements of that part (see
+    :func:`save_mesh`) and the vertices and tags belonging to them are
+    read, and element and vertex indices are renumbered accordingly.
+    Interfaces between elements of different parts are omitted.
+    """
+    header, data_start = read_mesh_file_header(filename)
+    array_info = header["arrays"]
+
+    def get_array(name):
+        return _map_array(filename, data_start, array_info[name])
+
+    def get_index_array(name):
+        return numpy.asarray(get_array(name), dtype=numpy.intp)
+
+    el_count = header["element_count"]
+    all_evi = get_array("element_vertex_indices")
+
+    if "part_starts" in array_info:
+        part_starts = get_index_array("part_starts")
+    else:
+        part_starts = None
+
+    if part is None:
+        el_start, el_stop = 0, el_count
+    else:
+        if part_starts is None:
+            raise ValueError("'%s' was written without a partition" % filename)
+        el_start, el_stop = part_starts[part], part_starts[part+1]
+
+    def get_element_slice(name):
+        """Return the rows of an array sorted by its first column that
+        refer to loaded elements, renumbered."""
+        ary = get_array(name)
+        if len(ary.shape) == 1:
+            first_column = ary
+        else:
+            first_column = ary[:, 0]
+
+        start, stop = numpy.searchsorted(first_column, [el_start, el_stop])
+        result = numpy.array(ary[start:stop], dtype=numpy.intp)
+        if len(ary.shape) == 1:
+            result -= el_start
+        else:
+            result[:, 0] -= el_start
+        return result
+
+    if part is None:
+        points = get_array("points")
+        element_vertex_indices = numpy.asarray(all_evi, dtype=numpy.intp)
+        vertex_numbers = numpy.arange(len(points), dtype=numpy.intp)
+    else:
+        global_evi = numpy.asarray(all_evi[el_start:el_stop], dtype=numpy.intp)
+        vertex_numbers, element_vertex_indices = numpy.unique(
+                global_evi, return_inverse=True)
+        element_vertex_indices = element_vertex_indices.reshape(
+                global_evi.shape)
+        points = get_array("points")[vertex_numbers]
+
+    def get_interfaces(name):
+        result = get_element_slice(name)
+        result[:, 2] -= el_start
+        return result[(result[:, 2] >= 0) & (result[:, 2] < el_stop-el_start)]
+
+    if "interfaces" in array_info:
+        interfaces = get_interfaces("interfaces")
+    else:
+        interfaces = None
+
+    if "part_boundary_faces" in array_info:
+        part_boundary_faces = get_element_slice("part_boundary_faces")
+    else:
+        part_boundary_faces = None
+
+    return MeshArrays(
+            points=points,
+            element_vertex_indices=element_vertex_indices,
+            element_numbers=numpy.arange(el_start, el_stop, dtype=numpy.intp),
+            vertex_numbers=vertex_numbers,
+            element_tags=dict(
+                (_decode_tag(tag), get_element_slice("element_tag_%d" % i))
+                for i, tag in enumerate(header["element_tags"])),
+            boundary_tags=dict(
+                (_decode_tag(tag), get_element_slice("boundary_tag_%d" % i))
+                for i, tag in enumerate(header["boundary_tags"])),
+            interfaces=interfaces,
+            periodic_interfaces=get_interfaces("periodic_interfaces"),
+            periodicity=_decode_periodicity(header["periodicity"]),
+            periodic_faces=get_index_array("periodic_faces"),
+            periodic_opposite_faces=get_index_array("periodic_opposite_faces"),
+            periodic_face_axes=get_index_array("periodic_face_axes"),
+            periodic_vertices=get_index_array("periodic_vertices"),
+            has_internal_boundaries=header["has_internal_boundaries"],
+            part_starts=part_starts,
+            part_boundary_faces=part_boundary_faces)
+
+
+
+
+def load_mesh(filename):
+    """Read a :class:`hedge.mesh.ConformalMesh` from the mesh file
+    *filename* written by :func:`save_mesh`.
+
+    The stored connectivity is used as is, so that, unless the file
+    lacks interfaces, no face matching takes place.
+    """
+    data = load_mesh_arrays(filename)
+
+    from hedge.mesh.element import Interval, Triangle, Tetrahedron
+    dim = data.element_vertex_indices.shape[1] - 1
+    try:
+        el_class = {1: Interval, 2: Triangle, 3: Tetrahedron}[dim]
+    except KeyError:
+        raise ValueError("%d-dimensional meshes are unsupported" % dim)
+
+    points = numpy.array(data.points, dtype=numpy.float64, order="C")
+    elements = [el_class(el_id, vertex_indices, points)
+            for el_id, vertex_indices in enumerate(
+                data.element_vertex_indices)]
+
+    def get_el_faces(el_faces):
+        return [(elements[el_nr], fn) for el_nr, fn in el_faces.tolist()]
+
+    interfaces = data.interfaces
+    if interfaces is None:
+        face_vertex_indices, interface_faces, boundary_faces = \
+                hmesh.find_face_connectivity(elements)
+        face_count = len(face_vertex_indices) // len(elements)
+
+        # faces tagged as internal boundaries are no interfaces
+        boundary_el_faces = data.boundary_tags.get(
+                hmesh.TAG_REALLY_ALL, numpy.empty((0, 2), dtype=numpy.intp))
+        is_boundary = numpy.zeros(len(face_vertex_indices), dtype=numpy.bool)
+        is_boundary[boundary_el_faces[:, 0]*face_count
+                + boundary_el_faces[:, 1]] = True
+        interface_faces = interface_faces[
+                ~is_boundary[interface_faces].any(axis=1)]
+
+        interfaces = numpy.column_stack([
+            interface_faces[:, 0] // face_count,
+            interface_faces[:, 0] % face_count,
+            interface_faces[:, 1] // face_count,
+            interface_faces[:, 1] % face_count])
+
+    interfaces = numpy.vstack([interfaces, data.periodic_interfaces])
+
+    periodic_opposite_faces = dict(
+            (tuple(fvi), (tuple(opp_fvi), axis))
+            for fvi, opp_fvi, axis in zip(
+                data.periodic_faces.tolist(),
+                data.periodic_opposite_faces.tolist(),
+                data.periodic_face_axes.tolist()))
+
+    periodic_opposite_vertices = {}
+    for vi, opp_vi, axis in data.periodic_vertices.tolist():
+        periodic_opposite_vertices.setdefault(vi, []).append((opp_vi, axis))
+
+    return hmesh.ConformalMesh(
+            points=points,
+            elements=elements,
+            interfaces=[
+                [(elements[el_a], fn_a), (elements[el_b], fn_b)]
+                for el_a, fn_a, el_b, fn_b in interfaces.tolist()],
+            tag_to_boundary=dict(
+                (tag, get_el_faces(el_faces))
+                for tag, el_faces in data.boundary_tags.iteritems()),
+            tag_to_elements=dict(
+                (tag, [elements[el_nr] for el_nr in el_nrs.tolist()])
+                for tag, el_nrs in data.element_tags.iteritems()),
+            periodicity=data.periodicity,
+            periodic_opposite_faces=periodic_opposite_faces,
+            periodic_opposite_vertices=periodic_opposite_vertices,
+            has_internal_boundaries=data.has_internal_boundaries)
+
+# }}}
+
+
+
+
+# {{{ partition files
+
+def save_partition_arrays(part_arrays, filename, **kwargs):
+    """Write the :class:`hedge.partition.PartitionArrays` instance
+    *part_arrays* to *filename*. The keyword arguments are stored in the
+    file header and must be encodable as JSON.
+    """
+    from hedge.partition import PartitionArrays
+
+    _write_array_file(filename, PARTITION_FILE_MAGIC, dict(kwargs,
+        part_nr=part_arrays.part_nr,
+        boundary_tags=[_encode_tag(tag) for tag in part_arrays.boundary_tags],
+        element_tags=[_encode_tag(tag) for tag in part_arrays.element_tags],
+        periodicity=_encode_periodicity(part_arrays.periodicity)),
+        dict((name, getattr(part_arrays, name))
+            for name, dtype in PartitionArrays.array_fields))
+
+
+
+
+def read_partition_file_header(filename):
+    """Return the header dictionary of the partition file *filename*
+    written by :func:`save_partition_arrays`, including its keyword
+    arguments.
+    """
+    header, data_start = _read_array_file_header(
+            filename, PARTITION_FILE_MAGIC)
+    return header
+
+
+
+
+def load_partition_arrays(filename):
+    """Read the :class:`hedge.partition.PartitionArrays` instance stored
+    in *filename* by :func:`save_partition_arrays`.
+    """
+    from hedge.partition import PartitionArrays
+
+    header, data_start = _read_array_file_header(
+            filename, PARTITION_FILE_MAGIC)
+
+    return PartitionArrays(
+            part_nr=header["part_nr"],
+            boundary_tags=[_decode_tag(tag) for tag in header["boundary_tags"]],
+            element_tags=[_decode_tag(tag) for tag in header["element_tags"]],
+            periodicity=_decode_periodicity(header["periodicity"]),
+            **dict(
+                (name, numpy.asarray(
+                    _map_array(filename, data_start, header["arrays"][name]),
+                    dtype=dtype))
+                for name, dtype in PartitionArrays.array_fields))
+
+# }}}
+
+
+
+
+# {{{ volume field files
+
+# A volume field file stores, for each element, its global number in
+# "element_numbers" and the index of its first node in "element_starts".
+# The nodal values are in "field", whose last axis runs over the nodes and
+# whose leading axes, if any, over the components of an object array.
+
+def get_volume_field_file_layout(element_count, node_count, field_shape,
+        dtype):
+    """Return a tuple *(prefix, data_start, array_info, data_size)*
+    describing a volume field file holding *node_count* values of type
+    *dtype* on *element_count* elements for each component of an object
+    array of shape *field_shape*. *prefix* is the string preceding the
+    array data, which starts at byte *data_start* and is *data_size* bytes
+    long. *array_info* maps array names to dictionaries with their
+    ``"offset"`` relative to *data_start*.
+
+    This allows writing the file in pieces, e.g. from several ranks.
+    """
+    array_info, data_size = _get_array_layout({
+        "element_numbers": (_INT_DTYPE, (element_count,)),
+        "element_starts": (_INT_DTYPE, (element_count,)),
+        "field": (dtype, tuple(field_shape) + (node_count,)),
+        })
+    prefix, data_start = _encode_array_file_prefix(
+            FIELD_FILE_MAGIC, {}, array_info)
+
+    return prefix, data_start, array_info, data_size
+
+
+
+
+def save_volume_field(discr, field, filename, element_numbers=None):
+    """Write the volume vector *field* of the discretization *discr*, or
+    an object array of them, to *filename*.
+
+    :param element_numbers: if not *None*, an array mapping element ids of
+      *discr* to the numbers under which their values are stored.
+
+    See :func:`hedge.backends.mpi.write_volume_field` for writing the
+    parts of a distributed field to one file.
+    """
+    from pytools.obj_array import log_shape
+    field_shape = log_shape(field)
+    if field_shape:
+        field = numpy.array([field[idx] for idx in numpy.ndindex(*field_shape)])
+        field = field.reshape(field_shape + (-1,))
+
+    el_ids, starts, stops = discr.volume_element_layout()
+    if element_numbers is not None:
+        el_ids = numpy.asarray(element_numbers)[el_ids]
+
+    _write_array_file(filename, FIELD_FILE_MAGIC, {}, {
+        "element_numbers": el_ids,
+        "element_starts": starts,
+        "field": field,
+        })
+
+
+
+
+def load_volume_field(filename, discr, element_numbers=None):
+    """Read a volume vector (or object array of them) for the
+    discretization *discr* from *filename*, as written by
+    :func:`save_volume_field` or
+    :func:`hedge.backends.mpi.write_volume_field`.
+
+    Only the values on the elements of *discr* are read, so each rank of a
+    parallel run may read its own part, passing the result of its
+    discretization's ``get_global_element_numbers()`` as
+    *element_numbers*. The partition need not be the one the file was
+    written with.
+
+    :param element_numbers: if not *None*, an array mapping element ids of
+      *discr* to the numbers under which their values are stored.
+    """
+    header, data_start = _read_array_file_header(filename, FIELD_FILE_MAGIC)
+    arrays = header["arrays"]
+
+    file_el_numbers = _map_array(filename, data_start,
+            arrays["element_numbers"])
+    file_el_starts = _map_array(filename, data_start, arrays["element_starts"])
+    file_field = _map_array(filename, data_start, arrays["field"])
+
+    el_ids, starts, stops = discr.volume_element_layout()
+    if element_numbers is not None:
+        el_numbers = numpy.asarray(element_numbers)[el_ids]
+    else:
+        el_numbers = el_ids
+
+    # find our elements in the file
+    file_order = numpy.argsort(file_el_numbers, kind="mergesort")
+    positions = file_order[numpy.minimum(
+        numpy.searchsorted(file_el_numbers, el_numbers, sorter=file_order),
+        len(file_order)-1)]
+    if (file_el_numbers[positions] != el_numbers).any():
+        raise ValueError("'%s' does not cover all elements of the "
+                "discretization" % filename)
+
+    from hedge.tools.indexing import expand_ranges
+    _, nodes = expand_ranges(starts, stops)
+    file_starts = file_el_starts[positions]
+    _, file_nodes = expand_ranges(file_starts, file_starts + stops - starts)
+
+    field_shape = file_field.shape[:-1]
+    values = numpy.empty(field_shape + (len(discr),), dtype=file_field.dtype)
+    values[..., nodes] = file_field[..., file_nodes]
+
+    if not field_shape:
+        return values
+
+    result = numpy.empty(field_shape, dtype=object)
+    for idx in numpy.ndindex(*field_shape):
+        result[idx] = values[idx]
+    return result
+
+# }}}
+
+
+
+
+# vim: fdm=marker
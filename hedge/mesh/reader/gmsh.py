@@ -386,8 +386,22 @@ def read_gmsh(filename, force_dimension=None, periodicity=None,
         tag_mapper=lambda tag: tag, boundary_tagger=None):
     """
     :param force_dimension: if not None, truncate point coordinates to this many dimensions.
+
+    Meshes of straight-sided elements are read by
+    :func:`hedge.mesh.reader.gmsh_array.read_gmsh_array`. Other meshes,
+    such as those with curved elements, are read element by element.
     """
 
+    from hedge.mesh.reader.gmsh_array import \
+            read_gmsh_array, UnsupportedGmshFileError
+    try:
+        return read_gmsh_array(filename, force_dimension=force_dimension,
+                periodicity=periodicity,
+                allow_internal_boundaries=allow_internal_boundaries,
+                tag_mapper=tag_mapper, boundary_tagger=boundary_tagger)
+    except UnsupportedGmshFileError:
+        pass
+
     mr = HedgeGmshMeshReceiver(force_dimension, tag_mapper)
     from meshpy.gmsh_reader import read_gmsh
     read_gmsh(mr, filename, force_dimension=force_dimension)
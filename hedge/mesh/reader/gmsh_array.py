@@ -0,0 +1,516 @@
+"""Array-based reader for Gmsh meshes."""
+
+from __future__ import division
+
+__copyright__ = "Copyright (C) 2009 Andreas Kloeckner"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import numpy as np
+from pytools import Record
+
+
+
+
+# {{{ element type information
+
+# gmsh element type number -> (dimensions, node count)
+GMSH_ELEMENT_TYPES = {
+        15: (0, 1),
+        1: (1, 2), 8: (1, 3), 26: (1, 4), 27: (1, 5), 28: (1, 6),
+        2: (2, 3), 9: (2, 6), 20: (2, 9), 21: (2, 10), 22: (2, 12),
+        23: (2, 15), 24: (2, 15), 25: (2, 21),
+        4: (3, 4), 11: (3, 10), 29: (3, 20), 30: (3, 35), 31: (3, 56),
+        }
+
+DEFAULT_CHUNK_SIZE = 1 << 24
+
+
+
+
+def _get_element_type_info(el_type):
+    try:
+        return GMSH_ELEMENT_TYPES[int(el_type)]
+    except KeyError:
+        raise UnsupportedGmshFileError(
+                "unsupported gmsh element type %d" % el_type)
+
+# }}}
+
+
+
+
+# {{{ data structures
+
+class GmshFileFormatError(RuntimeError):
+    pass
+
+
+
+
+class UnsupportedGmshFileError(NotImplementedError):
+    pass
+
+
+
+
+class GmshElementBlock(Record):
+    """All elements of one gmsh element type.
+
+    .. attribute:: element_type
+    .. attribute:: dimensions
+    .. attribute:: ids
+
+        The gmsh element numbers.
+
+    .. attribute:: physical_tags
+
+        The physical tag numbers, zero if none were given.
+
+    .. attribute:: elementary_tags
+
+        The elementary (geometrical) tag numbers, zero if none were given.
+
+    .. attribute:: node_ids
+
+        An integer array of shape *(n_elements, n_nodes)* of gmsh node numbers,
+        in gmsh node order, so that the vertices come first.
+    """
+
+
+
+
+class GmshMeshData(Record):
+    """The contents of a gmsh file, as arrays.
+
+    .. attribute:: node_ids
+
+        The gmsh node numbers.
+
+    .. attribute:: nodes
+
+        A float64 array of shape *(n_nodes, 3)* of node coordinates.
+
+    .. attribute:: physical_names
+
+        A dictionary mapping *(dimensions, physical tag number)* to names.
+
+    .. attribute:: element_blocks
+
+        A dictionary mapping gmsh element type numbers to
+        :class:`GmshElementBlock` instances.
+    """
+
+    def node_indices(self, node_ids):
+        """Map gmsh node numbers to indices into :attr:`nodes`, or -1
+        for numbers that do not occur in the file.
+        """
+        lookup = np.empty(self.node_ids.max()+1, dtype=np.intp)
+        lookup.fill(-1)
+        lookup[self.node_ids] = np.arange(len(self.node_ids), dtype=np.intp)
+
+        node_ids = np.asarray(node_ids, dtype=np.intp)
+        result = np.empty(node_ids.shape, dtype=np.intp)
+        result.fill(-1)
+        valid = (node_ids >= 0) & (node_ids < len(lookup))
+        result[valid] = lookup[node_ids[valid]]
+        return result
+
+# }}}
+
+
+
+
+# {{{ parser
+
+class _GmshParser(object):
+    def __init__(self, inf, chunk_size):
+        self.inf = inf
+        self.chunk_size = chunk_size
+        self.pending_lines = []
+
+        self.binary = False
+        self.endianness = "<"
+
+    # {{{ input
+
+    def readline(self):
+        if self.pending_lines:
+            return self.pending_lines.pop(0)
+        return self.inf.readline()
+
+    def read_line_chunks(self, count):
+        """Yield lists of lines, *count* lines in total, reading about
+        :attr:`chunk_size` bytes at a time.
+        """
+        while count:
+            lines = self.pending_lines or self.inf.readlines(self.chunk_size)
+            self.pending_lines = []
+            if not lines:
+                raise GmshFileFormatError("unexpected end of file")
+
+            if len(lines) > count:
+                self.pending_lines = lines[count:]
+                lines = lines[:count]
+
+            count -= len(lines)
+            yield lines
+
+    def read_binary(self, dtype, count):
+        dtype = np.dtype(dtype)
+        assert not self.pending_lines
+
+        chunk_count = max(1, self.chunk_size // dtype.itemsize)
+        chunks = []
+        while count:
+            this_count = min(count, chunk_count)
+            data = self.inf.read(this_count*dtype.itemsize)
+            if len(data) != this_count*dtype.itemsize:
+                raise GmshFileFormatError("unexpected end of file")
+            chunks.append(np.frombuffer(data, dtype=dtype))
+            count -= this_count
+
+        if not chunks:
+            return np.empty(0, dtype=dtype)
+        elif len(chunks) == 1:
+            return chunks[0]
+        else:
+            return np.concatenate(chunks)
+
+    def expect_end(self, section):
+        line = self.readline()
+        if self.binary and not line.strip():
+            # binary data is followed by a newline
+            line = self.readline()
+        if line.strip() != "$End"+section:
+            raise GmshFileFormatError("expected $End%s, got '%s'"
+                    % (section, line.strip()))
+
+    # }}}
+
+    def parse(self):
+        physical_names = {}
+        node_ids = nodes = None
+        element_blocks = {}
+
+        while True:
+            line = self.readline()
+            if not line:
+                break
+
+            section = line.strip()
+            if not section:
+                continue
+            if not section.startswith("$"):
+                raise GmshFileFormatError("expected section, got '%s'" % section)
+            section = section[1:]
+
+            if section == "MeshFormat":
+                self.parse_mesh_format()
+            elif section == "PhysicalNames":
+                for i in xrange(int(self.readline())):
+                    dim, nr, name = self.readline().split(None, 2)
+                    name = name.strip()
+                    if name.startswith('"') and name.endswith('"'):
+                        name = name[1:-1]
+                    physical_names[int(dim), int(nr)] = name
+            elif section == "Nodes":
+                node_ids, nodes = self.parse_nodes(int(self.readline()))
+            elif section == "Elements":
+                self.parse_elements(int(self.readline()), element_blocks)
+            else:
+                # skip unknown sections
+                while line and line.strip() != "$End"+section:
+                    line = self.readline()
+                continue
+
+            self.expect_end(section)
+
+        if nodes is None:
+            raise GmshFileFormatError("no $Nodes section found")
+
+        return GmshMeshData(
+                node_ids=node_ids,
+                nodes=nodes,
+                physical_names=physical_names,
+                element_blocks=dict(
+                    (el_type, GmshElementBlock(
+                        element_type=el_type,
+                        dimensions=_get_element_type_info(el_type)[0],
+                        ids=np.hstack([b[0] for b in blocks]),
+                        physical_tags=np.hstack([b[1] for b in blocks]),
+                        elementary_tags=np.hstack([b[2] for b in blocks]),
+                        node_ids=np.vstack([b[3] for b in blocks])))
+                    for el_type, blocks in element_blocks.iteritems()))
+
+    def parse_mesh_format(self):
+        version, file_type, data_size = self.readline().split()
+        if not version.startswith("2."):
+            raise UnsupportedGmshFileError(
+                    "unsupported gmsh file format version %s" % version)
+
+        self.binary = bool(int(file_type))
+        if self.binary:
+            if int(data_size) != 8:
+                raise UnsupportedGmshFileError(
+                        "unsupported floating point size %s" % data_size)
+
+            one = self.inf.read(4)
+            if np.frombuffer(one, dtype="<i4")[0] == 1:
+                self.endianness = "<"
+            elif np.frombuffer(one, dtype=">i4")[0] == 1:
+                self.endianness = ">"
+            else:
+                raise GmshFileFormatError("invalid endianness marker")
+
+    def parse_nodes(self, count):
+        if self.binary:
+            records = self.read_binary(
+                    [("id", self.endianness+"i4"),
+                        ("x", self.endianness+"f8", (3,))],
+                    count)
+            return (np.asarray(records["id"], dtype=np.intp),
+                    np.asarray(records["x"], dtype=np.float64))
+        else:
+            node_ids = []
+            nodes = []
+            for lines in self.read_line_chunks(count):
+                data = np.fromstring("".join(lines), sep=" ").reshape(-1, 4)
+                node_ids.append(np.asarray(data[:, 0], dtype=np.intp))
+                nodes.append(data[:, 1:])
+
+            if not nodes:
+                return np.empty(0, dtype=np.intp), np.empty((0, 3))
+            return np.hstack(node_ids), np.vstack(nodes)
+
+    def parse_elements(self, count, element_blocks):
+        def add_records(el_type, tag_count, records):
+            # records: (id, [tags...], nodes...)
+            el_count = len(records)
+
+            def get_tag(i):
+                if tag_count > i:
+                    return np.asarray(records[:, 1+i], dtype=np.intp)
+                else:
+                    return np.zeros(el_count, dtype=np.intp)
+
+            element_blocks.setdefault(int(el_type), []).append((
+                np.asarray(records[:, 0], dtype=np.intp),
+                get_tag(0), get_tag(1),
+                np.asarray(records[:, 1+tag_count:], dtype=np.intp)))
+
+        if self.binary:
+            int_type = self.endianness+"i4"
+            while count:
+                el_type, el_count, tag_count = [
+                        int(x) for x in self.read_binary(int_type, 3)]
+                node_count = _get_element_type_info(el_type)[1]
+                records = self.read_binary(
+                        int_type, el_count*(1+tag_count+node_count)) \
+                                .reshape(el_count, -1)
+                add_records(el_type, tag_count, records)
+                count -= el_count
+        else:
+            for lines in self.read_line_chunks(count):
+                data = np.fromstring("".join(lines), dtype=np.int64, sep=" ")
+
+                # Consecutive lines usually describe elements of the same
+                # type with the same number of tags. Find runs of them and
+                # turn each run into a 2D array.
+                pos = 0
+                while pos < len(data):
+                    el_type, tag_count = data[pos+1], data[pos+2]
+                    record_size = 3 + tag_count \
+                            + _get_element_type_info(el_type)[1]
+                    max_count = (len(data) - pos) // record_size
+                    if not max_count:
+                        raise GmshFileFormatError("truncated element record")
+
+                    records = data[pos:pos+max_count*record_size] \
+                            .reshape(max_count, record_size)
+                    mismatch, = np.where(
+                            (records[:, 1] != el_type)
+                            | (records[:, 2] != tag_count))
+                    if len(mismatch):
+                        records = records[:mismatch[0]]
+
+                    add_records(el_type, tag_count,
+                            np.delete(records, [1, 2], axis=1))
+                    pos += len(records)*record_size
+
+
+
+
+def parse_gmsh(filename, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Read the gmsh file (format version 2, ASCII or binary) *filename*
+    into a :class:`GmshMeshData` instance.
+
+    Node and element data are read about *chunk_size* bytes at a time
+    and converted to arrays without per-element Python work.
+    """
+    inf = open(filename, "rb")
+    try:
+        return _GmshParser(inf, chunk_size).parse()
+    finally:
+        inf.close()
+
+# }}}
+
+
+
+
+# {{{ mesh construction
+
+def build_mesh_from_gmsh_data(data, force_dimension=None, periodicity=None,
+        allow_internal_boundaries=False,
+        tag_mapper=lambda tag: tag, boundary_tagger=None):
+    """Build a :class:`hedge.mesh.ConformalMesh` from the
+    :class:`GmshMeshData` *data*.
+
+    The elements of the highest dimension in *data* become the mesh
+    elements, those one dimension lower supply the boundary tags.
+    Only straight-sided, first-order elements are supported.
+    """
+    if not data.element_blocks:
+        raise GmshFileFormatError("mesh contains no elements")
+
+    vol_dim = max(block.dimensions
+            for block in data.element_blocks.itervalues())
+    vol_blocks = [block for el_type, block in
+            sorted(data.element_blocks.iteritems())
+            if block.dimensions == vol_dim]
+    face_blocks = [block for el_type, block in
+            sorted(data.element_blocks.iteritems())
+            if block.dimensions == vol_dim-1]
+
+    for block in vol_blocks:
+        if block.node_ids.shape[1] != vol_dim+1:
+            raise UnsupportedGmshFileError(
+                    "high-order gmsh element type %d" % block.element_type)
+
+    def get_tag_masks(physical_tags, dim):
+        result = {}
+        for (tag_dim, tag_nr), name in data.physical_names.iteritems():
+            if tag_dim == dim:
+                mask = physical_tags == tag_nr
+                tag = tag_mapper(name)
+                if tag in result:
+                    result[tag] = result[tag] | mask
+                else:
+                    result[tag] = mask
+        return result
+
+    # {{{ vertices
+
+    vol_node_indices = data.node_indices(
+            np.vstack([block.node_ids for block in vol_blocks]))
+    if (vol_node_indices < 0).any():
+        raise GmshFileFormatError("element refers to nonexistent node")
+
+    used_nodes, element_vertex_indices = np.unique(
+            vol_node_indices, return_inverse=True)
+    element_vertex_indices = element_vertex_indices.reshape(
+            vol_node_indices.shape)
+
+    node_to_vertex = np.empty(len(data.nodes), dtype=np.intp)
+    node_to_vertex.fill(-1)
+    node_to_vertex[used_nodes] = np.arange(len(used_nodes), dtype=np.intp)
+
+    points = data.nodes[used_nodes]
+    if force_dimension is not None:
+        points = points[:, :force_dimension]
+    points = np.array(points, dtype=np.float64, order="C")
+
+    pt_dim = points.shape[-1]
+    if pt_dim != vol_dim:
+        from warnings import warn
+        warn("Found %d-dimensional mesh embedded in %d-dimensional space. "
+                "Hedge only supports meshes of zero codimension (for now). "
+                "Maybe you want to set force_dimension=%d?"
+                % (vol_dim, pt_dim, vol_dim))
+
+    # }}}
+
+    element_tags = get_tag_masks(
+            np.hstack([block.physical_tags for block in vol_blocks]),
+            vol_dim)
+
+    # {{{ face tags
+
+    face_tags = {}
+    if face_blocks:
+        face_node_indices = [
+                data.node_indices(block.node_ids[:, :vol_dim])
+                for block in face_blocks]
+        face_vertex_indices = np.vstack([
+                np.where(fni >= 0, node_to_vertex[fni], -1)
+                for fni in face_node_indices])
+        face_physical_tags = np.hstack(
+                [block.physical_tags for block in face_blocks])
+
+        # drop faces that are not part of the volume mesh
+        valid = (face_vertex_indices >= 0).all(axis=1)
+
+        for tag, mask in get_tag_masks(
+                face_physical_tags, vol_dim-1).iteritems():
+            face_tags[tag] = face_vertex_indices[mask & valid]
+
+    # }}}
+
+    from hedge.mesh import make_conformal_mesh_from_arrays
+    return make_conformal_mesh_from_arrays(
+            points, element_vertex_indices,
+            element_tags=element_tags,
+            face_tags=face_tags,
+            boundary_tagger=boundary_tagger,
+            periodicity=periodicity,
+            allow_internal_boundaries=allow_internal_boundaries)
+
+
+
+
+def read_gmsh_array(filename, force_dimension=None, periodicity=None,
+        allow_internal_boundaries=False,
+        tag_mapper=lambda tag: tag, boundary_tagger=None,
+        chunk_size=DEFAULT_CHUNK_SIZE):
+    """Read a mesh of straight-sided elements from the gmsh file *filename*
+    using :func:`parse_gmsh`. Arguments are as for
+    :func:`hedge.mesh.reader.gmsh.read_gmsh`, which uses this function
+    where possible.
+
+    Raises :exc:`UnsupportedGmshFileError` for files that need to be read
+    by :func:`hedge.mesh.reader.gmsh.read_gmsh`, such as those with
+    high-order elements.
+    """
+    return build_mesh_from_gmsh_data(
+            parse_gmsh(filename, chunk_size),
+            force_dimension=force_dimension,
+            periodicity=periodicity,
+            allow_internal_boundaries=allow_internal_boundaries,
+            tag_mapper=tag_mapper,
+            boundary_tagger=boundary_tagger)
+
+# }}}
+
+
+
+
+# vim: fdm=marker
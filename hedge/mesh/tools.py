@@ -24,6 +24,8 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+import numpy
+
 
 
 
@@ -79,3 +81,149 @@ def cuthill_mckee(graph):
         levelset = list(next_levelset)
 
     return old_numbers
+
+
+
+
+def reverse_cuthill_mckee(node_count, edges):
+    """Return a reverse Cuthill-McKee ordering of the graph with
+    *node_count* nodes and the edges given by the integer array *edges* of
+    shape *(n_edges, 2)*, as an array of old node numbers.
+
+    Unlike :func:`cuthill_mckee`, each level set is processed as a whole
+    using array operations.
+    """
+    from hedge.tools.indexing import expand_ranges
+
+    edges = numpy.asarray(edges, dtype=numpy.intp).reshape(-1, 2)
+    rows = numpy.hstack([edges[:, 0], edges[:, 1]])
+    columns = numpy.hstack([edges[:, 1], edges[:, 0]])
+    pair_keys = numpy.unique(rows*node_count + columns)
+    rows = pair_keys // node_count
+    columns = pair_keys % node_count
+
+    degrees = numpy.bincount(rows, minlength=node_count)
+    row_starts = numpy.zeros(node_count+1, dtype=numpy.intp)
+    row_starts[1:] = numpy.cumsum(degrees)
+
+    visited = numpy.zeros(node_count, dtype=numpy.bool)
+    # unvisited nodes by increasing degree, to find start nodes
+    start_candidates = numpy.argsort(degrees, kind="mergesort")
+    candidate_idx = 0
+
+    old_numbers = []
+    while candidate_idx < node_count:
+        start_node = start_candidates[candidate_idx]
+        candidate_idx += 1
+        if visited[start_node]:
+            continue
+
+        visited[start_node] = True
+        levelset = numpy.array([start_node], dtype=numpy.intp)
+
+        while len(levelset):
+            old_numbers.append(levelset)
+
+            parents, neighbor_idx = expand_ranges(
+                    row_starts[levelset], row_starts[levelset+1])
+            neighbors = columns[neighbor_idx]
+            unvisited = ~visited[neighbors]
+            parents = parents[unvisited]
+            neighbors = neighbors[unvisited]
+
+            # order by parent, then by degree; keep first occurrences
+            neighbors = neighbors[
+                    numpy.lexsort((degrees[neighbors], parents))]
+            _, first_idx = numpy.unique(neighbors, return_index=True)
+            levelset = neighbors[numpy.sort(first_idx)]
+            visited[levelset] = True
+
+    if not old_numbers:
+        return numpy.empty(0, dtype=numpy.intp)
+
+    return numpy.hstack(old_numbers)[::-1]
+
+
+
+
+def _quantize(points):
+    """Return a tuple *(coordinates, bits)*, where *coordinates* is a list
+    of integer arrays of *bits*-bit coordinates of *points* within their
+    bounding box."""
+    points = numpy.asarray(points, dtype=numpy.float64)
+    if len(points.shape) == 1:
+        points = points[:, numpy.newaxis]
+
+    # fit the resulting keys into 64 bits
+    bits = min(31, 63 // points.shape[1])
+
+    origin = numpy.min(points, axis=0)
+    extent = numpy.max(points, axis=0) - origin
+    extent[extent == 0] = 1
+
+    scale = (1 << bits) - 1
+    return [numpy.asarray(
+        numpy.floor((points[:, i] - origin[i]) / extent[i] * scale),
+        dtype=numpy.uint64)
+        for i in range(points.shape[1])], bits
+
+
+def _interleave_bits(coordinates, bits):
+    """Combine the bits of the *coordinates* into one key, most significant
+    bit first, taking each bit from *coordinates[0]* before the next
+    coordinate."""
+    one = numpy.uint64(1)
+    key = numpy.zeros(len(coordinates[0]), dtype=numpy.uint64)
+    for bit in range(bits-1, -1, -1):
+        for coordinate in coordinates:
+            key = (key << one) | ((coordinate >> numpy.uint64(bit)) & one)
+    return key
+
+
+def morton_keys(points):
+    """Return the positions of the rows of the *(n, d)* array *points* along
+    a Morton (Z-order) curve through their bounding box, as an array of
+    unsigned integers."""
+    coordinates, bits = _quantize(points)
+    return _interleave_bits(coordinates, bits)
+
+
+def hilbert_keys(points):
+    """Return the positions of the rows of the *(n, d)* array *points* along
+    a Hilbert curve through their bounding box, as an array of unsigned
+    integers.
+
+    Uses the transposition algorithm in J. Skilling, Programming the
+    Hilbert curve, AIP Conf. Proc. 707 (2004), applied to all points at
+    once.
+    """
+    x, bits = _quantize(points)
+    dim = len(x)
+    zero = numpy.uint64(0)
+
+    # inverse undo excess work
+    q = 1 << (bits-1)
+    while q > 1:
+        uq = numpy.uint64(q)
+        p = numpy.uint64(q-1)
+        for i in range(dim):
+            has_q = (x[i] & uq) != zero
+            t = numpy.where(has_q, zero, (x[0] ^ x[i]) & p)
+            new_x0 = numpy.where(has_q, x[0] ^ p, x[0] ^ t)
+            x[i] = x[i] ^ t
+            x[0] = new_x0
+        q >>= 1
+
+    # Gray encode
+    for i in range(1, dim):
+        x[i] = x[i] ^ x[i-1]
+    t = numpy.zeros(len(x[0]), dtype=numpy.uint64)
+    q = 1 << (bits-1)
+    while q > 1:
+        t = numpy.where((x[dim-1] & numpy.uint64(q)) != zero,
+                t ^ numpy.uint64(q-1), t)
+        q >>= 1
+    for i in range(dim):
+        x[i] = x[i] ^ t
+
+    return _interleave_bits(x, bits)
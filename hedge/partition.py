@@ -68,136 +68,778 @@ def partition_from_tags(mesh, tag_to_number):
 
 
 
+def _group_by(keys, values, key_count):
+    """Return a list of length *key_count* whose entry *i* contains the
+    rows of *values* for which *keys* is *i*, in their original order."""
+    order = numpy.argsort(keys, kind="mergesort")
+    starts = numpy.searchsorted(keys[order], numpy.arange(key_count+1))
+    sorted_values = values[order]
+    return [sorted_values[start:end]
+            for start, end in zip(starts[:-1], starts[1:])]
+
+
+
+
+def _orient_periodic_interfaces(periodic_interfaces, periodicity,
+        tag_to_faces, el_count, face_count):
+    """Return an array of shape *(n, 5)* containing *(minus_element,
+    minus_face, plus_element, plus_face, axis)* for each of the *(n, 4)*
+    *periodic_interfaces*. *tag_to_faces* maps boundary tags to *(n, 2)*
+    arrays of faces.
+    """
+    minus_axes = numpy.empty(el_count*face_count, dtype=numpy.intp)
+    minus_axes.fill(-1)
+    for axis, axis_periodicity in enumerate(periodicity or []):
+        if axis_periodicity is not None:
+            minus_faces = tag_to_faces.get(axis_periodicity[0])
+            if minus_faces is not None and len(minus_faces):
+                minus_axes[minus_faces[:, 0]*face_count
+                        + minus_faces[:, 1]] = axis
+
+    periodic_interfaces = numpy.array(periodic_interfaces, dtype=numpy.intp) \
+            .reshape(-1, 4)
+    axes_a = minus_axes[periodic_interfaces[:, 0]*face_count
+            + periodic_interfaces[:, 1]]
+    axes_b = minus_axes[periodic_interfaces[:, 2]*face_count
+            + periodic_interfaces[:, 3]]
+    b_is_minus = axes_a < 0
+    periodic_interfaces[b_is_minus] = \
+            periodic_interfaces[b_is_minus][:, [2, 3, 0, 1]]
+    return numpy.column_stack([periodic_interfaces,
+        numpy.where(b_is_minus, axes_b, axes_a)])
+
+
+
+
+class PartitionArrays(pytools.Record):
+    """The connectivity of one part of a partitioned mesh, as arrays.
+
+    Unless noted otherwise, element and vertex numbers are local to the
+    part.
+
+    .. attribute:: part_nr
+    .. attribute:: element_numbers
+
+        The global number of each element.
+
+    .. attribute:: vertex_numbers
+
+        The global number of each vertex.
+
+    .. attribute:: points
+    .. attribute:: element_vertex_indices
+    .. attribute:: interfaces
+
+        An array of shape *(n, 4)* containing *(element_a, face_a,
+        element_b, face_b)* for each pair of elements of the part sharing
+        a face.
+
+    .. attribute:: periodic_interfaces
+
+        An array of shape *(n, 5)* containing *(minus_element, minus_face,
+        plus_element, plus_face, axis)* for each pair of faces of the part
+        connected by periodicity.
+
+    .. attribute:: neighbor_faces
+
+        An array of shape *(n, 3)* containing *(element, face,
+        neighbor part)* for each face on the boundary with another part.
+
+    .. attribute:: boundary_faces
+
+        An array of shape *(n, 2)* of the remaining boundary faces.
+
+    .. attribute:: boundary_tags
+
+        A list of boundary tags.
+
+    .. attribute:: boundary_tag_faces
+
+        An array of shape *(n, 3)* containing *(element, face, tag number)*
+        for each tagged face, where *tag number* indexes
+        :attr:`boundary_tags`.
+
+    .. attribute:: element_tags
+
+        A list of volume tags.
+
+    .. attribute:: element_tag_elements
+
+        An array of shape *(n, 2)* containing *(element, tag number)* for
+        each tagged element.
+
+    .. attribute:: periodicity
+    .. attribute:: periodic_faces
+
+        An array of shape *(n, d)* of faces on periodic boundaries, given by
+        their global vertex numbers in element order. It includes at least
+        the faces of :attr:`periodic_interfaces` and the periodic faces on
+        both sides of the boundaries with other parts.
+
+    .. attribute:: periodic_opposite_faces
+
+        For each row of :attr:`periodic_faces`, the global numbers of the
+        corresponding vertices on the opposite face.
+
+    .. attribute:: periodic_face_axes
+    """
+
+    array_fields = [
+            ("element_numbers", numpy.int64),
+            ("vertex_numbers", numpy.int64),
+            ("points", numpy.float64),
+            ("element_vertex_indices", numpy.int64),
+            ("interfaces", numpy.int64),
+            ("periodic_interfaces", numpy.int64),
+            ("neighbor_faces", numpy.int64),
+            ("boundary_faces", numpy.int64),
+            ("boundary_tag_faces", numpy.int64),
+            ("element_tag_elements", numpy.int64),
+            ("periodic_faces", numpy.int64),
+            ("periodic_opposite_faces", numpy.int64),
+            ("periodic_face_axes", numpy.int64),
+            ]
+
+    info_fields = ["part_nr", "boundary_tags", "element_tags", "periodicity"]
+
+
+
+
+def get_partition_arrays(mesh, partition):
+    """Generate a :class:`PartitionArrays` instance for each part of
+    *mesh*, in order of increasing part number. See :func:`partition_mesh`
+    for the meaning of *partition*.
+
+    Elements are grouped by part in a single sort, and the connectivity
+    of each part is derived from that of *mesh*, without matching up
+    faces again.
+    """
+    from hedge.mesh import TAG_NONE, TAG_REALLY_ALL, MESH_CREATION_TAGS
+
+    partition = numpy.asarray(partition)
+    points = numpy.asarray(mesh.points, dtype=numpy.float64)
+    element_vertex_indices = numpy.array(
+            [el.vertex_indices for el in mesh.elements], dtype=numpy.intp)
+    el_count, vertex_count = element_vertex_indices.shape
+    face_count = vertex_count
+    el_class = type(mesh.elements[0])
+    local_face_vertices = numpy.array(
+            el_class.face_vertices(range(vertex_count)), dtype=numpy.intp)
+
+    # {{{ group elements by part
+
+    all_parts, part_numbers = numpy.unique(partition, return_inverse=True)
+    all_parts = all_parts.tolist()
+    part_count = len(all_parts)
+
+    el_order = numpy.argsort(part_numbers, kind="mergesort")
+    part_starts = numpy.searchsorted(
+            part_numbers[el_order], numpy.arange(part_count+1))
+
+    # number of each element within its part
+    global2local_element_array = numpy.empty(el_count, dtype=numpy.intp)
+    global2local_element_array[el_order] = (numpy.arange(el_count)
+            - numpy.repeat(part_starts[:-1], numpy.diff(part_starts)))
+
+    def get_faces_array(el_faces):
+        return numpy.array([(el.id, fn) for el, fn in el_faces],
+                dtype=numpy.intp).reshape(-1, 2)
+
+    def group_faces(faces):
+        """Group the rows of the *(n, k)* array *faces*, whose first
+        two columns describe a face, by part and translate the faces to
+        local element numbers."""
+        faces = faces.copy()
+        parts = part_numbers[faces[:, 0]]
+        faces[:, 0] = global2local_element_array[faces[:, 0]]
+        return _group_by(parts, faces, part_count)
+
+    def get_fvi(faces):
+        return element_vertex_indices[
+            faces[:, 0, numpy.newaxis], local_face_vertices[faces[:, 1]]]
+
+    # }}}
+
+    # {{{ tags
+
+    boundary_tags = [tag for tag in mesh.tag_to_boundary
+            if tag not in MESH_CREATION_TAGS and tag is not TAG_NONE]
+    tag_to_faces = dict((tag, get_faces_array(mesh.tag_to_boundary[tag]))
+            for tag in boundary_tags)
+
+    part_boundary_tag_faces = group_faces(numpy.vstack(
+        [numpy.empty((0, 3), dtype=numpy.intp)]
+        + [numpy.column_stack([tag_to_faces[tag],
+            numpy.tile(tag_nr, len(tag_to_faces[tag]))])
+            for tag_nr, tag in enumerate(boundary_tags)]))
+
+    part_boundary_faces = group_faces(get_faces_array(
+        mesh.tag_to_boundary.get(TAG_REALLY_ALL, [])))
+
+    element_tags = [tag for tag in mesh.tag_to_elements
+            if tag not in MESH_CREATION_TAGS and tag is not TAG_NONE]
+    part_element_tag_elements = group_faces(numpy.array(
+        [(el.id, tag_nr)
+            for tag_nr, tag in enumerate(element_tags)
+            for el in mesh.tag_to_elements[tag]],
+        dtype=numpy.intp).reshape(-1, 2))
+
+    # }}}
+
+    # {{{ sort interfaces into part-internal and part-crossing ones
+
+    interfaces = numpy.array(
+            [(el_a.id, fn_a, el_b.id, fn_b)
+                for (el_a, fn_a), (el_b, fn_b) in mesh.interfaces],
+            dtype=numpy.intp).reshape(-1, 4)
+
+    is_periodic = numpy.any(
+            numpy.sort(get_fvi(interfaces[:, :2]), axis=1)
+            != numpy.sort(get_fvi(interfaces[:, 2:]), axis=1), axis=1)
+
+    part_a = part_numbers[interfaces[:, 0]]
+    part_b = part_numbers[interfaces[:, 2]]
+    is_internal = part_a == part_b
+
+    part_interfaces = group_faces(interfaces[is_internal & ~is_periodic])
+    for ifaces in part_interfaces:
+        ifaces[:, 2] = global2local_element_array[ifaces[:, 2]]
+
+    periodic_interfaces = _orient_periodic_interfaces(
+            interfaces[is_internal & is_periodic], mesh.periodicity,
+            tag_to_faces, el_count, face_count)
+    part_periodic_interfaces = group_faces(periodic_interfaces)
+    for pifaces in part_periodic_interfaces:
+        pifaces[:, 2] = global2local_element_array[pifaces[:, 2]]
+
+    # faces on part boundaries, with the part on the other side
+    crossing = interfaces[~is_internal]
+    part_neighbor_faces = group_faces(numpy.vstack([
+        numpy.column_stack([crossing[:, :2], part_b[~is_internal]]),
+        numpy.column_stack([crossing[:, 2:], part_a[~is_internal]]),
+        ]))
+    for nb_faces in part_neighbor_faces:
+        nb_faces[:, 2] = numpy.array(all_parts, dtype=numpy.intp)[
+                nb_faces[:, 2]]
+
+    # Periodic faces of a part are those of its own periodic interfaces
+    # and of the periodic interfaces that connect it with other parts.
+    # The latter are needed on both sides.
+    periodic_el_faces = [periodic_interfaces[:, :2], periodic_interfaces[:, 2:4]]
+    periodic_parts = [part_numbers[periodic_interfaces[:, 0]]]*2
+
+    periodic_crossing = interfaces[~is_internal & is_periodic]
+    crossing_sides = [periodic_crossing[:, :2], periodic_crossing[:, 2:]]
+    for side in crossing_sides:
+        for faces in crossing_sides:
+            periodic_el_faces.append(faces)
+            periodic_parts.append(part_numbers[side[:, 0]])
+
+    part_periodic_fvi = _group_by(numpy.hstack(periodic_parts),
+            get_fvi(numpy.vstack(periodic_el_faces)), part_count)
+
+    # }}}
+
+    for part_index, part in enumerate(all_parts):
+        part_global_elements = el_order[
+                part_starts[part_index]:part_starts[part_index+1]]
+
+        # pick out this part's vertices
+        part_global_vertex_indices, part_local_evi = numpy.unique(
+                element_vertex_indices[part_global_elements],
+                return_inverse=True)
+
+        periodic_fvi = part_periodic_fvi[part_index]
+        periodic_opposite_fvi = []
+        periodic_face_axes = []
+        for fvi in periodic_fvi.tolist():
+            opp_fvi, axis = mesh.periodic_opposite_faces[tuple(fvi)]
+            periodic_opposite_fvi.append(opp_fvi)
+            periodic_face_axes.append(axis)
+
+        yield PartitionArrays(
+                part_nr=part,
+                element_numbers=part_global_elements,
+                vertex_numbers=part_global_vertex_indices,
+                points=points[part_global_vertex_indices],
+                element_vertex_indices=part_local_evi.reshape(
+                    -1, vertex_count),
+                interfaces=part_interfaces[part_index],
+                periodic_interfaces=part_periodic_interfaces[part_index],
+                neighbor_faces=part_neighbor_faces[part_index],
+                boundary_faces=part_boundary_faces[part_index],
+                boundary_tags=boundary_tags,
+                boundary_tag_faces=part_boundary_tag_faces[part_index],
+                element_tags=element_tags,
+                element_tag_elements=part_element_tag_elements[part_index],
+                periodicity=mesh.periodicity,
+                periodic_faces=periodic_fvi,
+                periodic_opposite_faces=numpy.array(periodic_opposite_fvi,
+                    dtype=numpy.intp).reshape(periodic_fvi.shape),
+                periodic_face_axes=numpy.array(periodic_face_axes,
+                    dtype=numpy.intp))
+
+
+
+
+def make_partition_data(part_arrays, part_bdry_tag_factory):
+    """Build the :class:`PartitionData` for the :class:`PartitionArrays`
+    instance *part_arrays*.
+    """
+    from hedge.mesh import (TAG_NO_BOUNDARY,
+            make_conformal_mesh_from_connectivity)
+
+    pa = part_arrays
+    element_vertex_indices = numpy.asarray(
+            pa.element_vertex_indices, dtype=numpy.intp)
+    vertex_count = element_vertex_indices.shape[1]
+    vertex_numbers = numpy.asarray(pa.vertex_numbers, dtype=numpy.intp)
+
+    global2local_elements = dict(
+            (gi, li) for li, gi in enumerate(pa.element_numbers.tolist()))
+    global2local_vertex_indices = dict(
+            (gvi, lvi) for lvi, gvi in enumerate(vertex_numbers.tolist()))
+
+    # {{{ tags
+
+    boundary_tags = {}
+    for tag_nr, faces in enumerate(_group_by(
+            pa.boundary_tag_faces[:, 2], pa.boundary_tag_faces[:, :2],
+            len(pa.boundary_tags))):
+        if len(faces):
+            boundary_tags[pa.boundary_tags[tag_nr]] = faces
+
+    neighbor_faces = pa.neighbor_faces
+    neighbor_parts = numpy.unique(neighbor_faces[:, 2]).tolist()
+    for nb_part in neighbor_parts:
+        boundary_tags[part_bdry_tag_factory(nb_part)] = \
+                neighbor_faces[neighbor_faces[:, 2] == nb_part, :2]
+
+    if len(neighbor_faces):
+        # keeps this part of the boundary from falling
+        # under TAG_ALL.
+        boundary_tags[TAG_NO_BOUNDARY] = numpy.vstack(
+                [boundary_tags.get(TAG_NO_BOUNDARY,
+                    numpy.empty((0, 2), dtype=numpy.intp)),
+                    neighbor_faces[:, :2]])
+
+    element_tags = {}
+    for tag_nr, el_nrs in enumerate(_group_by(
+            pa.element_tag_elements[:, 1], pa.element_tag_elements[:, 0],
+            len(pa.element_tags))):
+        if len(el_nrs):
+            element_tags[pa.element_tags[tag_nr]] = el_nrs
+
+    # }}}
+
+    # {{{ periodicity
+
+    global_periodic_opposite_faces = dict(
+            (tuple(fvi), (tuple(opp_fvi), axis))
+            for fvi, opp_fvi, axis in zip(
+                pa.periodic_faces.tolist(),
+                pa.periodic_opposite_faces.tolist(),
+                pa.periodic_face_axes.tolist()))
+
+    el_class_face_vertices = _get_local_face_vertices(vertex_count)
+    periodic_vertices = set()
+    for minus_el, minus_fn, plus_el, plus_fn, axis in \
+            pa.periodic_interfaces.tolist():
+        minus_fvi = vertex_numbers[element_vertex_indices[
+            minus_el, el_class_face_vertices[minus_fn]]]
+        plus_fvi, _ = global_periodic_opposite_faces[tuple(minus_fvi)]
+        periodic_vertices.update(
+                (global2local_vertex_indices[minus_vi],
+                    global2local_vertex_indices[plus_vi], axis)
+                for minus_vi, plus_vi in zip(minus_fvi, plus_fvi))
+
+    # }}}
+
+    part_mesh = make_conformal_mesh_from_connectivity(
+            pa.points,
+            element_vertex_indices,
+            pa.interfaces,
+            boundary_tags,
+            element_tags=element_tags,
+            periodicity=pa.periodicity,
+            periodic_interfaces=pa.periodic_interfaces,
+            periodic_vertices=numpy.array(sorted(periodic_vertices),
+                dtype=numpy.intp),
+            boundary_faces=numpy.vstack([
+                pa.boundary_faces, neighbor_faces[:, :2]]))
+
+    return PartitionData(
+            pa.part_nr,
+            part_mesh,
+            global2local_elements,
+            global2local_vertex_indices,
+            neighbor_parts,
+            global_periodic_opposite_faces,
+            part_boundary_tags=dict(
+                (nb_part, part_bdry_tag_factory(nb_part))
+                for nb_part in neighbor_parts),
+            tag_to_elements=part_mesh.tag_to_elements
+            )
+
+
+
+
+def _get_local_face_vertices(vertex_count):
+    from hedge.mesh.element import Interval, Triangle, Tetrahedron
+    el_class = {2: Interval, 3: Triangle, 4: Tetrahedron}[vertex_count]
+    return numpy.array(
+            el_class.face_vertices(range(vertex_count)), dtype=numpy.intp)
+
+
+
+
 def partition_mesh(mesh, partition, part_bdry_tag_factory):
     """*partition* is a mapping that maps element id to
     integers that represent different pieces of the mesh.
 
     For historical reasons, the values in partition are called
     'parts'.
+
+    See :func:`get_partition_arrays` and :func:`make_partition_data`.
     """
+    for part_arrays in get_partition_arrays(mesh, partition):
+        yield make_partition_data(part_arrays, part_bdry_tag_factory)
 
-    # Find parts to which we need to distribute.
-    all_parts = list(set(
-        partition[el.id] for el in mesh.elements))
-
-    # Prepare a mapping of elements to tags to speed up
-    # copy_el_tagger, below.
-    el2tags = {}
-    for tag, elements in mesh.tag_to_elements.iteritems():
-        if tag == hedge.mesh.TAG_ALL:
-            continue
-        for el in elements:
-            el2tags.setdefault(el, []).append(tag)
-
-    # prepare a mapping of (el, face_nr) to boundary_tags
-    # to speed up partition_bdry_tagger, below
-    elface2tags = {}
-    for tag, elfaces in mesh.tag_to_boundary.iteritems():
-        if tag == hedge.mesh.TAG_ALL:
-            continue
-        for el, fn in elfaces:
-            elface2tags.setdefault((el, fn), []).append(tag)
-
-    # prepare a mapping from (el, face_nr) to the part
-    # at the other end of the interface, if different from
-    # current. concurrently, prepare a mapping
-    #  part -> set([parts that border me])
-    elface2part = {}
-    neighboring_parts = {}
-
-    for elface1, elface2 in mesh.interfaces:
-        e1, f1 = elface1
-        e2, f2 = elface2
-        r1 = partition[e1.id]
-        r2 = partition[e2.id]
-
-        if r1 != r2:
-            neighboring_parts.setdefault(r1, set()).add(r2)
-            neighboring_parts.setdefault(r2, set()).add(r1)
-
-            elface2part[elface1] = r2
-            elface2part[elface2] = r1
-
-    # prepare a new mesh for each part and send it
-    from hedge.mesh import TAG_NO_BOUNDARY
-
-    for part in all_parts:
-        part_global_elements = [el
-                for el in mesh.elements
-                if partition[el.id] == part]
 
-        # pick out this part's vertices
-        from pytools import flatten
-        part_global_vertex_indices = set(flatten(
-                el.vertex_indices for el in part_global_elements))
 
-        part_local_vertices = [mesh.points[vi]
-                for vi in part_global_vertex_indices]
 
-        # find global-to-local maps
-        part_global2local_vertex_indices = dict(
-                (gvi, lvi) for lvi, gvi in
-                enumerate(part_global_vertex_indices))
+def get_partition_arrays_from_file(filename, part):
+    """Read the :class:`PartitionArrays` for *part* from the mesh file
+    *filename*, which must have been written by
+    :func:`hedge.mesh.native.save_mesh` with a partition. Only the part's
+    slice of the file is read, with the exception of the periodic faces.
 
-        part_global2local_elements = dict(
-                (el.id, i) for i, el in
-                enumerate(part_global_elements))
+    Global element numbers are the element numbers in the file.
+    """
+    from hedge.mesh import TAG_NONE, TAG_REALLY_ALL, MESH_CREATION_TAGS
+    from hedge.mesh.native import load_mesh_arrays
+
+    mesh_arrays = load_mesh_arrays(filename, part)
+    if mesh_arrays.part_boundary_faces is None:
+        raise ValueError("'%s' was written without a partition" % filename)
+    if mesh_arrays.interfaces is None:
+        raise ValueError("'%s' was written without interfaces" % filename)
+
+    element_vertex_indices = mesh_arrays.element_vertex_indices
+    el_count, vertex_count = element_vertex_indices.shape
+
+    boundary_tags = [tag for tag in mesh_arrays.boundary_tags
+            if tag not in MESH_CREATION_TAGS and tag is not TAG_NONE]
+    element_tags = [tag for tag in mesh_arrays.element_tags
+            if tag not in MESH_CREATION_TAGS and tag is not TAG_NONE]
+
+    def tag_rows(tag_to_rows, tags, width):
+        return numpy.vstack(
+                [numpy.empty((0, width), dtype=numpy.intp)]
+                + [numpy.column_stack([tag_to_rows[tag],
+                    numpy.tile(tag_nr, len(tag_to_rows[tag]))])
+                    for tag_nr, tag in enumerate(tags)])
+
+    return PartitionArrays(
+            part_nr=part,
+            element_numbers=mesh_arrays.element_numbers,
+            vertex_numbers=mesh_arrays.vertex_numbers,
+            points=numpy.asarray(mesh_arrays.points, dtype=numpy.float64),
+            element_vertex_indices=element_vertex_indices,
+            interfaces=mesh_arrays.interfaces,
+            periodic_interfaces=_orient_periodic_interfaces(
+                mesh_arrays.periodic_interfaces, mesh_arrays.periodicity,
+                mesh_arrays.boundary_tags, el_count, vertex_count),
+            neighbor_faces=mesh_arrays.part_boundary_faces,
+            boundary_faces=mesh_arrays.boundary_tags.get(TAG_REALLY_ALL,
+                numpy.empty((0, 2), dtype=numpy.intp)),
+            boundary_tags=boundary_tags,
+            boundary_tag_faces=tag_rows(
+                mesh_arrays.boundary_tags, boundary_tags, 3),
+            element_tags=element_tags,
+            element_tag_elements=tag_rows(
+                mesh_arrays.element_tags, element_tags, 2),
+            periodicity=mesh_arrays.periodicity,
+            periodic_faces=mesh_arrays.periodic_faces,
+            periodic_opposite_faces=mesh_arrays.periodic_opposite_faces,
+            periodic_face_axes=mesh_arrays.periodic_face_axes)
+
+
+
+
+# {{{ weighted partitioning
+
+# Metis takes integer vertex weights and sums them up in C ints.
+_METIS_WEIGHT_RESOLUTION = 1000
+_METIS_MAX_TOTAL_WEIGHT = 2**30
+
+
+def estimate_element_costs(mesh, tag_to_cost={}, cost_func=None):
+    """Return an array of the relative cost of advancing each element of
+    *mesh* by one step, for use as *element_weights* in
+    :func:`get_metis_partition`.
+
+    :param tag_to_cost: a mapping from element tags to cost factors. The
+      cost of an element is multiplied by the factors of all its tags,
+      e.g. to account for elements in a PML region or on an overintegrated
+      part of the mesh.
+    :param cost_func: if given, a function of an element returning its
+      cost before the tag factors are applied. Otherwise, that cost is 1.
+    """
+    if cost_func is None:
+        costs = numpy.ones(len(mesh.elements), dtype=numpy.float64)
+    else:
+        costs = numpy.array([cost_func(el) for el in mesh.elements],
+                dtype=numpy.float64)
 
-        # find elements in local numbering
-        part_local_elements = [
-                [part_global2local_vertex_indices[vi]
-                    for vi in el.vertex_indices]
-                for el in part_global_elements]
+    for tag, factor in tag_to_cost.iteritems():
+        tagged = numpy.array([el.id
+            for el in mesh.tag_to_elements.get(tag, [])], dtype=numpy.intp)
+        costs[tagged] *= factor
 
-        # make new local Mesh object, including
-        # boundary and element tagging
-        def partition_bdry_tagger(fvi, local_el, fn, all_vertices):
-            el = part_global_elements[local_el.id]
+    return costs
 
-            result = elface2tags.get((el, fn), [])
-            try:
-                opp_part = elface2part[el, fn]
-                result.append(part_bdry_tag_factory(opp_part))
 
-                # keeps this part of the boundary from falling
-                # under TAG_ALL.
-                result.append(TAG_NO_BOUNDARY)
+def _get_metis_weights(element_weights):
+    """Scale the nonnegative *element_weights* to positive integers that
+    Metis can sum up without overflow.
+    """
+    weights = numpy.asarray(element_weights, dtype=numpy.float64)
+    if len(weights) == 0:
+        return []
+    if (weights < 0).any() or not numpy.isfinite(weights).all():
+        raise ValueError("element weights must be finite and nonnegative")
+
+    max_weight = weights.max()
+    if max_weight == 0:
+        return [1]*len(weights)
+
+    scale = min(_METIS_WEIGHT_RESOLUTION/max_weight,
+            _METIS_MAX_TOTAL_WEIGHT/weights.sum())
+    return numpy.maximum(1, numpy.round(scale*weights)).astype(
+            numpy.int64).tolist()
+
+
+def get_metis_partition(mesh, part_count, element_weights=None):
+    """Return a list assigning one of *part_count* parts to each element
+    of *mesh*, as computed by :mod:`pymetis`.
+
+    :param element_weights: if given, a sequence of the nonnegative cost
+      of each element (see :func:`estimate_element_costs`), so that the
+      parts receive equal total cost rather than equal numbers of
+      elements. Only ratios of weights matter.
+    """
+    from pymetis import part_graph
 
-            except KeyError:
-                pass
+    if element_weights is None:
+        vweights = None
+    else:
+        if len(element_weights) != len(mesh.elements):
+            raise ValueError("need one weight per element")
+        vweights = _get_metis_weights(element_weights)
 
-            return result
+    dummy, partition = part_graph(part_count,
+            mesh.element_adjacency_graph(), vweights=vweights)
+    return partition
+
+
+def get_part_weights(partition, element_weights, part_count):
+    """Return an array of the total weight of each of the *part_count*
+    parts of *partition*.
+    """
+    return numpy.bincount(numpy.asarray(partition, dtype=numpy.intp),
+            weights=numpy.asarray(element_weights, dtype=numpy.float64),
+            minlength=part_count)
+
+# }}}
+
+
+
+
+# {{{ partition cache
+
+# A partition cache is a directory containing one partition file (see
+# hedge.mesh.native.save_partition_arrays) per part and an index in JSON
+# format, which is written last.
+
+PARTITION_CACHE_INDEX = "index.json"
+
+
+def get_mesh_digest(mesh, element_weights=None):
+    """Return a hex digest identifying the points, elements, tags and
+    periodicity of *mesh*. Used to key partition caches, so that changes
+    to the mesh lead to a cache miss instead of a stale partition.
+
+    If *element_weights* are given, they are covered by the digest as
+    well, since they change the partition.
+    """
+    from hashlib import sha1
+    checksum = sha1()
+
+    def update(ary):
+        ary = numpy.ascontiguousarray(ary)
+        checksum.update(str(ary.shape))
+        checksum.update(ary.tostring())
+
+    update(numpy.asarray(mesh.points, dtype=numpy.float64))
+    update(numpy.array([el.vertex_indices for el in mesh.elements],
+        dtype=numpy.int64))
+
+    for tag in sorted(mesh.tag_to_boundary, key=repr):
+        checksum.update(repr(tag))
+        update(numpy.array(sorted(
+            (el.id, fn) for el, fn in mesh.tag_to_boundary[tag]),
+            dtype=numpy.int64))
+
+    for tag in sorted(mesh.tag_to_elements, key=repr):
+        checksum.update(repr(tag))
+        update(numpy.array(sorted(
+            el.id for el in mesh.tag_to_elements[tag]), dtype=numpy.int64))
+
+    checksum.update(repr(mesh.periodicity))
+
+    if element_weights is not None:
+        checksum.update("element_weights")
+        update(numpy.asarray(element_weights, dtype=numpy.float64))
+
+    return checksum.hexdigest()
+
+
+def get_partition_cache_filename(cache_dir, part):
+    from os.path import join
+    return join(cache_dir, "part-%05d.hprt" % part)
+
+
+def save_partition_cache(cache_dir, mesh_digest, part_count,
+        all_part_arrays):
+    """Write each :class:`PartitionArrays` instance in the iterable
+    *all_part_arrays* to its own file in the directory *cache_dir*, which
+    is created if necessary. *mesh_digest* (see :func:`get_mesh_digest`)
+    and *part_count* are recorded to validate the cache when it is
+    loaded.
+    """
+    import os
+    import json
+    from os.path import join
+    from hedge.mesh.native import save_partition_arrays
+
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+
+    # invalidate the previous contents first
+    index_filename = join(cache_dir, PARTITION_CACHE_INDEX)
+    if os.path.exists(index_filename):
+        os.unlink(index_filename)
+
+    parts = []
+    for part_arrays in all_part_arrays:
+        if not 0 <= part_arrays.part_nr < part_count:
+            raise ValueError("part number %d out of range"
+                    % part_arrays.part_nr)
+
+        save_partition_arrays(part_arrays,
+                get_partition_cache_filename(cache_dir, part_arrays.part_nr),
+                mesh_digest=mesh_digest, part_count=part_count)
+        parts.append(part_arrays.part_nr)
+
+    outf = open(index_filename + ".tmp", "w")
+    try:
+        json.dump({
+            "mesh_digest": mesh_digest,
+            "part_count": part_count,
+            "parts": parts,
+            }, outf)
+    finally:
+        outf.close()
+
+    os.rename(index_filename + ".tmp", index_filename)
+
+
+def read_partition_cache_index(cache_dir):
+    """Return the index of the partition cache in *cache_dir*, a
+    dictionary with the keys ``"mesh_digest"``, ``"part_count"`` and
+    ``"parts"``, or *None* if *cache_dir* does not contain a complete
+    cache.
+    """
+    import json
+    from os.path import join
+
+    try:
+        inf = open(join(cache_dir, PARTITION_CACHE_INDEX), "r")
+    except IOError:
+        return None
+
+    try:
+        return json.load(inf)
+    finally:
+        inf.close()
+
+
+def partition_cache_matches(cache_dir, mesh_digest, part_count):
+    """Return whether *cache_dir* contains a complete partition cache
+    for the mesh with digest *mesh_digest* and *part_count* parts.
+    """
+    index = read_partition_cache_index(cache_dir)
+    return (index is not None
+            and index["mesh_digest"] == mesh_digest
+            and index["part_count"] == part_count)
+
+
+def load_partition_cache(cache_dir, part, mesh_digest=None,
+        part_count=None):
+    """Return the :class:`PartitionArrays` of *part* stored in the
+    partition cache in *cache_dir*, or *None* if the part contains no
+    elements.
+
+    :raises ValueError: if there is no complete cache in *cache_dir*, or
+      if *mesh_digest* or *part_count* are given and differ from the ones
+      the cache was written for.
+    """
+    from hedge.mesh.native import (read_partition_file_header,
+            load_partition_arrays)
+
+    index = read_partition_cache_index(cache_dir)
+    if index is None:
+        raise ValueError("'%s' does not contain a partition cache"
+                % cache_dir)
+    if part not in index["parts"]:
+        return None
+
+    filename = get_partition_cache_filename(cache_dir, part)
+    header = read_partition_file_header(filename)
+    for name, value in [
+            ("mesh_digest", mesh_digest),
+            ("part_count", part_count)]:
+        if header[name] != index[name]:
+            raise ValueError("'%s' does not belong to the partition cache "
+                    "in '%s'" % (filename, cache_dir))
+        if value is not None and header[name] != value:
+            raise ValueError("partition cache in '%s' does not match: "
+                    "%s is %r, expected %r"
+                    % (cache_dir, name, header[name], value))
+
+    return load_partition_arrays(filename)
+
+
+def partition_mesh_to_cache(mesh, cache_dir, part_count, partition=None,
+        element_weights=None):
+    """Partition *mesh* into *part_count* parts and store them in a
+    partition cache in *cache_dir*, to be loaded by
+    :meth:`hedge.backends.mpi.MPIRunContext.distribute_mesh`.
+
+    :param partition: if given, a sequence assigning a part number to
+      each element. Otherwise, the partition is computed by
+      :func:`get_metis_partition`, using *element_weights*. The cache
+      is only reused if the same weights are passed when loading it.
+    """
+    if partition is None:
+        partition = get_metis_partition(mesh, part_count, element_weights)
+
+    save_partition_cache(cache_dir,
+            get_mesh_digest(mesh, element_weights), part_count,
+            get_partition_arrays(mesh, partition))
 
-        def copy_el_tagger(local_el, all_vertices):
-            return el2tags.get(part_global_elements[local_el.id], [])
-
-        def is_partbdry_face((local_el, face_nr)):
-            return (part_global_elements[local_el.id], face_nr) in elface2part
-
-        from hedge.mesh import make_conformal_mesh
-        part_mesh = make_conformal_mesh(
-                part_local_vertices,
-                part_local_elements,
-                partition_bdry_tagger,
-                copy_el_tagger,
-                mesh.periodicity,
-                is_partbdry_face)
-
-        # assemble per-part data
-
-        my_nb_parts = neighboring_parts.get(part, [])
-        yield PartitionData(
-                part,
-                part_mesh,
-                part_global2local_elements,
-                part_global2local_vertex_indices,
-                my_nb_parts,
-                mesh.periodic_opposite_faces,
-                part_boundary_tags=dict(
-                    (nb_part, part_bdry_tag_factory(nb_part))
-                    for nb_part in my_nb_parts),
-                tag_to_elements = part_mesh.tag_to_elements
-                )
+# }}}
 
 
 
@@ -28,6 +28,7 @@ THE SOFTWARE.
 
 
 import numpy
+from pytools import memoize
 
 
 
@@ -327,6 +328,51 @@ class SimplexCubature(object):
 
 
 
+# {{{ tabulated cubature rules
+
+CUBATURE_TABLE_FILES = {
+        "xiao_gimbutas": "xg_quad_data.npz",
+        "cools": "cools_quad_data.npz",
+        }
+"""Maps a cubature family to its table file in the :mod:`hedge` package.
+
+Each file is a :mod:`numpy` ``.npz`` archive holding the arrays
+``d<dimension>_o<order>_points`` and ``d<dimension>_o<order>_weights``.
+Members of the archive are only read when they are first requested.
+"""
+
+
+@memoize
+def _get_cubature_table_file(family):
+    from os.path import join, dirname
+    import hedge
+    return numpy.load(join(dirname(hedge.__file__),
+        CUBATURE_TABLE_FILES[family]))
+
+
+@memoize
+def get_tabulated_cubature_rule(family, dimension, order):
+    """Return a tuple *(points, weights)* of the rule of *order* for
+    *dimension* from the tables of *family*. Raise :exc:`ValueError`
+    if no such rule is tabulated.
+    """
+    table_file = _get_cubature_table_file(family)
+
+    prefix = "d%d_o%d_" % (dimension, order)
+    try:
+        points = table_file[prefix+"points"]
+        weights = table_file[prefix+"weights"]
+    except KeyError:
+        raise ValueError("no %s cubature rule of order %d for dimension %d"
+                % (family, order, dimension))
+
+    return points, weights
+
+# }}}
+
+
+
+
 class XiaoGimbutasSimplexCubature(Quadrature):
     """
     See
@@ -338,20 +384,19 @@ class XiaoGimbutasSimplexCubature(Quadrature):
 
     def __init__(self, order, dimension):
         if dimension == 2:
-            from hedge.xg_quad_data import triangle_table as table
             from hedge.discretization.local import TriangleDiscretization
             e2u = TriangleDiscretization.equilateral_to_unit
         elif dimension == 3:
-            from hedge.xg_quad_data import tetrahedron_table as table
             from hedge.discretization.local import TetrahedronDiscretization
             e2u = TetrahedronDiscretization.equilateral_to_unit
         else:
             raise ValueError("invalid dimensionality for XG quadrature")
 
-        pts = numpy.array([
-                e2u(pt) for pt in table[order]["points"]
-                ])
-        wts = table[order]["weights"]*e2u.jacobian()
+        points, weights = get_tabulated_cubature_rule(
+                "xiao_gimbutas", dimension, order)
+
+        pts = numpy.array([e2u(pt) for pt in points])
+        wts = weights*e2u.jacobian()
 
         Quadrature.__init__(self, pts, wts)
 
@@ -363,12 +408,11 @@ class XiaoGimbutasSimplexCubature(Quadrature):
 
 class CoolsSimplexCubature(Quadrature):
     def __init__(self, order, dimension):
-        if dimension == 2:
-            from hedge.cools_quad_data import triangle_table as table
-        else:
-            raise ValueError("invalid dimensionality for XG quadrature")
+        if dimension != 2:
+            raise ValueError("invalid dimensionality for Cools quadrature")
 
-        Quadrature.__init__(self, table[order]["points"], table[order]["weights"])
+        Quadrature.__init__(self,
+                *get_tabulated_cubature_rule("cools", dimension, order))
 
         self.exact_to = order
 
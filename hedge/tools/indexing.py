@@ -173,3 +173,125 @@ def find_index_map_from_node_sets(old_nodes, new_nodes, threshold=1e-12):
 
 
 
+
+
+
+
+def expand_ranges(starts, stops):
+    """Given integer arrays *starts* and *stops* describing half-open ranges,
+    return a tuple *(owners, values)* that enumerates all integers in all
+    ranges, along with the number of the range they came from.
+    """
+    counts = stops - starts
+    owners = numpy.repeat(numpy.arange(len(starts)), counts)
+    values = (numpy.arange(counts.sum(), dtype=numpy.intp)
+            - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+            + numpy.repeat(starts, counts))
+    return owners, values
+
+
+
+
+def find_matching_points(points_a, points_b, threshold=1e-12):
+    """Return an integer array containing, for each row of the
+    *(n_a, d)* array *points_a*, the number of the lowest-numbered row of
+    the *(n_b, d)* array *points_b* less than *threshold* away from it
+    (in the Euclidean norm), or -1 if there is none.
+
+    Points are hashed into a uniform grid of cells no smaller than
+    *threshold*, so that only neighboring cells need to be compared.
+    """
+    points_a = numpy.asarray(points_a, dtype=numpy.float64)
+    points_b = numpy.asarray(points_b, dtype=numpy.float64)
+
+    result = numpy.empty(len(points_a), dtype=numpy.intp)
+    result.fill(len(points_b))
+
+    if len(points_a) and len(points_b):
+        dim = points_a.shape[1]
+        if dim == 0:
+            points_a = numpy.zeros((len(points_a), 1))
+            points_b = numpy.zeros((len(points_b), 1))
+            dim = 1
+
+        origin = numpy.minimum(
+                numpy.min(points_a, axis=0), numpy.min(points_b, axis=0))
+        extent = numpy.maximum(
+                numpy.max(points_a, axis=0), numpy.max(points_b, axis=0)) - origin
+
+        # aim for a handful of points per cell
+        cell_size = max(threshold,
+                numpy.max(extent) / (4*len(points_b)**(1/dim)))
+        grid_shape = numpy.asarray(
+                numpy.floor(extent / cell_size), dtype=numpy.intp) + 1
+
+        def get_cells(points):
+            return numpy.asarray(
+                    numpy.floor((points - origin) / cell_size), dtype=numpy.intp)
+
+        def get_keys(cells):
+            return numpy.ravel_multi_index(tuple(cells.T), grid_shape)
+
+        b_keys = get_keys(get_cells(points_b))
+        b_order = numpy.argsort(b_keys, kind="mergesort")
+        b_sorted_keys = b_keys[b_order]
+
+        a_cells = get_cells(points_a)
+
+        from pytools import generate_nonnegative_integer_tuples_below
+        for offset in generate_nonnegative_integer_tuples_below(3, dim):
+            nb_cells = a_cells + numpy.array(offset, dtype=numpy.intp) - 1
+            valid_nrs, = numpy.where(numpy.all(
+                (nb_cells >= 0) & (nb_cells < grid_shape), axis=1))
+            nb_keys = get_keys(nb_cells[valid_nrs])
+
+            owners, sorted_b_nrs = expand_ranges(
+                    numpy.searchsorted(b_sorted_keys, nb_keys, "left"),
+                    numpy.searchsorted(b_sorted_keys, nb_keys, "right"))
+            a_nrs = valid_nrs[owners]
+            b_nrs = b_order[sorted_b_nrs]
+
+            close = numpy.sum(
+                    (points_a[a_nrs] - points_b[b_nrs])**2, axis=1) \
+                            < threshold**2
+            numpy.minimum.at(result, a_nrs[close], b_nrs[close])
+
+    result[result == len(points_b)] = -1
+    return result
+
+
+
+
+def find_matching_rows(rows_a, rows_b):
+    """Return an integer array containing, for each row of the integer
+    array *rows_a*, the number of the lowest-numbered identical row of
+    *rows_b*, or -1 if there is none.
+
+    Both arrays are sorted together, so that identical rows end up next
+    to each other.
+    """
+    rows_a = numpy.asarray(rows_a, dtype=numpy.intp)
+    rows_b = numpy.asarray(rows_b, dtype=numpy.intp)
+
+    result = numpy.empty(len(rows_a), dtype=numpy.intp)
+    result.fill(-1)
+    if not len(rows_a) or not len(rows_b):
+        return result
+
+    both = numpy.vstack((rows_b, rows_a))
+    origin = numpy.arange(len(both), dtype=numpy.intp)
+
+    # rows of b sort before identical rows of a, lower numbers first
+    order = numpy.lexsort((origin,) + tuple(both.T[::-1]))
+    sorted_rows = both[order]
+
+    starts_group = numpy.ones(len(order), dtype=numpy.bool)
+    starts_group[1:] = numpy.any(sorted_rows[1:] != sorted_rows[:-1], axis=1)
+    group_starts = order[numpy.where(starts_group)[0]]
+    group_nrs = numpy.cumsum(starts_group) - 1
+
+    is_a = order >= len(rows_b)
+    first = group_starts[group_nrs[is_a]]
+    result[order[is_a] - len(rows_b)] = numpy.where(
+            first < len(rows_b), first, -1)
+    return result
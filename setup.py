@@ -177,6 +177,7 @@ def main():
             package_data={
                     "hedge": [
                         "include/hedge/*.hpp",
+                        "*.npz",
                         ]
                     },
 
@@ -876,6 +876,569 @@ def test_all_periodic_no_boundary():
 
 
 
+def test_batched_boundary_tagger():
+    """Check that sort-based face matching accounts for every face, and that
+    batched boundary taggers agree with per-face ones."""
+    from hedge.mesh import make_conformal_mesh_ext, TAG_ALL
+    from hedge.mesh.generator import make_regular_rect_mesh
+
+    ref_mesh = make_regular_rect_mesh(a=(-1, -1), b=(1, 1), n=(7, 5))
+    points = ref_mesh.points
+
+    def tagger(fvi, el, fn, all_v):
+        if abs(numpy.average([all_v[i][0] for i in fvi])) > 1-1e-10:
+            return ["x_end"]
+        else:
+            return []
+
+    class BatchedTagger:
+        supports_arrays = True
+
+        def __call__(self, fvi, el_ids, fns, all_v):
+            centers = numpy.average(all_v[fvi], axis=1)
+            return {"x_end": numpy.abs(centers[:, 0]) > 1-1e-10}
+
+    meshes = [make_conformal_mesh_ext(points, ref_mesh.elements, bt)
+            for bt in [tagger, BatchedTagger()]]
+
+    for mesh in meshes:
+        assert (2*len(mesh.interfaces) + len(mesh.tag_to_boundary[TAG_ALL])
+                == 3*len(mesh.elements))
+        assert len(mesh.tag_to_boundary["x_end"]) == 2*(5-1)
+
+    for tag in ["x_end", TAG_ALL]:
+        assert (set(meshes[0].tag_to_boundary[tag])
+                == set(meshes[1].tag_to_boundary[tag]))
+
+
+
+
+def test_periodic_vertex_matching():
+    """Check grid-hashed periodic vertex matching and the resulting
+    fully periodic mesh."""
+    from hedge.mesh import find_matching_vertices_along_axis, TAG_ALL
+
+    lattice_1d = numpy.linspace(-1, 1, 17)
+    minus_points = numpy.array([(-1, y, z)
+        for y in lattice_1d for z in lattice_1d])
+    perm = numpy.random.permutation(len(minus_points))
+    plus_points = minus_points[perm] + 1e-14
+    plus_points[:, 0] = 1
+
+    a_to_b, not_found = find_matching_vertices_along_axis(0,
+            minus_points[1:], plus_points,
+            range(1, len(minus_points)), range(len(minus_points)))
+    assert not not_found
+    for i, j in a_to_b.iteritems():
+        assert perm[j] == i
+
+    _, not_found = find_matching_vertices_along_axis(0,
+            minus_points, plus_points[1:],
+            range(len(minus_points)), range(1, len(minus_points)))
+    assert not_found == [perm[0]]
+
+    from hedge.mesh.generator import make_regular_rect_mesh
+    mesh = make_regular_rect_mesh(n=(6, 5), periodicity=(True, True))
+    assert not mesh.tag_to_boundary[TAG_ALL]
+    assert 2*len(mesh.interfaces) == 3*len(mesh.elements)
+
+
+
+
+def test_structured_generators():
+    """Check that connectivity emitted by the structured generators agrees
+    with generic face matching."""
+    from hedge.mesh import make_conformal_mesh_ext, TAG_ALL
+    from hedge.mesh.generator import (make_regular_rect_mesh,
+            make_centered_regular_rect_mesh, make_regular_box_mesh)
+
+    def face_key(el, fn):
+        return frozenset(el.face_vertices(el.vertex_indices)[fn])
+
+    def get_faces(mesh, tag):
+        return set(face_key(el, fn) for el, fn in mesh.tag_to_boundary[tag])
+
+    for mesh, periodicity in [
+            (make_regular_rect_mesh(n=(5, 4), periodicity=(True, False)),
+                (True, False)),
+            (make_centered_regular_rect_mesh(n=(4, 5),
+                periodicity=(False, True)), (False, True)),
+            (make_regular_box_mesh(n=(3, 4, 3),
+                periodicity=(True, False, True)), (True, False, True)),
+            ]:
+        dim = mesh.dimensions
+        axes = "xyz"[:dim]
+
+        def tagger(fvi, el, fn, all_v):
+            center = numpy.average([all_v[i] for i in fvi], axis=0)
+            for i, axis in enumerate(axes):
+                if abs(center[i]) < 1e-10:
+                    return ["minus_"+axis]
+                if abs(center[i]-1) < 1e-10:
+                    return ["plus_"+axis]
+
+        ref_mesh = make_conformal_mesh_ext(mesh.points, mesh.elements, tagger,
+                periodicity=[("minus_"+axis, "plus_"+axis) if per else None
+                    for axis, per in zip(axes, periodicity)])
+
+        def get_interfaces(mesh):
+            return set(frozenset((el.id, fn) for el, fn in itf)
+                    for itf in mesh.interfaces)
+
+        assert get_interfaces(mesh) == get_interfaces(ref_mesh)
+        for axis in axes:
+            for tag in ["minus_"+axis, "plus_"+axis]:
+                assert get_faces(mesh, tag) == get_faces(ref_mesh, tag)
+        assert get_faces(mesh, TAG_ALL) == get_faces(ref_mesh, TAG_ALL)
+        assert mesh.periodic_opposite_faces == ref_mesh.periodic_opposite_faces
+
+        for vi, opposites in ref_mesh.periodic_opposite_vertices.iteritems():
+            assert (sorted(mesh.periodic_opposite_vertices[vi])
+                    == sorted(opposites))
+
+
+
+
+def test_uniform_refinement():
+    """Check that uniform refinement preserves volume, tags and periodicity."""
+    from hedge.mesh import refine_uniformly, TAG_ALL
+    from hedge.mesh.generator import (make_regular_rect_mesh,
+            make_regular_box_mesh)
+
+    for mesh in [
+            make_regular_rect_mesh(n=(4, 3), periodicity=(True, False)),
+            make_regular_box_mesh(n=(3, 3, 4), periodicity=(False, True, True)),
+            ]:
+        dim = mesh.dimensions
+        levels = 2
+        fine_mesh = refine_uniformly(mesh, levels)
+
+        el_child_count = 2**(dim*levels)
+        face_child_count = 2**((dim-1)*levels)
+        assert len(fine_mesh.elements) == el_child_count*len(mesh.elements)
+
+        def volume(mesh):
+            return sum(abs(el.map.jacobian()) for el in mesh.elements)
+
+        assert abs(volume(fine_mesh) - volume(mesh)) < 1e-12
+
+        for tag, faces in mesh.tag_to_boundary.iteritems():
+            assert (len(fine_mesh.tag_to_boundary[tag])
+                    == face_child_count*len(faces))
+        assert (2*len(fine_mesh.interfaces)
+                + len(fine_mesh.tag_to_boundary[TAG_ALL])
+                == (dim+1)*len(fine_mesh.elements))
+        assert (len(fine_mesh.periodic_opposite_faces)
+                == face_child_count*len(mesh.periodic_opposite_faces))
+
+        # children are numbered consecutively and lie within their parent
+        for el in mesh.elements:
+            parent_vertices = mesh.points[el.vertex_indices]
+            for child in fine_mesh.elements[
+                    el.id*el_child_count:(el.id+1)*el_child_count]:
+                centroid = numpy.average(
+                        fine_mesh.points[child.vertex_indices], axis=0)
+                barycentric = la.solve(
+                        numpy.vstack([parent_vertices.T, numpy.ones(dim+1)]),
+                        numpy.hstack([centroid, 1]))
+                assert (barycentric > -1e-12).all()
+
+
+
+
+def test_partition_mesh():
+    """Check that part meshes carry the connectivity of the global mesh."""
+    from hedge.mesh import TAG_ALL, TAG_REALLY_ALL, TAG_RANK_BOUNDARY
+    from hedge.mesh.generator import make_regular_box_mesh
+    from hedge.partition import partition_mesh
+
+    mesh = make_regular_box_mesh(n=(5, 4, 4), periodicity=(True, False, True))
+    centroids = numpy.array([
+        numpy.average(mesh.points[el.vertex_indices], axis=0)
+        for el in mesh.elements])
+    partition = (centroids[:, 0] > 0.5) + 2*(centroids[:, 2] > 0.5)
+
+    parts = dict((part_data.part_nr, part_data)
+            for part_data in partition_mesh(mesh, partition, TAG_RANK_BOUNDARY))
+    assert sorted(parts) == range(4)
+
+    def global_faces(part_data, tag):
+        g2l_el = part_data.global2local_elements
+        l2g_el = dict((li, gi) for gi, li in g2l_el.iteritems())
+        return set((l2g_el[el.id], fn)
+                for el, fn in part_data.mesh.tag_to_boundary.get(tag, []))
+
+    el_count = 0
+    for part, part_data in parts.iteritems():
+        part_mesh = part_data.mesh
+        el_count += len(part_mesh.elements)
+
+        for el_nr, local_el_nr in part_data.global2local_elements.iteritems():
+            assert partition[el_nr] == part
+            assert (set(part_data.global2local_vertex_indices[vi]
+                for vi in mesh.elements[el_nr].vertex_indices)
+                == set(part_mesh.elements[local_el_nr].vertex_indices))
+
+        rank_bdry_count = 0
+        for nb_part in part_data.neighbor_parts:
+            my_faces = global_faces(part_data, TAG_RANK_BOUNDARY(nb_part))
+            nb_faces = global_faces(parts[nb_part], TAG_RANK_BOUNDARY(part))
+            assert len(my_faces) == len(nb_faces)
+            rank_bdry_count += len(my_faces)
+
+        assert (2*len(part_mesh.interfaces)
+                + len(part_mesh.tag_to_boundary[TAG_REALLY_ALL])
+                == 4*len(part_mesh.elements))
+        assert (len(part_mesh.tag_to_boundary[TAG_REALLY_ALL])
+                == len(part_mesh.tag_to_boundary[TAG_ALL]) + rank_bdry_count)
+
+        for tag in ["minus_y", "plus_y", TAG_ALL]:
+            assert global_faces(part_data, tag) == set(
+                    (el.id, fn) for el, fn in mesh.tag_to_boundary[tag]
+                    if partition[el.id] == part)
+
+    assert el_count == len(mesh.elements)
+
+
+
+
+def test_element_costs():
+    """Check the cost model and weight scaling used for partitioning."""
+    from hedge.mesh.generator import make_1d_mesh
+    from hedge.partition import (estimate_element_costs, get_part_weights,
+            _get_metis_weights)
+
+    def volume_tagger(el, all_v):
+        if all_v[el.vertex_indices[0]][0] >= 6:
+            return ["pml"]
+        else:
+            return []
+
+    mesh = make_1d_mesh(numpy.arange(11, dtype=numpy.float64),
+            volume_tagger=volume_tagger)
+
+    costs = estimate_element_costs(mesh, {"pml": 3})
+    assert (costs == [1]*6 + [3]*4).all()
+
+    costs = estimate_element_costs(mesh, {"pml": 3},
+            cost_func=lambda el: 1 + el.id % 2)
+    assert (costs == [1, 2, 1, 2, 1, 2, 3, 6, 3, 6]).all()
+
+    partition = [0]*7 + [1]*3
+    assert (get_part_weights(partition, costs, 3) == [12, 15, 0]).all()
+
+    weights = _get_metis_weights([0, 1e-9, 2, 4])
+    assert weights == [1, 1, 500, 1000]
+    assert sum(_get_metis_weights(numpy.ones(10**7))) <= 2**30
+    assert _get_metis_weights([0, 0]) == [1, 1]
+
+
+
+
+def test_gmsh_array_reader():
+    """Check that ASCII and binary gmsh files are read into the same mesh."""
+    from hedge.mesh.reader.gmsh_array import parse_gmsh, read_gmsh_array
+    from hedge.mesh import TAG_ALL
+    from tempfile import mkdtemp
+    from shutil import rmtree
+    from os.path import join
+
+    nodes = numpy.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0.]])
+    lines = numpy.array([[1, 2], [2, 3], [3, 4], [4, 1]])
+    triangles = numpy.array([[1, 2, 3], [1, 3, 4]])
+    line_tags = numpy.array([1, 2, 2, 2])
+
+    header = ("$PhysicalNames\n3\n1 1 \"bottom\"\n1 2 \"rest\"\n"
+            "2 3 \"domain\"\n$EndPhysicalNames\n")
+
+    ascii_msh = ("$MeshFormat\n2.2 0 8\n$EndMeshFormat\n" + header
+            + "$Nodes\n4\n"
+            + "".join("%d %r %r %r\n" % ((i+1,) + tuple(node))
+                for i, node in enumerate(nodes))
+            + "$EndNodes\n$Elements\n6\n"
+            + "".join("%d 1 2 %d 5 %d %d\n" % ((i+1, tag) + tuple(line))
+                for i, (line, tag) in enumerate(zip(lines, line_tags)))
+            + "".join("%d 2 2 3 7 %d %d %d\n" % ((i+5,) + tuple(tri))
+                for i, tri in enumerate(triangles))
+            + "$EndElements\n")
+
+    def to_bytes(ary, dtype="<i4"):
+        return numpy.asarray(ary, dtype=dtype).tostring()
+
+    node_records = numpy.zeros(4, dtype=[("id", "<i4"), ("x", "<f8", (3,))])
+    node_records["id"] = numpy.arange(1, 5)
+    node_records["x"] = nodes
+    binary_msh = ("$MeshFormat\n2.2 1 8\n" + to_bytes([1])
+            + "\n$EndMeshFormat\n" + header
+            + "$Nodes\n4\n" + node_records.tostring() + "\n$EndNodes\n"
+            + "$Elements\n6\n"
+            + to_bytes([1, 4, 2]) + to_bytes(numpy.column_stack(
+                [numpy.arange(1, 5), line_tags, [5]*4, lines]))
+            + to_bytes([2, 2, 2]) + to_bytes(numpy.column_stack(
+                [[5, 6], [3, 3], [7, 7], triangles]))
+            + "\n$EndElements\n")
+
+    tmpdir = mkdtemp()
+    try:
+        meshes = []
+        for name, contents in [("ascii.msh", ascii_msh),
+                ("binary.msh", binary_msh)]:
+            filename = join(tmpdir, name)
+            outf = open(filename, "wb")
+            outf.write(contents)
+            outf.close()
+
+            # tiny chunks exercise the chunk boundaries
+            data = parse_gmsh(filename, chunk_size=16)
+            assert (data.nodes == nodes).all()
+            assert (data.element_blocks[1].node_ids == lines).all()
+            assert (data.element_blocks[1].physical_tags == line_tags).all()
+            assert (data.element_blocks[2].node_ids == triangles).all()
+
+            meshes.append(read_gmsh_array(filename, force_dimension=2))
+    finally:
+        rmtree(tmpdir)
+
+    for mesh in meshes:
+        assert len(mesh.elements) == 2
+        assert len(mesh.tag_to_elements["domain"]) == 2
+        assert len(mesh.tag_to_boundary["bottom"]) == 1
+        assert len(mesh.tag_to_boundary["rest"]) == 3
+        assert len(mesh.tag_to_boundary[TAG_ALL]) == 4
+
+        el, fn = mesh.tag_to_boundary["bottom"][0]
+        assert set(mesh.points[list(el.faces[fn])][:, 1]) == set([0])
+
+
+
+
+def test_native_mesh_file():
+    """Check that meshes and their parts survive a round trip through
+    the native mesh file format."""
+    from hedge.mesh.generator import make_regular_rect_mesh
+    from hedge.mesh.native import save_mesh, load_mesh, load_mesh_arrays
+    from hedge.mesh import TAG_ALL
+    from tempfile import mkdtemp
+    from shutil import rmtree
+    from os.path import join
+
+    mesh = make_regular_rect_mesh(n=(6, 5), periodicity=(True, False))
+    el_count = len(mesh.elements)
+    partition = numpy.arange(el_count) % 3
+
+    def get_tag_summary(mesh):
+        return dict(
+                (tag, len(el_faces))
+                for tag, el_faces in mesh.tag_to_boundary.iteritems())
+
+    tmpdir = mkdtemp()
+    try:
+        for with_interfaces in [True, False]:
+            filename = join(tmpdir, "mesh.hmsh")
+            save_mesh(mesh, filename, partition=partition,
+                    with_interfaces=with_interfaces)
+
+            mesh2 = load_mesh(filename)
+            assert len(mesh2.elements) == el_count
+            assert len(mesh2.interfaces) == len(mesh.interfaces)
+            assert get_tag_summary(mesh2) == get_tag_summary(mesh)
+            assert mesh2.periodicity == mesh.periodicity
+            assert (mesh2.periodic_opposite_faces
+                    == mesh.periodic_opposite_faces)
+
+            face_sets = set(
+                    frozenset([frozenset(el_a.faces[fn_a]),
+                        frozenset(el_b.faces[fn_b])])
+                    for (el_a, fn_a), (el_b, fn_b) in mesh.interfaces)
+            assert face_sets == set(
+                    frozenset([frozenset(el_a.faces[fn_a]),
+                        frozenset(el_b.faces[fn_b])])
+                    for (el_a, fn_a), (el_b, fn_b) in mesh2.interfaces)
+
+            part_el_count = 0
+            for part in range(3):
+                data = load_mesh_arrays(filename, part=part)
+                global_els = [mesh.elements[i]
+                        for i in numpy.where(partition == part)[0]]
+                assert len(data.element_numbers) == len(global_els)
+                assert len(data.element_tags[TAG_ALL]) == len(global_els)
+
+                for el, vertex_indices in zip(global_els,
+                        data.element_vertex_indices):
+                    assert (data.vertex_numbers[vertex_indices]
+                            == el.vertex_indices).all()
+                    assert (data.points[vertex_indices]
+                            == mesh.points[el.vertex_indices]).all()
+
+                part_el_count += len(data.element_numbers)
+
+            assert part_el_count == el_count
+    finally:
+        rmtree(tmpdir)
+
+
+
+
+def test_partitioned_mesh_file():
+    """Check that parts read from a partitioned mesh file agree with
+    those produced by partitioning in memory."""
+    from tempfile import mkdtemp
+    from shutil import rmtree
+    from os.path import join
+    from hedge.mesh import TAG_RANK_BOUNDARY
+    from hedge.mesh.generator import make_regular_rect_mesh
+    from hedge.mesh.native import save_mesh
+    from hedge.partition import (partition_mesh,
+            get_partition_arrays_from_file, make_partition_data)
+
+    mesh = make_regular_rect_mesh(n=(7, 5), periodicity=(True, False))
+    partition = numpy.random.randint(0, 3, len(mesh.elements))
+    el_order = numpy.argsort(partition, kind="mergesort")
+
+    tmpdir = mkdtemp()
+    try:
+        filename = join(tmpdir, "mesh.hmsh")
+        save_mesh(mesh, filename, partition=partition)
+
+        for ref_data in partition_mesh(mesh, partition, TAG_RANK_BOUNDARY):
+            part_data = make_partition_data(
+                    get_partition_arrays_from_file(
+                        filename, ref_data.part_nr),
+                    TAG_RANK_BOUNDARY)
+
+            # file element numbers follow the partition
+            assert ref_data.global2local_elements == dict(
+                    (el_order[gi], li)
+                    for gi, li in part_data.global2local_elements.iteritems())
+            assert (ref_data.global2local_vertex_indices
+                    == part_data.global2local_vertex_indices)
+            assert (sorted(ref_data.neighbor_parts)
+                    == sorted(part_data.neighbor_parts))
+
+            def get_tagged_faces(mesh):
+                return dict((tag, set((el.id, fn) for el, fn in el_faces))
+                        for tag, el_faces in mesh.tag_to_boundary.iteritems())
+
+            assert (get_tagged_faces(ref_data.mesh)
+                    == get_tagged_faces(part_data.mesh))
+            assert (set(frozenset((el.id, fn) for el, fn in itf)
+                        for itf in ref_data.mesh.interfaces)
+                    == set(frozenset((el.id, fn) for el, fn in itf)
+                        for itf in part_data.mesh.interfaces))
+    finally:
+        rmtree(tmpdir)
+
+
+
+
+def test_partition_cache():
+    """Check that parts loaded from a partition cache agree with those
+    produced by partitioning in memory, and that stale caches are
+    detected."""
+    from tempfile import mkdtemp
+    from shutil import rmtree
+    from hedge.mesh import TAG_RANK_BOUNDARY
+    from hedge.mesh.generator import make_regular_rect_mesh
+    from hedge.partition import (get_partition_arrays, get_mesh_digest,
+            partition_mesh_to_cache, partition_cache_matches,
+            load_partition_cache, make_partition_data, PartitionArrays)
+
+    mesh = make_regular_rect_mesh(n=(7, 5), periodicity=(True, False))
+    partition = numpy.random.randint(0, 3, len(mesh.elements))
+    partition[partition == 1] = 2
+    mesh_digest = get_mesh_digest(mesh)
+
+    tmpdir = mkdtemp()
+    try:
+        assert not partition_cache_matches(tmpdir, mesh_digest, 4)
+        partition_mesh_to_cache(mesh, tmpdir, 4, partition)
+        assert partition_cache_matches(tmpdir, mesh_digest, 4)
+        assert not partition_cache_matches(tmpdir, mesh_digest, 3)
+
+        other_mesh = make_regular_rect_mesh(n=(7, 5))
+        assert get_mesh_digest(other_mesh) != mesh_digest
+        assert not partition_cache_matches(
+                tmpdir, get_mesh_digest(other_mesh), 4)
+
+        ref_parts = dict((part_arrays.part_nr, part_arrays)
+                for part_arrays in get_partition_arrays(mesh, partition))
+
+        for part in range(4):
+            part_arrays = load_partition_cache(tmpdir, part,
+                    mesh_digest=mesh_digest, part_count=4)
+            if part not in ref_parts:
+                assert part_arrays is None
+                continue
+
+            ref_arrays = ref_parts[part]
+            for name in PartitionArrays.info_fields:
+                assert getattr(part_arrays, name) == getattr(ref_arrays, name)
+            for name, dtype in PartitionArrays.array_fields:
+                assert (numpy.asarray(getattr(part_arrays, name))
+                        == getattr(ref_arrays, name)).all()
+
+            part_data = make_partition_data(part_arrays, TAG_RANK_BOUNDARY)
+            assert sorted(part_data.neighbor_parts) == sorted(
+                    set(ref_parts) - set([part]))
+
+        try:
+            load_partition_cache(tmpdir, 0, part_count=3)
+        except ValueError:
+            pass
+        else:
+            assert False, "mismatched part count not detected"
+    finally:
+        rmtree(tmpdir)
+
+
+
+
+def test_volume_field_file():
+    """Check that volume fields survive a round trip through a volume
+    field file, also into a discretization of a reordered mesh."""
+    from tempfile import mkdtemp
+    from shutil import rmtree
+    from os.path import join
+    from hedge.mesh.generator import make_regular_rect_mesh
+    from hedge.mesh.native import save_volume_field, load_volume_field
+    from hedge.backends.jit import Discretization
+    from hedge.tools import join_fields
+
+    mesh = make_regular_rect_mesh(n=(6, 5))
+    discr = Discretization(mesh, order=3)
+
+    def f(x, el):
+        return x[0] + 2*x[1]**2
+
+    u = discr.interpolate_volume_function(f)
+    field = join_fields(u, 2*u)
+
+    tmpdir = mkdtemp()
+    try:
+        filename = join(tmpdir, "field.hfld")
+        save_volume_field(discr, field, filename)
+
+        field2 = load_volume_field(filename, discr)
+        assert field2.shape == (2,)
+        for comp, comp2 in zip(field, field2):
+            assert (comp == comp2).all()
+
+        save_volume_field(discr, u, filename)
+        assert (load_volume_field(filename, discr) == u).all()
+
+        # element ids of a reordered mesh differ from the stored ones
+        el_order = numpy.random.permutation(len(mesh.elements))
+        reordered_discr = Discretization(mesh.reordered(el_order), order=3)
+        u_reordered = load_volume_field(filename, reordered_discr,
+                element_numbers=el_order)
+        assert la.norm(u_reordered
+                - reordered_discr.interpolate_volume_function(f)) < 1e-13
+    finally:
+        rmtree(tmpdir)
+
+
+
+
 def test_simp_cubature():
     """Check that Grundmann-Moeller cubature works as advertised"""
     from pytools import generate_nonnegative_integer_tuples_summing_to_at_most
@@ -901,6 +1464,73 @@ def test_simp_cubature():
 
 
 
+def test_tabulated_cubature():
+    """Check the tabulated Cools cubature rules and that missing rules are
+    reported."""
+    from pytools import generate_nonnegative_integer_tuples_summing_to_at_most
+    from hedge.quadrature import (
+            CoolsSimplexCubature, get_tabulated_cubature_rule)
+    from hedge.tools.mathematics import Monomial
+
+    for order in range(1, 6):
+        cub = CoolsSimplexCubature(order, 2)
+        for comb in generate_nonnegative_integer_tuples_summing_to_at_most(
+                cub.exact_to, 2):
+            f = Monomial(comb)
+            assert abs(cub(f) - f.simplex_integral()) < 1e-13
+
+    from pytest import raises
+    with raises(ValueError):
+        get_tabulated_cubature_rule("xiao_gimbutas", 3, 1000)
+
+
+
+
+def test_local_matrix_cache():
+    """Check that local matrices from the on-disk cache match freshly
+    computed ones, and that differing node sets are not confused."""
+    import os
+    from tempfile import mkdtemp
+    from shutil import rmtree
+    import hedge.discretization.local as local
+
+    def get_matrices(ldis):
+        qinfo = ldis.get_quadrature_info(2*ldis.order)
+        return (ldis.differentiation_matrices()
+                + [ldis.mass_matrix(), ldis.lifting_matrix(),
+                    qinfo.volume_up_interpolation_matrix(),
+                    qinfo.multi_face_mass_matrix()])
+
+    saved_cache = local._matrix_cache[:]
+    cache_dir = mkdtemp()
+    os.environ["HEDGE_MATRIX_CACHE_DIR"] = cache_dir
+    try:
+        local._matrix_cache[:] = [None]
+        ref_mats = get_matrices(local.TriangleDiscretization(3))
+
+        del local._matrix_cache[:]
+        assert local.get_matrix_cache() is not None
+
+        # first pass fills the cache, second pass reads from it
+        for i in range(2):
+            ldis = local.TriangleDiscretization(3)
+            for mat, ref_mat in zip(get_matrices(ldis), ref_mats):
+                assert la.norm(mat - ref_mat) < 1e-14
+
+            shuffles = ldis.get_face_index_shuffle_lookup_map()
+            assert set(shuffles) == set([(0, 1), (1, 0)])
+
+        assert (local.TriangleDiscretization(3).matrix_cache_key()
+                != local.TriangleDiscretization(
+                    3, fancy_node_ordering=True).matrix_cache_key())
+    finally:
+        del os.environ["HEDGE_MATRIX_CACHE_DIR"]
+        local._matrix_cache[:] = saved_cache
+        rmtree(cache_dir)
+
+
+
+
 def test_identify_affine_map():
     n = 5
     randn = numpy.random.randn
@@ -921,6 +1551,49 @@ def test_identify_affine_map():
         assert la.norm(b-amap2.vector) < 1e-12
 
 
+
+
+def test_pipelined_cg():
+    """Check that pipelined CG solves SPD systems like plain CG, with one
+    reduction per iteration."""
+    from hedge.backends import SerialRunContext
+    from hedge.iterative import (OperatorBase, DiagonalPreconditioner,
+            PipelinedCGStateContainer, parallel_cg)
+
+    class MatrixOperator(OperatorBase):
+        def __init__(self, matrix):
+            self.matrix = matrix
+
+        @property
+        def dtype(self):
+            return self.matrix.dtype
+
+        @property
+        def shape(self):
+            return self.matrix.shape
+
+        def __call__(self, operand):
+            return numpy.dot(self.matrix, operand)
+
+    n = 200
+    a = numpy.random.randn(n, n)
+    a = numpy.dot(a, a.T) + numpy.diag(numpy.linspace(1, 1000, n))
+    b = numpy.random.randn(n)
+    op = MatrixOperator(a)
+
+    for precon in [None, DiagonalPreconditioner(1/numpy.diag(a))]:
+        x = parallel_cg(SerialRunContext(), op, b, precon=precon,
+                tol=1e-10, pipelined=True)
+        assert la.norm(numpy.dot(a, x) - b) < 1e-8*la.norm(b)
+
+    cg = PipelinedCGStateContainer(op)
+    cg.reset(b)
+    reduction_count = cg.reduction_count
+    for i in range(10):
+        cg.one_iteration()
+    assert cg.reduction_count == reduction_count + 10
+
+
 if __name__ == "__main__":
     import sys
     if len(sys.argv) > 1:
@@ -1120,7 +1120,7 @@ def no_test_tri_mass_mat_gauss(self):
 
 def test_mesh_regrid():
     """Test that we are able to interpolate scalars and vectors between two
-    grids using a spatial binary tree."""
+    grids using a sparse regrid operator."""
 
     from math import pi, sin, cos
 
@@ -1163,6 +1163,10 @@ def test_mesh_regrid():
             out_vec = discr.get_regrid_values(
                 fields_vec,  discr2, dtype=None, use_btree=True, thresh=1e-7)
 
+            assert (discr.get_regrid_operator(discr2, thresh=1e-7)
+                    is discr.get_regrid_operator(discr2, thresh=1e-7))
+            assert out.dtype == discr2.default_scalar_type
+
             diff = u2 - out
             diff_vec = fields_vec2 - out_vec
 
@@ -1175,6 +1179,129 @@ def test_mesh_regrid():
     # FIXME: Add EOC test, too.
 
 
+
+def test_point_sampler():
+    """Test that batched point sampling agrees with per-point evaluation and
+    reproduces polynomials of the discretization's order."""
+
+    from hedge.backends import guess_run_context
+    rcon = guess_run_context()
+    from hedge.mesh.generator import make_centered_regular_rect_mesh
+
+    mesh = make_centered_regular_rect_mesh((-1, -1), (1, 1), n=(5, 4))
+    discr = rcon.make_discretization(mesh, order=3)
+
+    u = discr.interpolate_volume_function(
+            lambda x, el: x[0]**3 - 2*x[0]*x[1]**2 + x[1])
+
+    points = numpy.random.uniform(-1, 1, size=(300, 2))
+    for index in ["grid", "kdtree"]:
+        sampler = discr.get_point_sampler(points, thresh=1e-10, index=index)
+        values = sampler(u)
+        true_values = points[:, 0]**3 - 2*points[:, 0]*points[:, 1]**2 \
+                + points[:, 1]
+        assert la.norm(values - true_values, numpy.inf) < 1e-12
+
+        for i in range(0, len(points), 37):
+            pe = discr.get_point_evaluator(points[i], thresh=1e-10)
+            assert abs(pe(u) - values[i]) < 1e-12
+
+    from hedge.tools import join_fields
+    vec_values = sampler(join_fields(u, 2*u))
+    assert la.norm(vec_values[1] - 2*values) < 1e-12
+
+
+
+def test_array_function_interpolation():
+    """Test that interpolating functions that act on arrays of nodes agrees
+    with node-by-node interpolation, in the volume and on the boundary."""
+
+    from hedge.backends import guess_run_context
+    rcon = guess_run_context()
+    from hedge.mesh.generator import make_centered_regular_rect_mesh
+    from hedge.mesh import TAG_ALL
+    from hedge.discretization import ArrayFunction
+    from hedge.tools import join_fields
+
+    mesh = make_centered_regular_rect_mesh((-1, -1), (1, 1), n=(4, 3))
+    discr = rcon.make_discretization(mesh, order=3)
+
+    def f(x, el):
+        return numpy.sin(x[0])*x[1] + 0.1*el.id
+
+    def f_vec(x, el):
+        return join_fields(x[0]*x[1], 1)
+
+    class VectorFunction:
+        shape = (2,)
+
+        def __call__(self, x, el):
+            return f_vec(x, el)
+
+    def f_ary(x, el_ids):
+        return numpy.sin(x[0])*x[1] + 0.1*el_ids
+
+    for f_node, f_array in [
+            (f, ArrayFunction(f_ary)),
+            (VectorFunction(), ArrayFunction(f_vec, shape=(2,))),
+            ]:
+        ref = discr.interpolate_volume_function(f_node)
+        result = discr.interpolate_volume_function(f_array)
+        assert discr.norm(ref - result) < 1e-13
+
+    bdry_ref = discr.interpolate_boundary_function(
+            lambda x, el: x[0]**2, TAG_ALL)
+    bdry_result = discr.interpolate_boundary_function(
+            ArrayFunction(lambda x, el_ids: x[0]**2), TAG_ALL)
+    assert la.norm(bdry_ref - bdry_result) < 1e-13
+    assert (len(discr.boundary_node_element_ids(TAG_ALL))
+            == len(discr.get_boundary(TAG_ALL).nodes))
+
+
+
+def test_element_order():
+    """Test that element reorderings yield valid permutations and leave
+    operator results unchanged."""
+
+    from hedge.backends import guess_run_context
+    rcon = guess_run_context()
+    from hedge.mesh.generator import make_regular_rect_mesh
+    from hedge.mesh.tools import reverse_cuthill_mckee
+    from hedge.models.advection import StrongAdvectionOperator
+
+    # a shuffled path has bandwidth one under RCM
+    n = 100
+    path = numpy.random.permutation(n)
+    old_numbers = reverse_cuthill_mckee(n,
+            numpy.column_stack([path[:-1], path[1:]]))
+    new_numbers = numpy.empty(n, dtype=numpy.intp)
+    new_numbers[old_numbers] = numpy.arange(n)
+    assert (numpy.sort(old_numbers) == numpy.arange(n)).all()
+    assert (abs(new_numbers[path[1:]] - new_numbers[path[:-1]]) == 1).all()
+
+    mesh = make_regular_rect_mesh(n=(9, 7), periodicity=(True, True))
+    op = StrongAdvectionOperator(numpy.array([1, 0.5]), flux_type="upwind")
+
+    ref_norm = None
+    for element_order in [None, "cuthill", "rcm", "morton", "hilbert"]:
+        if element_order is not None:
+            old_numbers = mesh.get_reorder_oldnumbers(element_order)
+            assert (numpy.sort(old_numbers)
+                    == numpy.arange(len(mesh.elements))).all()
+
+        discr = rcon.make_discretization(mesh, order=3,
+                element_order=element_order)
+        u = discr.interpolate_volume_function(
+                lambda x, el: numpy.sin(numpy.pi*x[0])*numpy.cos(numpy.pi*x[1]))
+        rhs_norm = discr.norm(op.bind(discr)(0, u))
+
+        if ref_norm is None:
+            ref_norm = rhs_norm
+        else:
+            assert abs(rhs_norm - ref_norm) < 1e-10*ref_norm
+
+
+
 if __name__ == "__main__":
     import sys
     if len(sys.argv) > 1:
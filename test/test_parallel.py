@@ -56,7 +56,7 @@ def my_ball_mesh(boundary_tagger):
 
 
 def run_convergence_test_advec(dtype, flux_type, random_partition, mesh_gen,
-        debug_output=False):
+        debug_output=False, rcon=None):
     """Test whether 2/3D advection actually converges"""
 
     from hedge.timestep import RK4TimeStepper
@@ -65,8 +65,9 @@ def run_convergence_test_advec(dtype, flux_type, random_partition, mesh_gen,
     from hedge.data import TimeDependentGivenFunction
     from hedge.visualization import SiloVisualizer
 
-    from hedge.backends import guess_run_context
-    rcon = guess_run_context(["mpi"])
+    if rcon is None:
+        from hedge.backends import guess_run_context
+        rcon = guess_run_context(["mpi"])
 
     # note: x component must remain zero because x-periodicity is used
     v = np.array([0.0, 0.9, 0.3])
@@ -175,6 +176,329 @@ def test_hedge_parallel(dtype, flux_type, random_partition, mesh_gen):
                 (dtype, flux_type, random_partition, mesh_gen))
 
 
+def run_volume_field_gather_test(filename):
+    """Check that gathered and collectively written volume fields agree
+    with their serial counterparts."""
+    from hedge.backends import guess_run_context
+    from hedge.backends.jit import Discretization
+    from hedge.backends.mpi import reassemble_volume_field, write_volume_field
+    from hedge.mesh.native import load_volume_field
+    from hedge.tools import join_fields
+
+    rcon = guess_run_context(["mpi"])
+
+    mesh = my_box_mesh(lambda vertices, el, face_nr, points: [])
+    if rcon.is_head_rank:
+        from random import choice
+        partition = [choice(rcon.ranks) for el in mesh.elements]
+        mesh_data = rcon.distribute_mesh(mesh, partition)
+    else:
+        mesh_data = rcon.receive_mesh()
+
+    discr = rcon.make_discretization(mesh_data, order=3)
+
+    def f(x, el):
+        return x[0] + 2*x[1]**2
+
+    u = discr.interpolate_volume_function(f)
+
+    if rcon.is_head_rank:
+        global_discr = Discretization(mesh, order=3, run_context=rcon)
+        u_global = global_discr.interpolate_volume_function(f)
+    else:
+        global_discr = None
+
+    for i in range(2):
+        u_gathered = reassemble_volume_field(rcon, global_discr, discr, u)
+        if rcon.is_head_rank:
+            assert la.norm(u_gathered - u_global) < 1e-13
+        else:
+            assert u_gathered is None
+
+    write_volume_field(rcon, discr, join_fields(u, 2*u), filename)
+    rcon.communicator.Barrier()
+
+    field = load_volume_field(filename, discr,
+            element_numbers=discr.get_global_element_numbers())
+    assert la.norm(field[0] - u) < 1e-13
+    assert la.norm(field[1] - 2*u) < 1e-13
+
+    if rcon.is_head_rank:
+        field = load_volume_field(filename, global_discr)
+        assert la.norm(field[1] - 2*u_global) < 1e-13
+
+
+def test_volume_field_gather():
+    from tempfile import mkdtemp
+    from shutil import rmtree
+    from os.path import join
+    from pytools.mpi import run_with_mpi_ranks
+
+    tmpdir = mkdtemp()
+    try:
+        run_with_mpi_ranks(__file__, 3, run_volume_field_gather_test,
+                (join(tmpdir, "field.hfld"),))
+    finally:
+        rmtree(tmpdir)
+
+
+def run_rebalance_test(filename):
+    """Check that rebalancing moves elements off a slow rank and carries
+    volume fields over to the new partition."""
+    from hedge.backends import guess_run_context
+    from hedge.backends.mpi import rebalance
+    from hedge.tools import join_fields
+
+    rcon = guess_run_context(["mpi"])
+
+    mesh = my_box_mesh(lambda vertices, el, face_nr, points: [])
+    if rcon.is_head_rank:
+        mesh_data = rcon.distribute_mesh(mesh)
+    else:
+        mesh_data = rcon.receive_mesh()
+
+    def make_discretization(mesh_data):
+        return rcon.make_discretization(mesh_data, order=3)
+
+    def f(x, el):
+        return x[0] + 2*x[1]**2
+
+    discr = make_discretization(mesh_data)
+    u = discr.interpolate_volume_function(f)
+    el_count = len(discr.get_global_element_numbers())
+
+    # a balanced run is left alone
+    assert rebalance(rcon, mesh, discr, u, 1.0, filename,
+            make_discretization) is None
+
+    # rank 0 pretends to be four times slower
+    rank_time = 4.0 if rcon.rank == 0 else 1.0
+    discr, fields = rebalance(rcon, mesh, discr, join_fields(u, 2*u),
+            rank_time, filename, make_discretization)
+
+    u_new = discr.interpolate_volume_function(f)
+    assert la.norm(fields[0] - u_new) < 1e-13
+    assert la.norm(fields[1] - 2*u_new) < 1e-13
+
+    new_el_count = len(discr.get_global_element_numbers())
+    if rcon.rank == 0:
+        assert new_el_count < el_count
+    assert rcon.communicator.allreduce(new_el_count) == len(mesh.elements)
+
+
+def test_rebalance():
+    from tempfile import mkdtemp
+    from shutil import rmtree
+    from os.path import join
+    from pytools.mpi import run_with_mpi_ranks
+
+    tmpdir = mkdtemp()
+    try:
+        run_with_mpi_ranks(__file__, 3, run_rebalance_test,
+                (join(tmpdir, "checkpoint.hfld"),))
+    finally:
+        rmtree(tmpdir)
+
+
+def run_pipelined_cg_test():
+    """Solve a system distributed over all ranks by pipelined CG and check
+    that the ranks agree on the iteration and reduction counts."""
+    from hedge.backends import guess_run_context
+    from hedge.iterative import (OperatorBase, DiagonalPreconditioner,
+            PipelinedCGStateContainer)
+
+    rcon = guess_run_context(["mpi"])
+    comm = rcon.communicator
+
+    # Each rank holds a diagonal block of an SPD matrix. The solution is
+    # local, but the CG coefficients depend on all blocks.
+    rng = np.random.RandomState(rcon.rank)
+    n = 50 + 10*rcon.rank
+    a = rng.randn(n, n)
+    a = np.dot(a, a.T) + np.diag(np.linspace(1, 100*(rcon.rank+1), n))
+    b = rng.randn(n)
+
+    class BlockOperator(OperatorBase):
+        dtype = np.float64
+        shape = (n, n)
+
+        def __call__(self, operand):
+            return np.dot(a, operand)
+
+    cg = PipelinedCGStateContainer(BlockOperator(),
+            DiagonalPreconditioner(1/np.diag(a)), communicator=comm)
+    cg.reset(b)
+
+    iterations = []
+    x = cg.run(max_iterations=1000, tol=1e-10,
+            debug_callback=lambda what, it, *args: iterations.append(it))
+
+    assert la.norm(np.dot(a, x) - b) < 1e-8*la.norm(b)
+
+    all_counts = comm.allgather((len(iterations), cg.reduction_count))
+    assert all_counts == [all_counts[0]]*len(all_counts)
+
+
+def test_pipelined_cg():
+    from pytools.mpi import run_with_mpi_ranks
+    run_with_mpi_ranks(__file__, 3, run_pipelined_cg_test, ())
+
+
+@pytest.mark.parametrize("flux_type", StrongAdvectionOperator.flux_types)
+@pytest.mark.parametrize("random_partition", [True, False])
+def test_hedge_shared_memory(flux_type, random_partition):
+    from hedge.backends.shm import run_with_processes
+    run_with_processes(
+            lambda rcon: run_convergence_test_advec(np.float64, flux_type,
+                random_partition, my_box_mesh, rcon=rcon),
+            2)
+
+
+def test_hedge_hybrid_threads():
+    from hedge.backends import CPURunContext
+    from hedge.backends.shm import run_with_processes
+    run_with_processes(
+            lambda rcon: run_convergence_test_advec(np.float64, "upwind",
+                False, my_box_mesh, rcon=rcon),
+            2, serial_context=CPURunContext(thread_count=2))
+
+
+def test_shared_memory_communication():
+    from hedge.backends.shm import run_with_processes
+
+    def communicate(rcon):
+        rank_count = len(rcon.ranks)
+        rcon.send(rcon.rank, (rcon.rank+1) % rank_count, "ring")
+        received = rcon.recv((rcon.rank-1) % rank_count, "ring")
+        rcon.barrier()
+        return received
+
+    assert run_with_processes(communicate, 3) == [2, 0, 1]
+
+
+def run_rank_data_refinement(rcon, mesh, partition, levels):
+    """Refine this rank's part of *mesh*, check its elements against the
+    globally refined mesh and build a discretization on it. Return the
+    global vertex numbers, rank-boundary and periodic faces for the
+    checks that need all ranks."""
+    from hedge.mesh import refine_uniformly, TAG_RANK_BOUNDARY
+
+    if rcon.is_head_rank:
+        rank_data = rcon.distribute_mesh(mesh, partition)
+    else:
+        rank_data = rcon.receive_mesh()
+
+    fine_data = rank_data.refined_uniformly(rcon, levels)
+    fine_mesh = refine_uniformly(mesh, levels)
+    local_mesh = fine_data.mesh
+
+    for gi, li in fine_data.global2local_elements.iteritems():
+        assert la.norm(
+                local_mesh.points[local_mesh.elements[li].vertex_indices]
+                - fine_mesh.points[fine_mesh.elements[gi].vertex_indices]
+                ) < 1e-12
+
+    local2global = dict((lvi, gvi) for gvi, lvi
+            in fine_data.global2local_vertex_indices.iteritems())
+    vertex_points = dict((gvi, tuple(local_mesh.points[lvi]))
+            for gvi, lvi in fine_data.global2local_vertex_indices.iteritems())
+
+    rank_faces = {}
+    for nb_rank in fine_data.neighbor_ranks:
+        rank_faces[nb_rank] = set(
+                frozenset(local2global[lvi] for lvi in el.faces[face_nr])
+                for el, face_nr in local_mesh.tag_to_boundary[
+                    TAG_RANK_BOUNDARY(nb_rank)])
+
+    # matches faces across ranks and checks their node coordinates
+    rcon.make_discretization(fine_data, order=2, debug=["parallel_setup"])
+
+    return (len(fine_data.global2local_elements), vertex_points,
+            rank_faces, fine_data.global_periodic_opposite_faces)
+
+
+@pytest.mark.parametrize("mesh_gen", ["rect", "box"])
+def test_rank_data_refinement(mesh_gen):
+    from hedge.backends.shm import run_with_processes
+    from hedge.mesh import refine_uniformly
+    from hedge.mesh.generator import (make_regular_rect_mesh,
+            make_regular_box_mesh)
+
+    if mesh_gen == "rect":
+        mesh = make_regular_rect_mesh(n=(6, 5), periodicity=(True, False))
+    else:
+        mesh = make_regular_box_mesh(n=(4, 3, 3),
+                periodicity=(True, False, True))
+
+    levels = 2
+    rank_count = 3
+    # scattered, so that periodic face pairs are split across ranks
+    partition = np.random.RandomState(17).randint(
+            0, rank_count, len(mesh.elements))
+
+    results = run_with_processes(
+            lambda rcon: run_rank_data_refinement(
+                rcon, mesh, partition, levels),
+            rank_count)
+
+    fine_mesh = refine_uniformly(mesh, levels)
+    assert sum(el_count for el_count, vp, rf, pf in results) \
+            == len(fine_mesh.elements)
+
+    # all ranks agree on the vertex numbers, which are contiguous
+    vertex_points = {}
+    for el_count, rank_vertex_points, rf, pf in results:
+        for gvi, point in rank_vertex_points.iteritems():
+            assert vertex_points.setdefault(gvi, point) == point
+    assert sorted(vertex_points) == range(len(fine_mesh.points))
+    assert len(set(vertex_points.itervalues())) == len(vertex_points)
+
+    def get_points(face):
+        return np.array([vertex_points[gvi] for gvi in face])
+
+    for rank, (el_count, vp, rank_faces, periodic_faces) in \
+            enumerate(results):
+        for face, (opposite, axis) in periodic_faces.iteritems():
+            shift = get_points(opposite) - get_points(face)
+            assert (abs(shift[:, axis]) > 1e-12).all()
+            shift[:, axis] = 0
+            assert la.norm(shift) < 1e-12
+
+        # faces on either side of a rank boundary match, possibly
+        # through periodicity
+        for nb_rank, faces in rank_faces.iteritems():
+            nb_faces = results[nb_rank][2][rank]
+            assert len(faces) == len(nb_faces)
+            for face in faces:
+                if face not in nb_faces:
+                    opposite, axis = periodic_faces[tuple(face)]
+                    assert frozenset(opposite) in nb_faces
+
+
+def test_shared_memory_reduction_capacity():
+    from hedge.backends.shm import run_with_processes
+    from hedge.optemplate.operators import NodalSum
+
+    def reduce_complex(rcon):
+        from hedge.mesh.generator import make_rect_mesh
+        if rcon.is_head_rank:
+            mesh_data = rcon.distribute_mesh(make_rect_mesh(max_area=0.1))
+        else:
+            mesh_data = rcon.receive_mesh()
+        discr = rcon.make_discretization(mesh_data, order=1)
+
+        try:
+            discr.reduce_values([NodalSum()], [1j])
+        except ValueError:
+            return True
+        else:
+            return False
+
+    # one complex value takes two slots
+    assert run_with_processes(reduce_complex, 2,
+            reduction_capacity=1) == [True, True]
+
+
 if __name__ == "__main__":
     import sys
     from pytools.mpi import check_for_mpi_relaunch